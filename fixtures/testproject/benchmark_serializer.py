@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for query_model row serialization on the fixture Post model.
+Run from project root: uv run python fixtures/testproject/benchmark_serializer.py
+
+Compares the original per-row serializer (field introspection and type
+dispatch for every row) with the compiled serializer plan, and the size and
+encoding time of a 1000-row response in the "rows" and "columns" formats.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add testproject to path
+testproject_path = Path(__file__).parent
+sys.path.insert(0, str(testproject_path))
+
+# Set up Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "testproject.settings")
+
+import django
+
+django.setup()
+
+from blog.models import Post
+
+from django_ai_boost.server_fastmcp import compile_row_serializer, encode_columns
+
+ROWS = 30_000
+ROUNDS = 5
+RESPONSE_ROWS = 1000
+
+
+def serialize_per_row(obj, model):
+    """The serializer query_model used before plans were compiled."""
+    obj_dict = {}
+    for field in model._meta.get_fields():
+        if field.many_to_many or field.one_to_many:
+            continue
+
+        field_name = field.name
+        try:
+            value = getattr(obj, field_name)
+
+            if value is None:
+                obj_dict[field_name] = None
+            elif hasattr(field, "related_model") and field.related_model:
+                obj_dict[field_name] = value.pk if value else None
+                obj_dict[f"{field_name}_str"] = str(value) if value else None
+            elif isinstance(value, (str, int, float, bool)):
+                obj_dict[field_name] = value
+            else:
+                obj_dict[field_name] = str(value)
+        except Exception:
+            continue
+
+    return obj_dict
+
+
+def rows_per_second(serialize, objects):
+    """Best rows per second over several rounds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        for obj in objects:
+            serialize(obj)
+        best = min(best, time.perf_counter() - started)
+    return len(objects) / best
+
+
+def best_seconds(function):
+    """Best wall time of a call over several rounds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    posts = list(Post.objects.select_related("author", "category"))
+    if not posts:
+        print("No posts found; run fixtures/testproject/populate_db.py first.")
+        return
+
+    # Reuse the loaded instances so only serialization is measured
+    objects = (posts * (ROWS // len(posts) + 1))[:ROWS]
+    plan = compile_row_serializer(Post, None, None)
+    assert plan.serialize(posts[0]) == serialize_per_row(posts[0], Post)
+
+    before = rows_per_second(lambda obj: serialize_per_row(obj, Post), objects)
+    after = rows_per_second(plan.serialize, objects)
+
+    print(f"Serializing {ROWS} Post rows (best of {ROUNDS} rounds)")
+    print(f"  per-row introspection: {before:>12,.0f} rows/s")
+    print(f"  compiled plan:         {after:>12,.0f} rows/s")
+    print(f"  speedup:               {after / before:>12.1f}x")
+
+    # Response encoding: serialize, encode and dump RESPONSE_ROWS rows
+    response_objects = objects[:RESPONSE_ROWS]
+
+    def rows_response():
+        return json.dumps([plan.serialize(obj) for obj in response_objects])
+
+    def columns_response():
+        return json.dumps(
+            encode_columns(
+                plan, [plan.serialize_values(obj) for obj in response_objects]
+            )
+        )
+
+    rows_seconds = best_seconds(rows_response)
+    columns_seconds = best_seconds(columns_response)
+    rows_size = len(rows_response())
+    columns_size = len(columns_response())
+
+    print(f"Encoding a {RESPONSE_ROWS}-row response (best of {ROUNDS} rounds)")
+    print(f"  rows:    {rows_size:>10,} bytes {rows_seconds * 1000:>8.2f} ms")
+    print(f"  columns: {columns_size:>10,} bytes {columns_seconds * 1000:>8.2f} ms")
+    print(
+        f"  ratio:   {columns_size / rows_size:>10.2f}x "
+        f"{columns_seconds / rows_seconds:>10.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,285 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import glob
+import gzip
+import hashlib
+import heapq
+import json
 import logging
+import math
+import mmap
+import multiprocessing
 import os
+import random
+import re
+import reprlib
 import sys
-from collections import deque
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from decimal import Decimal
+from functools import lru_cache, partial
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, BinaryIO, Literal
+from uuid import UUID
 
 import django
-from asgiref.sync import sync_to_async
+from asgiref.sync import async_to_sync, sync_to_async
 from django.apps import apps
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
 from django.core.management import get_commands
-from django.db import connection
+from django.core.signals import setting_changed
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    DatabaseError,
+    NotSupportedError,
+    connection,
+    connections,
+    router,
+    transaction,
+)
+from django.db.models import (
+    Avg,
+    BinaryField,
+    BooleanField,
+    CharField,
+    Count,
+    DateField,
+    DecimalField,
+    DurationField,
+    F,
+    FloatField,
+    IntegerField,
+    Max,
+    Min,
+    Q,
+    Sum,
+    TextField,
+    TimeField,
+    UUIDField,
+    Value,
+)
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import OrderBy, RawSQL
+from django.db.models.functions import MD5, Cast, Concat, Left, Length, Trunc
+from django.db.models.signals import (
+    class_prepared,
+    m2m_changed,
+    post_delete,
+    post_save,
+)
 from django.urls import get_resolver
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 logger = logging.getLogger(__name__)
 
+# Aggregate functions accepted by aggregate_model, as "function:field" specs.
+AGGREGATE_FUNCTIONS = {
+    "count": Count,
+    "count_distinct": partial(Count, distinct=True),
+    "sum": Sum,
+    "avg": Avg,
+    "min": Min,
+    "max": Max,
+}
+
+# Date truncation kinds accepted by aggregate_model.
+DATE_TRUNC_KINDS = ("year", "quarter", "month", "week", "day", "hour", "minute")
+
+# Database vendors whose data tools run in a SET TRANSACTION READ ONLY transaction;
+# SQLite uses PRAGMA query_only instead.
+READ_ONLY_TRANSACTION_VENDORS = ("postgresql", "mysql", "oracle")
+
+# Maximum number of queries in one batch_query call.
+BATCH_QUERY_MAX_QUERIES = 50
+
+# query_model arguments accepted in each batch_query query.
+BATCH_QUERY_ARGUMENTS = (
+    "app_label",
+    "model_name",
+    "filters",
+    "order_by",
+    "limit",
+    "cursor",
+    "fields",
+    "max_value_length",
+    "count_mode",
+    "count_cap",
+    "format",
+    "sample",
+    "seed",
+)
+
+# Number of slowest statements reported in sql_stats.
+SQL_STATS_SLOWEST = 5
+
+# Literal values replaced when fingerprinting SQL statements, in order; IN
+# lists of any length collapse to one fingerprint.
+SQL_FINGERPRINT_RES = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"%s|\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),
+    (re.compile(r"\s+"), " "),
+]
+
+# How many more rows than requested query_model's sample mode aims to read
+# per round, and how many rounds of pk probing it makes before giving up.
+SAMPLE_OVERSAMPLE = 4
+SAMPLE_PROBE_ROUNDS = 8
+
+# Maximum number of random pks probed in one round of sampling.
+SAMPLE_MAX_PROBES = 5000
+
+# Below this share of a PostgreSQL table (in percent), samples use TABLESAMPLE
+# BERNOULLI, which picks individual rows, instead of SYSTEM, which picks whole
+# pages and would cluster a small sample on a few pages.
+SAMPLE_SYSTEM_MIN_PERCENT = 5.0
+
+# Share of a PostgreSQL table (in percent) a sample starts from when the table
+# statistics report no rows, e.g. before the table was first analyzed.
+SAMPLE_UNKNOWN_PERCENT = 1.0
+
+# Appended to string and binary values cut by query_model's max_value_length.
+TRUNCATION_MARKER = "…[truncated]"
+
+# Size of the blocks read backwards from the end of a log file when tailing it.
+LOG_TAIL_BLOCK_SIZE = 64 * 1024
+
+# Size of the blocks read forward when probing a log file during binary search.
+LOG_PROBE_BLOCK_SIZE = 4096
+
+# Bytes covered by each entry of the sparse timestamp index kept for large log files.
+LOG_INDEX_BLOCK_SIZE = 1024 * 1024
+
+# Process-wide sparse log index lookups, used to report the index hit rate.
+LOG_INDEX_STATS = {"lookups": 0, "hits": 0}
+LOG_INDEX_STATS_LOCK = threading.Lock()
+
+# Size of the newline-aligned byte ranges grep_logs scans in parallel; smaller
+# files are scanned in-process.
+LOG_GREP_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Process pool used by grep_logs, created on first use.
+LOG_GREP_EXECUTOR: ProcessPoolExecutor | None = None
+LOG_GREP_EXECUTOR_LOCK = threading.Lock()
+
+# Result cache shared by the read tools, created by get_result_cache() on first use.
+RESULT_CACHE: ToolResultCache | None = None
+
+# Ring-buffer handler installed by install_log_capture() at server startup.
+LOG_CAPTURE_HANDLER: LogCaptureHandler | None = None
+LOG_CAPTURE_FORMATTER = logging.Formatter()
+
+# Longest message kept per captured record; longer messages are cut with TRUNCATION_MARKER.
+LOG_CAPTURE_MAX_MESSAGE_LENGTH = 4096
+
+# Suffixes appended to rotated log files: ".1", ".2024-01-31", ".2024-01-31_13-00", ...
+ROTATED_LOG_SUFFIX_RE = re.compile(
+    r"^\.(?:(?P<index>\d+)|\d{4}-\d{2}-\d{2}(?:_\d{2}(?:-\d{2}){0,2})?)(?:\.gz)?$"
+)
+
+# Placeholders of the three logging.Formatter styles (escaped literals have no field).
+LOG_FORMAT_PLACEHOLDER_RES = {
+    "%": re.compile(r"%\((?P<field>\w+)\)(?P<spec>[#0+ -]*\d*(?:\.\d+)?)[a-zA-Z]|%%"),
+    "{": re.compile(r"\{(?P<field>\w+)(?:![rsa])?(?::(?P<spec>[^}]*))?\}|\{\{|\}\}"),
+    "$": re.compile(r"\$\{(?P<field>\w+)\}|\$(?P<bare>\w+)|\$\$"),
+}
+
+# Patterns for the LogRecord attributes a format can reference; others match lazily.
+LOG_RECORD_FIELD_PATTERNS = {
+    "name": r"\S+?",
+    "levelname": r"\S+?",
+    "levelno": r"\d+",
+    "module": r"\S+?",
+    "filename": r"\S+?",
+    "pathname": r"\S+?",
+    "funcName": r"\S+?",
+    "lineno": r"\d+",
+    "process": r"\d+",
+    "processName": r"\S+?",
+    "thread": r"\d+",
+    "threadName": r"\S+?",
+    "created": r"\d+(?:\.\d+)?",
+    "msecs": r"\d+(?:\.\d+)?",
+    "relativeCreated": r"\d+(?:\.\d+)?",
+}
+
+# Patterns for the strftime directives used in a formatter's datefmt.
+STRFTIME_DIRECTIVE_PATTERNS = {
+    "Y": r"\d{4}",
+    "y": r"\d{2}",
+    "m": r"\d{1,2}",
+    "d": r"\d{1,2}",
+    "H": r"\d{1,2}",
+    "I": r"\d{1,2}",
+    "M": r"\d{1,2}",
+    "S": r"\d{1,2}",
+    "f": r"\d{1,6}",
+    "j": r"\d{1,3}",
+    "p": r"[AaPp][Mm]",
+    "a": r"[A-Za-z]+",
+    "A": r"[A-Za-z]+",
+    "b": r"[A-Za-z]+",
+    "B": r"[A-Za-z]+",
+    "z": r"(?:[+-]\d{2}:?\d{2}|Z)",
+    "Z": r"[A-Za-z]+",
+    "%": "%",
+}
+
+# asctime format used by logging.Formatter when no datefmt is configured.
+DEFAULT_LOG_DATEFMT = "%Y-%m-%d %H:%M:%S,%f"
+
+# Most time buckets summarize_logs returns; past it, neighbouring buckets are merged.
+LOG_SUMMARY_MAX_BUCKETS = 100
+
+# Variable parts of log messages replaced when grouping similar messages.
+LOG_MESSAGE_VARIABLE_RES = [
+    (
+        re.compile(
+            r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"
+        ),
+        "<uuid>",
+    ),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b"), "<hex>"),
+    (re.compile(r"\d+(?:\.\d+)?"), "<n>"),
+]
+
+# Python traceback lines used to fingerprint exceptions in log records.
+TRACEBACK_HEADER = "Traceback (most recent call last):"
+TRACEBACK_FRAME_RE = re.compile(
+    r'\s+File "(?P<filename>[^"]+)", line \d+, in (?P<function>.+)'
+)
+TRACEBACK_EXCEPTION_RE = re.compile(
+    r"(?P<type>[A-Za-z_][\w.]*)(?::\s?(?P<message>.*))?"
+)
+TRACEBACK_CHAIN_LINES = frozenset(
+    {
+        "During handling of the above exception, another exception occurred:",
+        "The above exception was the direct cause of the following exception:",
+    }
+)
+
+# Keys used by common JSON log formatters for each formatter field.
+JSON_LOG_FIELD_KEYS = {
+    "levelname": ("levelname", "level", "severity"),
+    "name": ("name", "logger", "logger_name"),
+    "message": ("message", "msg", "event"),
+    "asctime": ("asctime", "timestamp", "time", "@timestamp"),
+}
+
 
 def initialize_django(settings_module: str | None = None) -> None:
     """Initialize Django with the specified settings module."""
@@ -301,83 +563,114 @@ async def list_urls() -> list[dict[str, Any]]:
     return url_patterns
 
 
-async def database_schema() -> dict[str, Any]:
+async def database_schema(
+    database: str | None = None, include_sql_stats: bool = False
+) -> dict[str, Any]:
     """
     Get the complete database schema including tables, columns, indexes, and foreign keys.
 
+    Args:
+        database: Optional database alias to inspect (default: DJANGO_MCP_DATABASE or "default")
+        include_sql_stats: Whether to add statistics on the SQL queries run by this call under sql_stats (default: False)
+
     Returns:
         Dictionary containing complete database schema information.
     """
 
-    @sync_to_async
     def get_schema():
+        try:
+            alias = get_database_alias(database)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        db_connection = connections[alias]
         schema_info = {
             "tables": [],
-            "database_name": connection.settings_dict.get("NAME"),
-            "database_engine": connection.settings_dict.get("ENGINE"),
+            "database": alias,
+            "database_name": db_connection.settings_dict.get("NAME"),
+            "database_engine": db_connection.settings_dict.get("ENGINE"),
         }
 
-        with connection.cursor() as cursor:
-            tables = connection.introspection.table_names()
+        started = time.perf_counter()
+        try:
+            with (
+                read_only_transaction(alias),
+                statement_timeout(alias, get_tool_timeout("database_schema")),
+                db_connection.cursor() as cursor,
+            ):
+                tables = db_connection.introspection.table_names(cursor)
+
+                for table_name in tables:
+                    table_info = {
+                        "name": table_name,
+                        "columns": [],
+                        "indexes": [],
+                        "foreign_keys": [],
+                    }
 
-            for table_name in tables:
-                table_info = {
-                    "name": table_name,
-                    "columns": [],
-                    "indexes": [],
-                    "foreign_keys": [],
-                }
+                    table_description = (
+                        db_connection.introspection.get_table_description(
+                            cursor, table_name
+                        )
+                    )
+                    for column in table_description:
+                        column_info = {
+                            "name": column.name,
+                            "type": str(column.type_code),
+                            "internal_size": column.internal_size,
+                            "null_ok": column.null_ok,
+                        }
+                        table_info["columns"].append(column_info)
 
-                table_description = connection.introspection.get_table_description(
-                    cursor, table_name
-                )
-                for column in table_description:
-                    column_info = {
-                        "name": column.name,
-                        "type": str(column.type_code),
-                        "internal_size": column.internal_size,
-                        "null_ok": column.null_ok,
-                    }
-                    table_info["columns"].append(column_info)
+                    indexes = db_connection.introspection.get_constraints(
+                        cursor, table_name
+                    )
+                    for index_name, index_info in indexes.items():
+                        if index_info.get("index"):
+                            table_info["indexes"].append(
+                                {
+                                    "name": index_name,
+                                    "columns": index_info.get("columns", []),
+                                    "unique": index_info.get("unique", False),
+                                    "primary_key": index_info.get("primary_key", False),
+                                }
+                            )
 
-                indexes = connection.introspection.get_constraints(cursor, table_name)
-                for index_name, index_info in indexes.items():
-                    if index_info.get("index"):
-                        table_info["indexes"].append(
+                    relations = db_connection.introspection.get_relations(
+                        cursor, table_name
+                    )
+                    for column, (related_table, related_column) in relations.items():
+                        table_info["foreign_keys"].append(
                             {
-                                "name": index_name,
-                                "columns": index_info.get("columns", []),
-                                "unique": index_info.get("unique", False),
-                                "primary_key": index_info.get("primary_key", False),
+                                "column": column,
+                                "related_table": related_table,
+                                "related_column": related_column,
                             }
                         )
 
-                relations = connection.introspection.get_relations(cursor, table_name)
-                for column, (related_table, related_column) in relations.items():
-                    table_info["foreign_keys"].append(
-                        {
-                            "column": column,
-                            "related_table": related_table,
-                            "related_column": related_column,
-                        }
-                    )
-
-                schema_info["tables"].append(table_info)
+                    schema_info["tables"].append(table_info)
+        except QueryTimeout as e:
+            return e.as_result()
 
+        schema_info["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
         return schema_info
 
-    return await get_schema()
+    return await sync_to_async(run_with_sql_stats)(get_schema, include_sql_stats)
 
 
-async def list_migrations() -> list[dict[str, Any]]:
+async def list_migrations(
+    include_sql_stats: bool = False,
+) -> list[dict[str, Any]] | dict[str, Any]:
     """
     List all migrations and their application status.
 
+    Args:
+        include_sql_stats: Whether to add statistics on the SQL queries run by this call under sql_stats (default: False)
+
     Returns:
-        List of migrations per app with their applied status.
+        List of migrations per app with their applied status; with include_sql_stats, a dictionary with the list under results.
     """
 
-    @sync_to_async
     def get_migrations():
         from django.db.migrations.loader import MigrationLoader
 
@@ -408,7 +701,7 @@ async def list_migrations() -> list[dict[str, Any]]:
 
         return sorted(migrations_info, key=lambda x: x["app"])
 
-    return await get_migrations()
+    return await sync_to_async(run_with_sql_stats)(get_migrations, include_sql_stats)
 
 
 async def list_management_commands() -> list[dict[str, Any]]:
@@ -433,7 +726,11 @@ async def list_management_commands() -> list[dict[str, Any]]:
 
 
 async def get_absolute_url(
-    app_label: str, model_name: str, pk: int | str
+    app_label: str,
+    model_name: str,
+    pk: int | str,
+    database: str | None = None,
+    include_sql_stats: bool = False,
 ) -> dict[str, Any]:
     """
     Get the absolute URL for a specific model instance.
@@ -442,46 +739,73 @@ async def get_absolute_url(
         app_label: The app label (e.g., "blog")
         model_name: The model name (e.g., "Post")
         pk: The primary key of the instance
+        database: Optional database alias to read from (default: DJANGO_MCP_DATABASE or the DATABASE_ROUTERS choice)
+        include_sql_stats: Whether to add statistics on the SQL queries run by this call under sql_stats (default: False)
 
     Returns:
         Dictionary containing the absolute URL or error message.
     """
 
-    @sync_to_async
     def get_url():
+        started = time.perf_counter()
         try:
             model = apps.get_model(app_label, model_name)
         except LookupError:
             return {"error": f"Model '{app_label}.{model_name}' not found"}
 
         try:
-            instance = model.objects.get(pk=pk)
-        except model.DoesNotExist:
-            return {
-                "error": f"Instance with pk={pk} not found in {app_label}.{model_name}"
-            }
-        except Exception as e:
-            return {"error": f"Error fetching instance: {str(e)}"}
+            alias = get_database_alias(database, model)
+        except ValueError as e:
+            return {"error": str(e)}
 
-        if hasattr(instance, "get_absolute_url") and callable(
-            getattr(instance, "get_absolute_url")
-        ):
+        with read_only_transaction(alias):
             try:
-                url = instance.get_absolute_url()
+                with statement_timeout(alias, get_tool_timeout("get_absolute_url")):
+                    instance = model.objects.using(alias).get(pk=pk)
+            except QueryTimeout as e:
+                return e.as_result()
+            except model.DoesNotExist:
                 return {
-                    "app": app_label,
-                    "model": model_name,
-                    "pk": pk,
-                    "url": url,
+                    "error": f"Instance with pk={pk} not found in {app_label}.{model_name}"
                 }
             except Exception as e:
-                return {"error": f"Error calling get_absolute_url(): {str(e)}"}
-        else:
-            return {
-                "error": f"Model {app_label}.{model_name} does not have a get_absolute_url() method"
-            }
+                return {"error": f"Error fetching instance: {str(e)}"}
+
+            if hasattr(instance, "get_absolute_url") and callable(
+                getattr(instance, "get_absolute_url")
+            ):
+                try:
+                    url = instance.get_absolute_url()
+                    return {
+                        "app": app_label,
+                        "model": model_name,
+                        "pk": pk,
+                        "database": alias,
+                        "url": url,
+                        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+                    }
+                except Exception as e:
+                    return {"error": f"Error calling get_absolute_url(): {str(e)}"}
+            else:
+                return {
+                    "error": f"Model {app_label}.{model_name} does not have a get_absolute_url() method"
+                }
+
+    if include_sql_stats:
+        # The statistics describe this call's queries, so it bypasses the cache
+        return await sync_to_async(run_with_sql_stats)(get_url, True)
 
-    return await get_url()
+    return await cached_tool_result(
+        ToolResultCache.make_key(
+            "get_absolute_url",
+            app_label=app_label,
+            model_name=model_name,
+            pk=pk,
+            database=database,
+        ),
+        lambda: get_model_dependencies(app_label, model_name),
+        sync_to_async(get_url),
+    )
 
 
 async def reverse_url(
@@ -519,281 +843,3376 @@ async def reverse_url(
         return {"error": f"Error reversing URL: {str(e)}"}
 
 
-async def query_model(
-    app_label: str,
-    model_name: str,
-    filters: dict[str, Any] | None = None,
-    order_by: list[str] | None = None,
-    limit: int = 100,
-) -> dict[str, Any]:
+class ToolResultCache:
     """
-    Query a Django model with read-only operations using the Django ORM manager.
-
-    Args:
-        app_label: The app label (e.g., "blog")
-        model_name: The model name (e.g., "Post")
-        filters: Optional dictionary of field lookups (e.g., {"status": "published", "featured": true})
-        order_by: Optional list of fields to order by (e.g., ["-created_at", "title"])
-        limit: Maximum number of results to return (default: 100, max: 1000)
+    In-process LRU cache of read tool results with a TTL.
 
-    Returns:
-        Dictionary containing query results or error message.
+    Each entry records the models its result was read from, and is evicted as
+    soon as one of them is written in this process (see the post_save,
+    post_delete and m2m_changed receivers below). The TTL bounds staleness for
+    writes made by other processes.
     """
 
-    @sync_to_async
-    def execute_query():
-        try:
-            # Get the model
-            try:
-                model = apps.get_model(app_label, model_name)
-            except LookupError:
-                return {"error": f"Model '{app_label}.{model_name}' not found"}
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, frozenset[str], dict]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> ToolResultCache:
+        """Build the cache from DJANGO_MCP_CACHE_TTL (seconds, default: 0 = disabled) and DJANGO_MCP_CACHE_SIZE (default: 256); invalid values fall back to the defaults."""
+        return cls(
+            ttl=get_env_number("DJANGO_MCP_CACHE_TTL", 0, float),
+            max_size=get_env_number("DJANGO_MCP_CACHE_SIZE", 256),
+        )
 
-            # Enforce maximum limit for safety
-            max_limit = 1000
-            actual_limit = min(limit, max_limit) if limit else 100
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    @staticmethod
+    def make_key(tool_name: str, **arguments: Any) -> str:
+        """Normalize tool arguments into a cache key."""
+        return json.dumps([tool_name, arguments], sort_keys=True, default=str)
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, model_labels: frozenset[str], result: dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, model_labels, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, model_label: str) -> None:
+        """Evict every entry read from the model with this ``app_label.model_name`` label."""
+        with self._lock:
+            for key in [
+                key
+                for key, (_, model_labels, _) in self._entries.items()
+                if model_label in model_labels
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self, hit: bool) -> dict[str, Any]:
+        return {
+            "hit": hit,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+        }
 
-            # Start with all objects
-            queryset = model.objects.all()
 
-            # Apply filters if provided
-            if filters:
-                try:
-                    queryset = queryset.filter(**filters)
-                except Exception as e:
-                    return {"error": f"Invalid filter parameters: {str(e)}"}
+def get_result_cache() -> ToolResultCache:
+    """Return the process-wide tool result cache, configured from the environment on first use."""
+    global RESULT_CACHE
 
-            # Apply ordering if provided
-            if order_by:
-                try:
-                    queryset = queryset.order_by(*order_by)
-                except Exception as e:
-                    return {"error": f"Invalid order_by parameters: {str(e)}"}
+    if RESULT_CACHE is None:
+        RESULT_CACHE = ToolResultCache.from_env()
+    return RESULT_CACHE
 
-            # Get total count before limiting
-            total_count = queryset.count()
-
-            # Limit results
-            queryset = queryset[:actual_limit]
-
-            # Convert queryset to list of dictionaries
-            results = []
-            for obj in queryset:
-                obj_dict = {}
-                for field in model._meta.get_fields():
-                    # Skip reverse relations
-                    if field.many_to_many or field.one_to_many:
-                        continue
-
-                    field_name = field.name
-                    try:
-                        value = getattr(obj, field_name)
-
-                        # Handle different field types
-                        if value is None:
-                            obj_dict[field_name] = None
-                        elif hasattr(field, "related_model") and field.related_model:
-                            # Foreign key - store the pk
-                            obj_dict[field_name] = value.pk if value else None
-                            obj_dict[f"{field_name}_str"] = (
-                                str(value) if value else None
-                            )
-                        elif isinstance(value, (str, int, float, bool)):
-                            obj_dict[field_name] = value
-                        else:
-                            # For dates, times, and other complex types
-                            obj_dict[field_name] = str(value)
-                    except Exception:
-                        # Skip fields that can't be accessed
-                        continue
 
-                results.append(obj_dict)
+def get_model_dependencies(app_label: str, model_name: str) -> frozenset[str]:
+    """Labels of a model and of the related models whose text appears in its serialized rows."""
+    try:
+        model = apps.get_model(app_label, model_name)
+    except LookupError:
+        return frozenset()
 
-            return {
-                "app": app_label,
-                "model": model_name,
-                "total_count": total_count,
-                "returned_count": len(results),
-                "limit": actual_limit,
-                "filters": filters or {},
-                "order_by": order_by or [],
-                "results": results,
-            }
+    labels = {model._meta.label_lower}
+    for field in get_serialized_fields(model):
+        if field.is_relation and field.related_model is not None:
+            labels.add(field.related_model._meta.label_lower)
+    return frozenset(labels)
 
-        except Exception as e:
-            return {"error": f"Error executing query: {str(e)}"}
 
-    return await execute_query()
+async def cached_tool_result(
+    cache_key: str,
+    model_labels: Callable[[], frozenset[str]],
+    compute: Callable[[], Any],
+) -> dict[str, Any]:
+    """
+    Return a tool result from the result cache, or compute and cache it.
 
+    ``compute`` is awaited on a miss; error results are never cached. When the
+    cache is enabled, ``cached`` tells whether the result was served from it and
+    hit and miss counts are added under ``cache``. A hit reports the cost of the
+    lookup itself in ``elapsed_ms`` and ``query_count``, not the original run's.
+    """
+    result_cache = get_result_cache()
+    if not result_cache.enabled:
+        return await compute()
+
+    started = time.perf_counter()
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        result = {**cached, "cached": True, "cache": result_cache.stats(hit=True)}
+        if "elapsed_ms" in result:
+            result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        if "query_count" in result:
+            result["query_count"] = 0
+        result.pop("sql_stats", None)
+        return result
+
+    result = await compute()
+    if "error" not in result:
+        result_cache.set(cache_key, await sync_to_async(model_labels)(), result)
+    return {**result, "cached": False, "cache": result_cache.stats(hit=False)}
+
+
+def _invalidate_result_cache(sender, **kwargs) -> None:
+    if RESULT_CACHE is None or not RESULT_CACHE.enabled:
+        return
+
+    labels = {sender._meta.label_lower}
+    if "action" in kwargs:
+        # m2m_changed: the sender is the through model; evict both sides
+        if not kwargs["action"].startswith("post_"):
+            return
+        labels.add(type(kwargs["instance"])._meta.label_lower)
+        labels.add(kwargs["model"]._meta.label_lower)
+    for label in labels:
+        RESULT_CACHE.invalidate(label)
+
+
+post_save.connect(_invalidate_result_cache, dispatch_uid="django_ai_boost_result_cache")
+post_delete.connect(
+    _invalidate_result_cache, dispatch_uid="django_ai_boost_result_cache"
+)
+m2m_changed.connect(
+    _invalidate_result_cache, dispatch_uid="django_ai_boost_result_cache"
+)
+
+
+def get_database_alias(database: str | None = None, model=None) -> str:
+    """
+    Resolve the database alias a data tool reads from.
 
-async def run_check(
-    app_labels: list[str] | None = None,
-    tags: list[str] | None = None,
-    deploy: bool = False,
-    fail_level: str = "ERROR",
-    databases: list[str] | None = None,
-) -> dict[str, Any]:
+    An explicit ``database`` wins, then the DJANGO_MCP_DATABASE environment
+    variable, then ``DATABASE_ROUTERS`` (``db_for_read``) for the model.
+
+    Raises:
+        ValueError: If the alias is not configured in DATABASES
     """
-    Run Django system checks to identify potential problems in the project.
+    alias = database or os.environ.get("DJANGO_MCP_DATABASE")
+    if not alias:
+        alias = router.db_for_read(model) if model is not None else DEFAULT_DB_ALIAS
+    if alias not in settings.DATABASES:
+        raise ValueError(
+            f"Unknown database alias '{alias}': expected one of "
+            f"{', '.join(settings.DATABASES)}"
+        )
+    return alias
 
-    Args:
-        app_labels: Optional list of app labels to check (e.g., ["blog", "auth"])
-        tags: Optional list of check tags to run (e.g., ["models", "compatibility"])
-        deploy: Whether to include deployment checks (default: False)
-        fail_level: Minimum message level that causes the check to fail: "CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG" (default: "ERROR")
-        databases: Optional list of database aliases to check (e.g., ["default"])
 
-    Returns:
-        Dictionary containing check results with errors, warnings, and info messages.
+@contextmanager
+def read_only_transaction(using: str, repeatable_read: bool = False) -> Iterator[None]:
     """
+    Run the enclosed queries in a read-only transaction on the ``using`` database.
 
-    @sync_to_async
-    def execute_checks():
-        from django.core.checks import run_checks
-        from django.core.checks.messages import (
-            DEBUG,
-            INFO,
-            WARNING,
-            ERROR,
-            CRITICAL,
-        )
+    PostgreSQL, MySQL and Oracle start the transaction with SET TRANSACTION READ
+    ONLY, and SQLite sets PRAGMA query_only for its duration, so any write made
+    by the enclosed code fails. Other backends get a plain transaction.
+
+    With ``repeatable_read``, PostgreSQL and MySQL also use the REPEATABLE READ
+    isolation level so every query sees the same snapshot. Oracle read-only
+    transactions and SQLite transactions already do.
+    """
+    db_connection = connections[using]
 
+    if db_connection.vendor == "sqlite":
+        with db_connection.cursor() as cursor:
+            cursor.execute("PRAGMA query_only")
+            query_only = cursor.fetchone()[0]
+            cursor.execute("PRAGMA query_only = ON")
         try:
-            # Map fail_level string to Django check level constant
-            level_map = {
-                "DEBUG": DEBUG,
-                "INFO": INFO,
-                "WARNING": WARNING,
-                "ERROR": ERROR,
-                "CRITICAL": CRITICAL,
-            }
-            check_level = level_map.get(fail_level.upper(), ERROR)
+            with transaction.atomic(using=using):
+                yield
+        finally:
+            # Restore the previous value, which is still ON in nested calls
+            with db_connection.cursor() as cursor:
+                cursor.execute(f"PRAGMA query_only = {int(query_only)}")
+        return
+
+    # The access mode can only be set before the first query of a transaction
+    outermost = not db_connection.in_atomic_block
+    with transaction.atomic(using=using):
+        if outermost and db_connection.vendor in READ_ONLY_TRANSACTION_VENDORS:
+            modes = "READ ONLY"
+            if repeatable_read and db_connection.vendor != "oracle":
+                modes = "ISOLATION LEVEL REPEATABLE READ, READ ONLY"
+            with db_connection.cursor() as cursor:
+                cursor.execute(f"SET TRANSACTION {modes}")
+        yield
+
+
+def get_tool_timeout(tool_name: str) -> float | None:
+    """
+    Statement timeout in seconds for a database tool.
 
-            # Get app_configs if app_labels provided
-            app_configs = None
-            if app_labels:
-                app_configs = [apps.get_app_config(label) for label in app_labels]
+    Read from DJANGO_MCP_TIMEOUT_<TOOL_NAME> (e.g. DJANGO_MCP_TIMEOUT_QUERY_MODEL),
+    then DJANGO_MCP_TIMEOUT (default: 30); 0 disables the timeout. Values that
+    are not a non-negative number are ignored with a warning.
+    """
+    for variable in (f"DJANGO_MCP_TIMEOUT_{tool_name.upper()}", "DJANGO_MCP_TIMEOUT"):
+        value = os.environ.get(variable)
+        if value is None:
+            continue
+        try:
+            timeout = float(value)
+        except ValueError:
+            timeout = math.nan
+        if not 0 <= timeout < math.inf:
+            logger.warning("Ignoring invalid %s=%r: expected seconds", variable, value)
+            continue
+        return timeout or None
+    return 30.0
+
+
+def get_env_number(
+    variable: str, default: float, parse: Callable[[str], float] = int
+) -> float:
+    """
+    Read a non-negative number from an environment variable.
 
-            # Run the checks
-            messages = run_checks(
-                app_configs=app_configs,
-                tags=tags,
-                include_deployment_checks=deploy,
-                databases=databases or [],
-            )
+    Like get_tool_timeout, values that ``parse`` rejects, negative or infinite
+    values are ignored with a warning and ``default`` is returned.
+    """
+    value = os.environ.get(variable)
+    if value is None:
+        return default
+    try:
+        number = parse(value)
+    except ValueError:
+        number = math.nan
+    if not 0 <= number < math.inf:
+        logger.warning(
+            "Ignoring invalid %s=%r: expected a non-negative number", variable, value
+        )
+        return default
+    return number
 
-            # Organize messages by level
-            result = {
-                "success": True,
-                "checked_apps": app_labels or "all",
-                "tags": tags or "all",
-                "deploy_checks": deploy,
-                "fail_level": fail_level,
-                "total_issues": len(messages),
-                "critical": [],
-                "errors": [],
-                "warnings": [],
-                "info": [],
-                "debug": [],
-            }
 
-            # Categorize messages by level
-            for msg in messages:
-                message_dict = {
-                    "id": msg.id,
-                    "level": msg.level,
-                    "message": msg.msg,
-                    "hint": msg.hint or "",
-                    "obj": str(msg.obj) if msg.obj else "",
-                }
+class QueryTimeout(Exception):
+    """Raised by statement_timeout() when the database aborts a query that ran past the timeout."""
 
-                if msg.level >= CRITICAL:
-                    result["critical"].append(message_dict)
-                    result["success"] = False
-                elif msg.level >= ERROR:
-                    result["errors"].append(message_dict)
-                    if check_level <= ERROR:
-                        result["success"] = False
-                elif msg.level >= WARNING:
-                    result["warnings"].append(message_dict)
-                    if check_level <= WARNING:
-                        result["success"] = False
-                elif msg.level >= INFO:
-                    result["info"].append(message_dict)
-                    if check_level <= INFO:
-                        result["success"] = False
-                else:
-                    result["debug"].append(message_dict)
-                    if check_level <= DEBUG:
-                        result["success"] = False
+    def __init__(self, timeout: float, elapsed_ms: float) -> None:
+        super().__init__(f"Query timed out after {timeout:g}s")
+        self.timeout = timeout
+        self.elapsed_ms = elapsed_ms
 
-            # Add summary
-            result["summary"] = {
-                "critical_count": len(result["critical"]),
-                "error_count": len(result["errors"]),
-                "warning_count": len(result["warnings"]),
-                "info_count": len(result["info"]),
-                "debug_count": len(result["debug"]),
-            }
+    def as_result(self) -> dict[str, Any]:
+        return {
+            "error": str(self),
+            "timed_out": True,
+            "timeout": self.timeout,
+            "elapsed_ms": self.elapsed_ms,
+        }
 
-            return result
 
-        except LookupError as e:
-            return {"error": f"App not found: {str(e)}"}
-        except Exception as e:
-            return {"error": f"Error running checks: {str(e)}"}
+class StatementDeadline:
+    """
+    Per-statement deadline checked by the SQLite progress handler.
 
-    return await execute_checks()
+    Installed as an execute wrapper, it restarts the deadline for each
+    statement, like statement_timeout does on PostgreSQL and MySQL.
+    """
 
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.restart()
 
-async def read_recent_logs(
-    lines: int = 100,
-    handler_name: str | None = None,
-) -> dict[str, Any]:
+    def restart(self) -> None:
+        self.deadline = time.perf_counter() + self.timeout
+
+    def expired(self) -> bool:
+        return time.perf_counter() > self.deadline
+
+    def excluding(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap ``func`` so the time spent in it (e.g. streaming to a client) does not count."""
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.deadline += time.perf_counter() - started
+
+        return wrapper
+
+    def __call__(self, execute, sql, params, many, context):
+        self.restart()
+        return execute(sql, params, many, context)
+
+
+def is_statement_timeout_error(error: DatabaseError) -> bool:
+    """Whether a database error was raised by a timeout set with statement_timeout()."""
+    cause = error.__cause__
+    # psycopg 3 / psycopg2 query_canceled
+    if getattr(cause, "sqlstate", None) == "57014":
+        return True
+    if getattr(cause, "pgcode", None) == "57014":
+        return True
+    # MySQL ER_QUERY_TIMEOUT / MariaDB ER_STATEMENT_TIMEOUT
+    if cause is not None and cause.args and cause.args[0] in (3024, 1969):
+        return True
+    # SQLite statement interrupted by the progress handler
+    return str(error) == "interrupted"
+
+
+@contextmanager
+def statement_timeout(
+    using: str, timeout: float | None
+) -> Iterator[StatementDeadline | None]:
     """
-    Read recent lines from file-based Django log handlers safely.
+    Abort queries on the ``using`` database that run longer than ``timeout`` seconds.
 
-    Args:
-        lines: Number of recent lines to read per handler (default: 100, cap set via DJANGO_MCP_MAX_LOG_LINES env var, default cap: 5000)
-        handler_name: Optional handler name to target one configured handler
+    PostgreSQL uses SET LOCAL statement_timeout, so this must be entered inside
+    a transaction; MySQL and MariaDB set max_execution_time or
+    max_statement_time for the session and restore it afterwards; SQLite
+    installs a progress handler that interrupts the running statement once its
+    StatementDeadline has passed. Other backends are not limited.
 
-    Returns:
-        Dictionary containing discovered handlers and recent log lines, or an error message.
+    The timeout applies to each statement. On SQLite the deadline is yielded, so
+    work done between fetches of a streamed query can be excluded from it.
+
+    Raises:
+        QueryTimeout: If a query in the block was aborted by the timeout
     """
+    if not timeout:
+        yield None
+        return
+
+    db_connection = connections[using]
+    db_connection.ensure_connection()
+    vendor = db_connection.vendor
+    started = time.perf_counter()
+    deadline = None
+
+    if vendor == "postgresql":
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                f"SET LOCAL statement_timeout = {max(int(timeout * 1000), 1)}"
+            )
+    elif vendor == "mysql":
+        if db_connection.mysql_is_mariadb:
+            variable, value = "max_statement_time", timeout
+        else:
+            variable, value = "max_execution_time", max(int(timeout * 1000), 1)
+        with db_connection.cursor() as cursor:
+            cursor.execute(f"SELECT @@SESSION.{variable}")
+            previous = cursor.fetchone()[0]
+            cursor.execute(f"SET SESSION {variable} = {value}")
+    elif vendor == "sqlite":
+        deadline = StatementDeadline(timeout)
+        # A true return value interrupts the statement with OperationalError
+        db_connection.connection.set_progress_handler(deadline.expired, 1000)
 
-    @sync_to_async
-    def read_logs():
-        max_lines = int(os.environ.get("DJANGO_MCP_MAX_LOG_LINES", 5000))
+    try:
+        if deadline is None:
+            yield None
+        else:
+            with db_connection.execute_wrapper(deadline):
+                yield deadline
+    except DatabaseError as e:
+        if is_statement_timeout_error(e):
+            raise QueryTimeout(
+                timeout, round((time.perf_counter() - started) * 1000, 2)
+            ) from e
+        raise
+    finally:
+        if vendor == "mysql":
+            with db_connection.cursor() as cursor:
+                cursor.execute(f"SET SESSION {variable} = {previous}")
+        elif vendor == "sqlite":
+            db_connection.connection.set_progress_handler(None, 1000)
 
-        if lines < 1:
-            return {"error": "lines must be greater than 0"}
 
-        actual_lines = min(lines, max_lines)
-        logging_config = getattr(settings, "LOGGING", {}) or {}
-        handlers_config = logging_config.get("handlers", {})
+class QueryCounter:
+    """Count the SQL queries run on a connection; install with ``connection.execute_wrapper``."""
 
-        file_handlers: dict[str, Path] = {}
-        path_errors: dict[str, str] = {}
+    def __init__(self) -> None:
+        self.count = 0
 
-        for name, config in handlers_config.items():
-            handler_class = str(config.get("class", ""))
-            filename = config.get("filename")
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
 
-            if not filename or not handler_class.endswith("FileHandler"):
-                continue
 
-            try:
-                file_handlers[name] = Path(str(filename)).expanduser().resolve()
-            except Exception as e:
-                path_errors[name] = str(e)
+def fingerprint_sql(sql: str) -> str:
+    """Replace the literal values and placeholders of a SQL statement so repeated statements group together."""
+    for literal_re, placeholder in SQL_FINGERPRINT_RES:
+        sql = literal_re.sub(placeholder, sql)
+    return sql.strip()
 
-        if not file_handlers and not path_errors:
-            return {"error": "No file-based log handlers found in LOGGING settings"}
 
-        if handler_name:
-            if handler_name not in file_handlers:
-                return {
-                    "error": f"Handler '{handler_name}' not found or is not a file-based handler"
+class SqlStatsCollector(QueryCounter):
+    """
+    Count, time and fingerprint the SQL queries run on a connection.
+
+    Only the time spent in ``execute`` is measured; rows fetched afterwards
+    from a cursor are not. Memory stays bounded: statements are aggregated by
+    fingerprint and only the slowest ones are kept.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.total_ms = 0.0
+        self.slowest: list[tuple[float, int, str]] = []
+        self.fingerprints: dict[str, list] = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return super().__call__(execute, sql, params, many, context)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.total_ms += elapsed_ms
+            entry = (elapsed_ms, self.count, sql)
+            if len(self.slowest) < SQL_STATS_SLOWEST:
+                heapq.heappush(self.slowest, entry)
+            else:
+                heapq.heappushpop(self.slowest, entry)
+            stats = self.fingerprints.setdefault(fingerprint_sql(sql), [0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed_ms
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "query_count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "slowest": [
+                {"sql": sql, "ms": round(elapsed_ms, 2)}
+                for elapsed_ms, _, sql in sorted(self.slowest, reverse=True)
+            ],
+            "duplicates": [
+                {"fingerprint": fingerprint, "count": count, "total_ms": round(ms, 2)}
+                for fingerprint, (count, ms) in sorted(
+                    self.fingerprints.items(), key=lambda item: -item[1][0]
+                )
+                if count > 1
+            ],
+        }
+
+
+def run_with_sql_stats(function: Callable[[], Any], include_sql_stats: bool) -> Any:
+    """
+    Call ``function``, collecting statistics on the SQL it runs when ``include_sql_stats`` is set.
+
+    A SqlStatsCollector is installed on every database connection for the
+    duration of the call, and its statistics are added to a dictionary result
+    under "sql_stats". List results are wrapped as {"results": ..., "sql_stats": ...}.
+    """
+    if not include_sql_stats:
+        return function()
+
+    collector = SqlStatsCollector()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(collector))
+        result = function()
+
+    if isinstance(result, dict):
+        return {**result, "sql_stats": collector.stats()}
+    return {"results": result, "sql_stats": collector.stats()}
+
+
+def get_serialized_fields(model, field_names: list[str] | None = None) -> list:
+    """
+    Return the fields query_model serializes for a model, in model order.
+
+    Reverse many-valued relations are never serialized. With ``field_names``,
+    only those fields (plus the primary key, which is always returned) are kept.
+
+    Raises:
+        ValueError: If a name is not a serializable field of the model
+    """
+    fields = [
+        field
+        for field in model._meta.get_fields()
+        if not (field.many_to_many or field.one_to_many)
+    ]
+    if field_names is None:
+        return fields
+
+    pk_name = model._meta.pk.name
+    requested = {pk_name if name == "pk" else name for name in field_names}
+    unknown = requested - {field.name for field in fields}
+    if unknown:
+        raise ValueError(f"Invalid fields: {', '.join(sorted(unknown))}")
+    return [field for field in fields if field.name in requested | {pk_name}]
+
+
+def get_related_fetch_plan(
+    model, fields: list | None = None
+) -> tuple[list[str], list[str]]:
+    """
+    Return the relations a model's serialized rows read, split by how to fetch them.
+
+    Forward foreign keys and one-to-one relations (in either direction) can be
+    joined with ``select_related``; generic foreign keys need ``prefetch_related``.
+    """
+    select_related: list[str] = []
+    prefetch_related: list[str] = []
+
+    for field in fields if fields is not None else model._meta.get_fields():
+        if not field.is_relation or field.many_to_many or field.one_to_many:
+            continue
+        if field.related_model is None:
+            # GenericForeignKey: the target model varies per row
+            prefetch_related.append(field.name)
+        else:
+            select_related.append(field.name)
+
+    return select_related, prefetch_related
+
+
+def get_sql_truncated_fields(fields: list, max_value_length: int | None) -> list:
+    """Return the text fields whose values may exceed ``max_value_length`` and are cut in SQL."""
+    if max_value_length is None:
+        return []
+    return [
+        field
+        for field in fields
+        if field.concrete
+        and not field.is_relation
+        and isinstance(field, (CharField, TextField))
+        and (field.max_length is None or field.max_length > max_value_length)
+    ]
+
+
+def get_projection(fields: list, excluded: list) -> list[str]:
+    """Return the column names to load with ``only()`` for the serialized fields."""
+    names: list[str] = []
+    for field in fields:
+        if field in excluded:
+            continue
+        if field.concrete:
+            names.append(field.name)
+        elif field.is_relation and field.related_model is None:
+            # GenericForeignKey: load the columns it is built from
+            names.extend([field.ct_field, field.fk_field])
+    return names
+
+
+def truncate_value(
+    value: str | bytes, max_value_length: int | None
+) -> tuple[Any, int | None]:
+    """Cut a string or bytes value to ``max_value_length``, returning it and its full length if cut."""
+    if max_value_length is None or len(value) <= max_value_length:
+        return value, None
+    if isinstance(value, bytes):
+        return value[:max_value_length] + TRUNCATION_MARKER.encode(), len(value)
+    return value[:max_value_length] + TRUNCATION_MARKER, len(value)
+
+
+# Writers store a non-null value under ``key`` in a row dictionary (keyed by
+# name) or value list (keyed by position). ``extra_key`` receives the
+# "<field>_str" text of relations or the "<field>_length" of cut values.
+
+
+def _write_value(row, key, extra_key, value: Any) -> None:
+    row[key] = value
+
+
+def _write_str(row, key, extra_key, value: Any) -> None:
+    row[key] = str(value)
+
+
+def _write_any(row, key, extra_key, value: Any) -> None:
+    # Field classes without a known Python type, e.g. custom fields
+    row[key] = value if isinstance(value, (str, int, float, bool)) else str(value)
+
+
+def _write_related(row, key, extra_key, value: Any) -> None:
+    row[key] = value.pk
+    row[extra_key] = str(value)
+
+
+def _truncating_writer(max_value_length: int, binary: bool):
+    """Writer cutting string or binary values in Python and reporting their full length."""
+
+    def write(row, key, extra_key, value: Any) -> None:
+        if binary:
+            value = bytes(value)
+        value, length = truncate_value(value, max_value_length)
+        row[key] = str(value) if binary else value
+        if length is not None:
+            row[extra_key] = length
+
+    return write
+
+
+def _sql_truncated_writer(max_value_length: int):
+    """Writer for text values cut in SQL, read as a (Left, Length) annotation pair."""
+
+    def write(row, key, extra_key, value: tuple[str | None, int]) -> None:
+        left, length = value
+        if left is not None and length > max_value_length:
+            row[key] = left + TRUNCATION_MARKER
+            row[extra_key] = length
+        else:
+            row[key] = left
+
+    return write
+
+
+def _column_writer(field, max_value_length: int | None):
+    """
+    Pick the writer for a concrete non-relation field from its class.
+
+    Returns:
+        Tuple of (writer, whether it may report a "<field>_length").
+    """
+    if isinstance(field, (CharField, TextField)):
+        if max_value_length is None:
+            return _write_value, False
+        return _truncating_writer(max_value_length, binary=False), True
+    if isinstance(field, BinaryField):
+        if max_value_length is None:
+            return _write_str, False
+        return _truncating_writer(max_value_length, binary=True), True
+    if isinstance(field, (IntegerField, FloatField, BooleanField)):
+        return _write_value, False
+    if isinstance(
+        field, (DateField, TimeField, DecimalField, DurationField, UUIDField)
+    ):
+        return _write_str, False
+    return _write_any, False
+
+
+@dataclass(frozen=True)
+class RowSerializerPlan:
+    """
+    How query_model loads and serializes the rows of one model and projection.
+
+    ``columns`` holds one ``(name, getter, writer, extra_name)`` entry per
+    serialized field, chosen from the field class when the plan is compiled, so
+    serializing a row is a loop over precomputed callables. ``header`` is the
+    fixed column list of the columns format, with ``value_columns`` holding the
+    same entries keyed by position in it.
+    """
+
+    fields: tuple
+    sql_truncated: tuple
+    select_related: tuple[str, ...]
+    prefetch_related: tuple[str, ...]
+    projection: tuple[str, ...] | None
+    columns: tuple[tuple[str, Callable[[Any], Any], Callable[..., None], str], ...]
+    header: tuple[str, ...]
+    value_columns: tuple[
+        tuple[int, Callable[[Any], Any], Callable[..., None], int], ...
+    ]
+    dictionary_columns: tuple[tuple[str, int], ...]
+
+    def serialize(self, obj) -> dict[str, Any]:
+        """Convert a model instance to a JSON-compatible dictionary."""
+        row: dict[str, Any] = {}
+        for name, get_value, write, extra_name in self.columns:
+            try:
+                value = get_value(obj)
+            except Exception:
+                # Skip fields that can't be accessed
+                continue
+            if value is None:
+                row[name] = None
+            else:
+                write(row, name, extra_name, value)
+        return row
+
+    def serialize_values(self, obj) -> list[Any]:
+        """Convert a model instance to a list of values ordered like ``header``."""
+        row: list[Any] = [None] * len(self.header)
+        for index, get_value, write, extra_index in self.value_columns:
+            try:
+                value = get_value(obj)
+            except Exception:
+                continue
+            if value is not None:
+                write(row, index, extra_index, value)
+        return row
+
+
+@lru_cache(maxsize=256)
+def compile_row_serializer(
+    model, field_names: tuple[str, ...] | None, max_value_length: int | None
+) -> RowSerializerPlan:
+    """
+    Compile the serializer plan for a model, projection and truncation length.
+
+    Plans are cached; the cache is cleared when models are (re)registered or
+    INSTALLED_APPS changes.
+
+    Raises:
+        ValueError: If a projected name is not a serializable field of the model
+    """
+    fields = get_serialized_fields(
+        model, list(field_names) if field_names is not None else None
+    )
+    select_related, prefetch_related = get_related_fetch_plan(model, fields)
+    sql_truncated = get_sql_truncated_fields(fields, max_value_length)
+
+    columns = []
+    header: list[str] = []
+    value_columns = []
+    dictionary_columns = []
+    for field in fields:
+        extra_name = None
+        if field in sql_truncated:
+            getter = attrgetter(f"mcp_left_{field.name}", f"mcp_length_{field.name}")
+            writer = _sql_truncated_writer(max_value_length)
+            extra_name = f"{field.name}_length"
+        elif field.is_relation:
+            getter, writer = attrgetter(field.name), _write_related
+            extra_name = f"{field.name}_str"
+        else:
+            getter = attrgetter(field.attname)
+            writer, reports_length = _column_writer(field, max_value_length)
+            if reports_length:
+                extra_name = f"{field.name}_length"
+        columns.append((field.name, getter, writer, extra_name))
+
+        index = len(header)
+        header.append(field.name)
+        extra_index = None
+        if extra_name is not None:
+            extra_index = len(header)
+            header.append(extra_name)
+            if field.is_relation:
+                dictionary_columns.append((extra_name, extra_index))
+        value_columns.append((index, getter, writer, extra_index))
+
+    return RowSerializerPlan(
+        fields=tuple(fields),
+        sql_truncated=tuple(sql_truncated),
+        select_related=tuple(select_related),
+        prefetch_related=tuple(prefetch_related),
+        projection=(
+            tuple(get_projection(fields, sql_truncated))
+            if field_names is not None
+            else None
+        ),
+        columns=tuple(columns),
+        header=tuple(header),
+        value_columns=tuple(value_columns),
+        dictionary_columns=tuple(dictionary_columns),
+    )
+
+
+def encode_columns(plan: RowSerializerPlan, rows: list[list[Any]]) -> dict[str, Any]:
+    """
+    Encode rows from ``plan.serialize_values`` under the plan's fixed column header.
+
+    Values of the plan's dictionary columns (the repeated "<field>_str" of
+    foreign keys) are replaced in place by their index in a per-column list of
+    distinct values under ``dictionaries``.
+    """
+    dictionaries = {}
+    for name, index in plan.dictionary_columns:
+        values: dict[Any, int] = {}
+        for row in rows:
+            if row[index] is not None:
+                row[index] = values.setdefault(row[index], len(values))
+        dictionaries[name] = list(values)
+
+    return {"columns": list(plan.header), "dictionaries": dictionaries, "rows": rows}
+
+
+def _clear_row_serializer_cache(sender=None, setting=None, **kwargs) -> None:
+    if setting is None or setting == "INSTALLED_APPS":
+        compile_row_serializer.cache_clear()
+
+
+class_prepared.connect(
+    _clear_row_serializer_cache, dispatch_uid="django_ai_boost_row_plans"
+)
+setting_changed.connect(
+    _clear_row_serializer_cache, dispatch_uid="django_ai_boost_row_plans"
+)
+
+
+def get_keyset_ordering(model, order_by: list[str] | None) -> list[str] | None:
+    """
+    Return the ordering used for keyset pagination, ending with the pk as a tiebreaker.
+
+    Returns None when the ordering cannot be paginated with a cursor (random
+    ordering or expressions in ``Meta.ordering``).
+    """
+    ordering = list(order_by or model._meta.ordering or [])
+    if any(not isinstance(term, str) or term == "?" for term in ordering):
+        return None
+
+    pk_names = {"pk", model._meta.pk.name, model._meta.pk.attname}
+    if not any(term.lstrip("-") in pk_names for term in ordering):
+        ordering.append("pk")
+    return ordering
+
+
+def _lookup_path_nullable(model, path: str) -> bool:
+    """Whether a (possibly related) lookup path can evaluate to NULL."""
+    nullable = False
+    for part in path.split(LOOKUP_SEP):
+        field = model._meta.pk if part == "pk" else model._meta.get_field(part)
+        nullable = nullable or field.null or (field.is_relation and not field.concrete)
+        if field.is_relation:
+            model = field.related_model
+    return nullable
+
+
+def keyset_order_expressions(model, ordering: list[str]) -> list[OrderBy]:
+    """
+    Build ORDER BY expressions with explicit NULL placement for nullable keys.
+
+    Ascending keys put NULLs last and descending keys put them first (the
+    PostgreSQL default) on every backend, so the seek predicate built by
+    keyset_seek_filter() agrees with the row order.
+    """
+    expressions = []
+    for term in ordering:
+        name = term.lstrip("-")
+        descending = term.startswith("-")
+        if _lookup_path_nullable(model, name):
+            expression = (
+                F(name).desc(nulls_first=True)
+                if descending
+                else F(name).asc(nulls_last=True)
+            )
+        else:
+            expression = F(name).desc() if descending else F(name).asc()
+        expressions.append(expression)
+    return expressions
+
+
+def keyset_seek_filter(model, ordering: list[str], values: list[Any]) -> Q:
+    """
+    Build the predicate selecting rows that sort after the row with ``values``.
+
+    This is the expanded form of ``(k1, k2, pk) > (v1, v2, pk0)``:
+    ``k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...``, with each comparison flipped
+    for descending keys and NULLs placed as in keyset_order_expressions().
+    """
+    seek = Q(pk__in=[])
+    equal_prefix = Q()
+
+    for term, value in zip(ordering, values):
+        name = term.lstrip("-")
+        is_null = Q(**{f"{name}__isnull": True})
+
+        if term.startswith("-"):
+            # NULLs come first, so every non-NULL value sorts after a NULL one
+            after = ~is_null if value is None else Q(**{f"{name}__lt": value})
+        elif value is None:
+            # NULLs come last; only ties on the remaining keys can follow
+            after = Q(pk__in=[])
+        else:
+            after = Q(**{f"{name}__gt": value})
+            if _lookup_path_nullable(model, name):
+                after |= is_null
+
+        seek |= equal_prefix & after
+        equal_prefix &= is_null if value is None else Q(**{name: value})
+
+    return seek
+
+
+def _cursor_value_default(value: Any) -> str:
+    """Encode non-JSON ordering key values as strings Django parses back losslessly."""
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Cannot use {type(value).__name__} values in a cursor")
+
+
+def _keyset_query_id(
+    app_label: str,
+    model_name: str,
+    filters: dict[str, Any] | None,
+    ordering: list[str],
+) -> str:
+    """Short hash tying a cursor to the query that produced it."""
+    query = json.dumps(
+        [app_label, model_name, filters or {}, ordering], sort_keys=True, default=str
+    )
+    return hashlib.sha1(query.encode()).hexdigest()[:12]
+
+
+def encode_query_cursor(query_id: str, values: list[Any]) -> str:
+    """Encode the ordering key values of the last returned row as an opaque cursor."""
+    payload = json.dumps([query_id, values], default=_cursor_value_default)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_query_cursor(cursor: str, query_id: str) -> list[Any]:
+    """
+    Decode a cursor returned by encode_query_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for a different query
+    """
+    try:
+        cursor_query_id, values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if cursor_query_id != query_id:
+        raise ValueError(
+            "Cursor does not match this query; pass the same app_label, model_name, filters and order_by"
+        )
+    return values
+
+
+def estimate_queryset_count(queryset, filtered: bool) -> tuple[int, str] | None:
+    """
+    Estimate how many rows a queryset matches without counting them.
+
+    Unfiltered querysets use the table statistics kept in ``pg_class``; filtered
+    ones use the planner's row estimate from ``EXPLAIN``. Only PostgreSQL is
+    supported.
+
+    Returns:
+        Tuple of (estimated row count, source) or None if no estimate is available.
+    """
+    db_connection = connections[queryset.db]
+    if db_connection.vendor != "postgresql":
+        return None
+
+    if not filtered:
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [db_connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 for tables that were never analyzed
+        if row is not None and row[0] >= 0:
+            return row[0], "table_statistics"
+
+    plan = json.loads(queryset.order_by().values("pk").explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"]), "planner_estimate"
+
+
+def sample_queryset_pks(
+    queryset, size: int, seed: int | None = None, filtered: bool = False
+) -> tuple[list[Any], str]:
+    """
+    Pick the primary keys of ``size`` random rows of a queryset without sorting it.
+
+    On PostgreSQL, an oversampled set of pks is read with TABLESAMPLE
+    (REPEATABLE with a seed), sized from the table statistics or planner
+    estimate and grown until enough rows match; at most SAMPLE_OVERSAMPLE times
+    ``size`` of them are read, in random order, and ``size`` of those are picked
+    at random. BERNOULLI is used for samples below SAMPLE_SYSTEM_MIN_PERCENT of
+    the table, where SYSTEM's page-level picks would cluster. Elsewhere, random values
+    between the smallest and largest integer pk are probed in batches with
+    ``in_bulk``, so every row is equally likely to be picked whatever the gaps
+    in the pks; models with other pk types fall back to ORDER BY RANDOM().
+
+    With a seed, the same rows are picked as long as the table does not change
+    (except in the ORDER BY RANDOM() fallback). Fewer than ``size`` pks are
+    returned when the queryset is smaller or probing runs out of rounds.
+
+    Returns:
+        Tuple of (sampled primary keys, sampling method)
+    """
+    model = queryset.model
+    db_connection = connections[queryset.db]
+    queryset = queryset.order_by()
+    pks = queryset.values_list("pk", flat=True)
+
+    if db_connection.vendor == "postgresql":
+        estimate = estimate_queryset_count(queryset, filtered)
+        matching_rows = estimate[0] if estimate is not None else 0
+        # An empty estimate is usually stale statistics, not an empty table
+        percent = SAMPLE_UNKNOWN_PERCENT
+        if matching_rows > 0:
+            percent = min(100.0, size * SAMPLE_OVERSAMPLE * 100 / matching_rows)
+
+        sample_method = "BERNOULLI" if percent < SAMPLE_SYSTEM_MIN_PERCENT else "SYSTEM"
+        quote_name = db_connection.ops.quote_name
+        sample_sql = (
+            f"SELECT {quote_name(model._meta.pk.column)} "
+            f"FROM {quote_name(model._meta.db_table)} "
+            f"TABLESAMPLE {sample_method} (%s)"
+        )
+        if seed is None:
+            shuffle = "?"
+        else:
+            sample_sql += " REPEATABLE (%s)"
+            shuffle = MD5(Concat(Cast("pk", TextField()), Value(f":{seed}")))
+        while True:
+            params = [percent] if seed is None else [percent, seed]
+            # Read at most an oversampled share in random order, so a low
+            # estimate cannot load the whole table and the scan order, which
+            # follows the pages, does not decide which rows are kept
+            sampled = list(
+                pks.filter(pk__in=RawSQL(sample_sql, params)).order_by(shuffle)[
+                    : size * SAMPLE_OVERSAMPLE
+                ]
+            )
+            if len(sampled) >= size or percent >= 100:
+                sampled.sort()
+                picked = random.Random(seed).sample(sampled, min(size, len(sampled)))
+                return picked, f"tablesample_{sample_method.lower()}"
+            percent = min(100.0, percent * SAMPLE_OVERSAMPLE)
+
+    pk_field = model._meta.pk
+    if pk_field.is_relation:
+        pk_field = pk_field.target_field
+    if not isinstance(pk_field, IntegerField):
+        return list(pks.order_by("?")[:size]), "random_order"
+
+    rng = random.Random(seed)
+    bounds = model._default_manager.using(queryset.db).aggregate(
+        low=Min("pk"), high=Max("pk")
+    )
+    if bounds["low"] is None:
+        return [], "pk_probe"
+    low, high = bounds["low"], bounds["high"]
+
+    if high - low + 1 <= size * SAMPLE_OVERSAMPLE:
+        # Few enough pks to read them all and sample them exactly
+        population = list(pks.order_by("pk"))
+        return rng.sample(population, min(size, len(population))), "pk_probe"
+
+    sampled: dict[Any, None] = {}
+    probes = size * SAMPLE_OVERSAMPLE
+    for _ in range(SAMPLE_PROBE_ROUNDS):
+        candidates = list(dict.fromkeys(rng.randint(low, high) for _ in range(probes)))
+        existing = queryset.only("pk").in_bulk(candidates)
+        for pk in candidates:
+            if pk in existing:
+                sampled.setdefault(pk)
+                if len(sampled) == size:
+                    return list(sampled), "pk_probe"
+        # Size the next round from this round's hit rate
+        hit_rate = max(len(existing) / len(candidates), 1 / SAMPLE_MAX_PROBES)
+        probes = min(
+            SAMPLE_MAX_PROBES,
+            int((size - len(sampled)) * SAMPLE_OVERSAMPLE / hit_rate),
+        )
+    return list(sampled), "pk_probe"
+
+
+def run_query_model(
+    app_label: str,
+    model_name: str,
+    filters: dict[str, Any] | None = None,
+    order_by: list[str] | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+    max_value_length: int | None = None,
+    count_mode: str | None = None,
+    count_cap: int | None = None,
+    emit_rows: Callable[[dict[str, Any], int, int | None], None] | None = None,
+    chunk_size: int = 500,
+    database: str | None = None,
+    timeout: float | None = None,
+    format: str = "rows",
+    sample: int | None = None,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    """
+    Run a query_model query synchronously; see query_model for the arguments.
+
+    With ``emit_rows``, rows are read with ``QuerySet.iterator(chunk_size)`` and
+    passed to ``emit_rows(chunk, rows_sent, total_count)`` one chunk at a time
+    instead of being collected in the result, so memory stays flat however many
+    rows are read. Each chunk is a dictionary with a "rows" list, plus
+    "columns" and "dictionaries" in the columns format. Queries are aborted
+    after ``timeout`` seconds.
+
+    Returns:
+        Dictionary containing query results or error message.
+    """
+    started = time.perf_counter()
+    try:
+        # Get the model
+        try:
+            model = apps.get_model(app_label, model_name)
+        except LookupError:
+            return {"error": f"Model '{app_label}.{model_name}' not found"}
+
+        try:
+            alias = get_database_alias(database, model)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        # Enforce maximum limit for safety
+        if emit_rows is None:
+            max_limit = 1000
+        else:
+            max_limit = get_env_number("DJANGO_MCP_STREAM_MAX_ROWS", 100000)
+        actual_limit = min(limit, max_limit) if limit else 100
+        if sample is not None:
+            if sample < 1:
+                return {"error": "sample must be greater than 0"}
+            if cursor:
+                return {"error": "Cursors are not supported with sample"}
+            actual_limit = min(sample, max_limit)
+
+        if max_value_length is not None and max_value_length < 1:
+            return {"error": "max_value_length must be greater than 0"}
+
+        if count_mode is None:
+            # Counting every matching row would defeat the point of sampling
+            count_mode = "none" if sample is not None else "exact"
+        if count_mode not in ("exact", "estimate", "none"):
+            return {
+                "error": f"Invalid count_mode '{count_mode}': expected exact, estimate or none"
+            }
+        if count_cap is not None and count_cap < 1:
+            return {"error": "count_cap must be greater than 0"}
+        if chunk_size < 1:
+            return {"error": "chunk_size must be greater than 0"}
+        if format not in ("rows", "columns"):
+            return {"error": f"Invalid format '{format}': expected rows or columns"}
+
+        try:
+            plan = compile_row_serializer(
+                model, tuple(fields) if fields is not None else None, max_value_length
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+
+        # Fetch the related objects needed for "<field>_str" up front so
+        # serialization runs a constant number of queries
+        queryset = model.objects.using(alias).prefetch_related(*plan.prefetch_related)
+        if plan.select_related:
+            # select_related() without arguments would follow every foreign key
+            queryset = queryset.select_related(*plan.select_related)
+
+        # Push projection and truncation of long text values down to SQL
+        if plan.projection is not None:
+            queryset = queryset.only(*plan.projection)
+        elif plan.sql_truncated:
+            queryset = queryset.defer(*[field.name for field in plan.sql_truncated])
+        for field in plan.sql_truncated:
+            queryset = queryset.annotate(
+                **{
+                    f"mcp_left_{field.name}": Left(field.name, max_value_length),
+                    f"mcp_length_{field.name}": Length(field.name),
+                }
+            )
+
+        # Apply filters if provided
+        if filters:
+            try:
+                queryset = queryset.filter(**filters)
+            except Exception as e:
+                return {"error": f"Invalid filter parameters: {str(e)}"}
+
+        # Apply ordering if provided
+        if order_by:
+            try:
+                queryset = queryset.order_by(*order_by)
+            except Exception as e:
+                return {"error": f"Invalid order_by parameters: {str(e)}"}
+
+        # Order by the keyset (ordering plus pk) so pages can be resumed from a cursor
+        ordering = get_keyset_ordering(model, order_by)
+        if ordering is not None:
+            try:
+                queryset = queryset.annotate(
+                    **{
+                        f"mcp_cursor_{i}": F(term.lstrip("-"))
+                        for i, term in enumerate(ordering)
+                    }
+                ).order_by(*keyset_order_expressions(model, ordering))
+            except Exception as e:
+                return {"error": f"Invalid order_by parameters: {str(e)}"}
+            query_id = _keyset_query_id(app_label, model_name, filters, ordering)
+
+        cursor_values = None
+        if cursor:
+            if ordering is None:
+                return {"error": "Cursors are not supported with random ordering"}
+            try:
+                cursor_values = decode_query_cursor(cursor, query_id)
+            except ValueError as e:
+                return {"error": str(e)}
+
+        if format == "columns":
+            serialize_row = plan.serialize_values
+            encode_chunk = partial(encode_columns, plan)
+        else:
+            serialize_row = plan.serialize
+
+            def encode_chunk(rows):
+                return {"rows": rows}
+
+        query_counter = QueryCounter()
+        with (
+            read_only_transaction(alias),
+            statement_timeout(alias, timeout) as deadline,
+            connections[alias].execute_wrapper(query_counter),
+        ):
+            if emit_rows is not None and deadline is not None:
+                # Waiting on the client between fetches does not count against the query
+                emit_rows = deadline.excluding(emit_rows)
+
+            # Get total count before limiting
+            total_count = None
+            count_source = "none"
+            total_count_capped = False
+            if count_mode == "estimate":
+                estimate = estimate_queryset_count(queryset, bool(filters))
+                if estimate is not None:
+                    total_count, count_source = estimate
+            if count_mode != "none" and count_source == "none":
+                count_source = "exact"
+                if count_cap is None:
+                    total_count = queryset.count()
+                else:
+                    # Stop counting once the cap is exceeded
+                    total_count = (
+                        queryset.order_by().values("pk")[: count_cap + 1].count()
+                    )
+                    total_count_capped = total_count > count_cap
+                    total_count = min(total_count, count_cap)
+
+            # Restrict the query to randomly picked rows
+            sample_method = None
+            if sample is not None:
+                sampled_pks, sample_method = sample_queryset_pks(
+                    model.objects.using(alias).filter(**(filters or {})),
+                    actual_limit,
+                    seed,
+                    filtered=bool(filters),
+                )
+                queryset = queryset.filter(pk__in=sampled_pks)
+
+            # Seek past the cursor row instead of using OFFSET
+            if cursor_values is not None:
+                queryset = queryset.filter(
+                    keyset_seek_filter(model, ordering, cursor_values)
+                )
+
+            # Limit results, fetching one extra row to know if there is a next page
+            rows = queryset[: actual_limit + 1]
+            if emit_rows is not None:
+                # Server-side cursors on PostgreSQL; prefetches run per chunk
+                rows = rows.iterator(chunk_size=chunk_size)
+
+            # Convert queryset to list of dictionaries (or value lists for columns)
+            results: list[Any] = []
+            returned_count = 0
+            last_obj = None
+            has_more = False
+            for obj in rows:
+                if returned_count == actual_limit:
+                    has_more = True
+                    break
+                results.append(serialize_row(obj))
+                returned_count += 1
+                last_obj = obj
+                if emit_rows is not None and len(results) == chunk_size:
+                    emit_rows(encode_chunk(results), returned_count, total_count)
+                    results = []
+
+            if emit_rows is not None and results:
+                emit_rows(encode_chunk(results), returned_count, total_count)
+                results = []
+
+        response = {
+            "app": app_label,
+            "model": model_name,
+            "database": alias,
+            "total_count": total_count,
+            "total_count_capped": total_count_capped,
+            "count_source": count_source,
+            "returned_count": returned_count,
+            "limit": actual_limit,
+            "filters": filters or {},
+            "order_by": order_by or [],
+            "fields": [field.name for field in plan.fields]
+            if fields is not None
+            else None,
+            "max_value_length": max_value_length,
+            "query_count": query_counter.count,
+            "next_cursor": (
+                encode_query_cursor(
+                    query_id,
+                    [
+                        getattr(last_obj, f"mcp_cursor_{i}")
+                        for i in range(len(ordering))
+                    ],
+                )
+                if has_more and ordering is not None
+                else None
+            ),
+            "streamed": emit_rows is not None,
+            "sample": sample,
+            "seed": seed,
+            "sample_method": sample_method,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            "format": format,
+            "results": results,
+        }
+        if format == "columns" and emit_rows is None:
+            encoded = encode_chunk(results)
+            response["columns"] = encoded["columns"]
+            response["dictionaries"] = encoded["dictionaries"]
+            response["results"] = encoded["rows"]
+        return response
+
+    except QueryTimeout as e:
+        return e.as_result()
+    except Exception as e:
+        return {"error": f"Error executing query: {str(e)}"}
+
+
+async def query_model(
+    app_label: str,
+    model_name: str,
+    filters: dict[str, Any] | None = None,
+    order_by: list[str] | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+    max_value_length: int | None = None,
+    count_mode: Literal["exact", "estimate", "none"] | None = None,
+    count_cap: int | None = None,
+    format: Literal["rows", "columns"] = "rows",
+    sample: int | None = None,
+    seed: int | None = None,
+    stream: bool = False,
+    chunk_size: int = 500,
+    database: str | None = None,
+    include_sql_stats: bool = False,
+    ctx: Context | None = None,
+) -> dict[str, Any]:
+    """
+    Query a Django model with read-only operations using the Django ORM manager.
+
+    Results are paginated with keyset cursors: each page carries a ``next_cursor``
+    encoding the last row's ordering key values plus its pk, and the next page is
+    selected with a seek predicate on those values instead of an OFFSET, so page N
+    costs the same as page 1.
+
+    With ``stream``, rows are read in chunks with a server-side cursor and sent
+    as MCP progress notifications while the query runs (each message is a JSON
+    object with a "rows" list); the final result then only carries the metadata.
+    Clients that do not request progress get a regular response.
+
+    With format="columns", field names are sent once in a "columns" header and
+    each row is an array of values in that order, which makes wide results
+    much smaller. The header is the same for every row and streamed chunk;
+    values a row does not have are null. Foreign key "<field>_str" values are
+    dictionary-encoded: the row holds an index into
+    "dictionaries"["<field>_str"].
+
+    Args:
+        app_label: The app label (e.g., "blog")
+        model_name: The model name (e.g., "Post")
+        filters: Optional dictionary of field lookups (e.g., {"status": "published", "featured": true})
+        order_by: Optional list of fields to order by (e.g., ["-created_at", "title"])
+        limit: Maximum number of results to return (default: 100, max: 1000)
+        cursor: Optional next_cursor from a previous call with the same arguments, to fetch the next page
+        fields: Optional list of field names to return (e.g., ["title", "author"]); only these columns are loaded from the database, and the pk is always included
+        max_value_length: Optional maximum length of string and binary values; longer values are cut (text in SQL) and marked with a truncation suffix
+        count_mode: How to compute total_count: "exact" (COUNT query), "estimate" (PostgreSQL planner or table statistics, falling back to exact elsewhere) or "none" (skip counting) (default: "none" with sample, "exact" otherwise)
+        count_cap: Optional maximum for an exact count; larger results report the cap with total_count_capped set
+        format: "rows" for a list of dictionaries or "columns" for a column header plus one array per row (default: "rows")
+        sample: Optional number of random rows to return instead of the first rows (max: 1000); picked without sorting the table (TABLESAMPLE on PostgreSQL, random pk probing elsewhere), and returned in the usual ordering without a next_cursor
+        seed: Optional integer seed making a sample repeatable while the table does not change
+        stream: Whether to stream rows in chunks through progress notifications (default: False); the limit cap is then DJANGO_MCP_STREAM_MAX_ROWS (default: 100000)
+        chunk_size: Number of rows per streamed chunk (default: 500)
+        database: Optional database alias to read from (default: DJANGO_MCP_DATABASE or the DATABASE_ROUTERS choice)
+        include_sql_stats: Whether to add statistics on the SQL queries run by this call under sql_stats (default: False)
+
+    Returns:
+        Dictionary containing query results or error message.
+    """
+
+    emit_rows = None
+    request_context = ctx.request_context if ctx is not None else None
+    if (
+        stream
+        and request_context is not None
+        and request_context.meta is not None
+        and request_context.meta.progressToken is not None
+    ):
+        report_progress = async_to_sync(ctx.report_progress)
+
+        def emit_rows(chunk, rows_sent, total_count):
+            report_progress(
+                progress=rows_sent,
+                total=total_count,
+                message=json.dumps(chunk),
+            )
+
+    query_arguments = {
+        "filters": filters,
+        "order_by": order_by,
+        "limit": limit,
+        "cursor": cursor,
+        "fields": fields,
+        "max_value_length": max_value_length,
+        "count_mode": count_mode,
+        "count_cap": count_cap,
+        "format": format,
+        "sample": sample,
+        "seed": seed,
+        "database": database,
+    }
+
+    async def execute_query():
+        return await sync_to_async(run_with_sql_stats)(
+            partial(
+                run_query_model,
+                app_label,
+                model_name,
+                **query_arguments,
+                emit_rows=emit_rows,
+                chunk_size=chunk_size,
+                timeout=get_tool_timeout("query_model"),
+            ),
+            include_sql_stats,
+        )
+
+    if emit_rows is not None or include_sql_stats or (sample and seed is None):
+        # Streamed rows are sent as they are read, statistics describe this
+        # call's queries and unseeded samples differ on every call, so none of
+        # them are cached
+        return await execute_query()
+
+    return await cached_tool_result(
+        ToolResultCache.make_key(
+            "query_model",
+            app_label=app_label,
+            model_name=model_name,
+            **query_arguments,
+        ),
+        lambda: get_model_dependencies(app_label, model_name),
+        execute_query,
+    )
+
+
+async def batch_query(
+    queries: list[dict[str, Any]],
+    database: str | None = None,
+    include_sql_stats: bool = False,
+) -> dict[str, Any]:
+    """
+    Run several query_model queries in one call, against one consistent snapshot.
+
+    Use this instead of a series of query_model calls when building one picture
+    from several models (e.g. a post, its comments, its author and its tags).
+    All queries run in one worker thread on one database connection, inside a
+    single read-only transaction at the REPEATABLE READ isolation level where
+    supported, so their results are consistent with each other.
+
+    Args:
+        queries: List of query_model arguments, one dictionary per query (e.g., [{"app_label": "blog", "model_name": "Post", "filters": {"pk": 1}}, {"app_label": "blog", "model_name": "Comment", "filters": {"post": 1}}]); accepted keys are app_label, model_name, filters, order_by, limit, cursor, fields, max_value_length, count_mode, count_cap, format, sample and seed
+        database: Optional database alias to read from (default: DJANGO_MCP_DATABASE or the DATABASE_ROUTERS choice, which must be the same for every model)
+        include_sql_stats: Whether to add statistics on the SQL queries run by this call under sql_stats (default: False)
+
+    Returns:
+        Dictionary containing one query_model result per query, in order, or an error message.
+    """
+
+    def execute_batch():
+        if not queries:
+            return {"error": "No queries given"}
+        if len(queries) > BATCH_QUERY_MAX_QUERIES:
+            return {
+                "error": f"Too many queries: {len(queries)} (max: {BATCH_QUERY_MAX_QUERIES})"
+            }
+
+        aliases = set()
+        for i, query in enumerate(queries):
+            unexpected = set(query) - set(BATCH_QUERY_ARGUMENTS)
+            if unexpected:
+                return {
+                    "error": f"Invalid query #{i}: unexpected keys {', '.join(sorted(unexpected))}"
+                }
+            if "app_label" not in query or "model_name" not in query:
+                return {
+                    "error": f"Invalid query #{i}: app_label and model_name are required"
+                }
+            try:
+                model = apps.get_model(query["app_label"], query["model_name"])
+            except LookupError:
+                # Reported in the query's own result
+                model = None
+            try:
+                aliases.add(get_database_alias(database, model))
+            except ValueError as e:
+                return {"error": str(e)}
+
+        if len(aliases) > 1:
+            return {
+                "error": "Queries are routed to different databases "
+                f"({', '.join(sorted(aliases))}); pass database to choose one"
+            }
+        alias = aliases.pop()
+
+        try:
+            with read_only_transaction(alias, repeatable_read=True):
+                results = [
+                    run_query_model(
+                        **query,
+                        database=alias,
+                        timeout=get_tool_timeout("batch_query"),
+                    )
+                    for query in queries
+                ]
+        except Exception as e:
+            return {"error": f"Error executing batch: {str(e)}"}
+
+        return {
+            "database": alias,
+            "query_count": sum(result.get("query_count", 0) for result in results),
+            "results": results,
+        }
+
+    return await sync_to_async(run_with_sql_stats)(execute_batch, include_sql_stats)
+
+
+def parse_aggregate_spec(spec: str):
+    """
+    Turn an aggregate spec like "sum:view_count" or "count" into an aggregate expression.
+
+    Raises:
+        ValueError: If the function is unknown or a field is missing
+    """
+    function_name, _, field_name = spec.partition(":")
+    function_name = function_name.strip().lower()
+    field_name = field_name.strip()
+
+    if function_name not in AGGREGATE_FUNCTIONS:
+        raise ValueError(
+            f"Invalid aggregate '{spec}': function must be one of "
+            f"{', '.join(AGGREGATE_FUNCTIONS)}"
+        )
+    if not field_name:
+        if function_name != "count":
+            raise ValueError(
+                f"Invalid aggregate '{spec}': expected '{function_name}:<field>'"
+            )
+        field_name = "pk"
+    return AGGREGATE_FUNCTIONS[function_name](field_name)
+
+
+async def aggregate_model(
+    app_label: str,
+    model_name: str,
+    group_by: list[str] | None = None,
+    aggregates: dict[str, str] | None = None,
+    date_trunc: dict[str, str] | None = None,
+    filters: dict[str, Any] | None = None,
+    order_by: list[str] | None = None,
+    limit: int = 100,
+    database: str | None = None,
+    include_sql_stats: bool = False,
+) -> dict[str, Any]:
+    """
+    Group and aggregate a Django model in the database with a single query.
+
+    Use this instead of fetching rows with query_model and counting them, e.g.
+    "how many posts per status per month". The arguments are translated into one
+    ``values().annotate()`` query, so the cost does not depend on how many rows
+    are read.
+
+    Args:
+        app_label: The app label (e.g., "blog")
+        model_name: The model name (e.g., "Post")
+        group_by: Optional list of fields to group by (e.g., ["status", "author__username"])
+        aggregates: Optional mapping of result name to "function:field" (e.g., {"posts": "count", "views": "sum:view_count", "authors": "count_distinct:author"}); functions are count, count_distinct, sum, avg, min and max (default: {"count": "count"})
+        date_trunc: Optional mapping of date/datetime field to truncation kind (year, quarter, month, week, day, hour or minute) to group by, returned as "<field>_<kind>" (e.g., {"published_at": "month"})
+        filters: Optional dictionary of field lookups applied before grouping
+        order_by: Optional list of group or aggregate names to order by (e.g., ["-posts"]); defaults to the group fields
+        limit: Maximum number of groups to return (default: 100, max: 1000)
+        database: Optional database alias to read from (default: DJANGO_MCP_DATABASE or the DATABASE_ROUTERS choice)
+        include_sql_stats: Whether to add statistics on the SQL queries run by this call under sql_stats (default: False)
+
+    Returns:
+        Dictionary containing one row per group with its aggregate values, or an error message.
+    """
+
+    def execute_aggregate():
+        started = time.perf_counter()
+        try:
+            try:
+                model = apps.get_model(app_label, model_name)
+            except LookupError:
+                return {"error": f"Model '{app_label}.{model_name}' not found"}
+
+            try:
+                alias = get_database_alias(database, model)
+            except ValueError as e:
+                return {"error": str(e)}
+
+            actual_limit = min(limit, 1000) if limit else 100
+
+            try:
+                annotations = {
+                    name: parse_aggregate_spec(spec)
+                    for name, spec in (aggregates or {"count": "count"}).items()
+                }
+            except ValueError as e:
+                return {"error": str(e)}
+
+            truncated_dates = {}
+            for field_name, kind in (date_trunc or {}).items():
+                if kind not in DATE_TRUNC_KINDS:
+                    return {
+                        "error": f"Invalid date_trunc kind '{kind}' for '{field_name}': "
+                        f"expected one of {', '.join(DATE_TRUNC_KINDS)}"
+                    }
+                truncated_dates[f"{field_name.replace(LOOKUP_SEP, '_')}_{kind}"] = (
+                    Trunc(field_name, kind)
+                )
+
+            group_names = list(group_by or []) + list(truncated_dates)
+            clashes = set(group_names) & set(annotations)
+            if clashes:
+                return {
+                    "error": f"Aggregate names clash with group fields: {', '.join(sorted(clashes))}"
+                }
+
+            queryset = model.objects.using(alias)
+            if filters:
+                try:
+                    queryset = queryset.filter(**filters)
+                except Exception as e:
+                    return {"error": f"Invalid filter parameters: {str(e)}"}
+
+            try:
+                with (
+                    read_only_transaction(alias),
+                    statement_timeout(alias, get_tool_timeout("aggregate_model")),
+                ):
+                    if group_names:
+                        # Clearing the default ordering keeps Meta.ordering out of GROUP BY
+                        queryset = (
+                            queryset.order_by()
+                            .values(*(group_by or []), **truncated_dates)
+                            .annotate(**annotations)
+                            .order_by(*(order_by or group_names))
+                        )
+                        rows = list(queryset[: actual_limit + 1])
+                    else:
+                        rows = [queryset.aggregate(**annotations)]
+            except QueryTimeout as e:
+                return e.as_result()
+            except Exception as e:
+                return {"error": f"Invalid aggregation parameters: {str(e)}"}
+
+            results = [
+                {
+                    key: value
+                    if value is None or isinstance(value, (str, int, float, bool))
+                    else str(value)
+                    for key, value in row.items()
+                }
+                for row in rows[:actual_limit]
+            ]
+
+            return {
+                "app": app_label,
+                "model": model_name,
+                "database": alias,
+                "group_by": group_names,
+                "aggregates": aggregates or {"count": "count"},
+                "filters": filters or {},
+                "order_by": order_by or group_names,
+                "returned_count": len(results),
+                "limit": actual_limit,
+                "truncated": len(rows) > actual_limit,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+                "results": results,
+            }
+
+        except Exception as e:
+            return {"error": f"Error executing aggregation: {str(e)}"}
+
+    return await sync_to_async(run_with_sql_stats)(execute_aggregate, include_sql_stats)
+
+
+def get_indexed_field_names(model) -> set[str]:
+    """
+    Names of the model's fields that lead an index, so a lookup or ordering on them can use it.
+
+    Covers the primary key, unique and ``db_index`` fields (including foreign
+    keys), and the first field of ``Meta.indexes``, ``Meta.unique_together``
+    and ``UniqueConstraint`` entries. Expression indexes are skipped.
+    """
+    indexed = {model._meta.pk.name}
+    for field in model._meta.concrete_fields:
+        if field.unique or field.db_index:
+            indexed.add(field.name)
+    for index in model._meta.indexes:
+        if index.fields:
+            indexed.add(index.fields[0].lstrip("-"))
+    for fields in model._meta.unique_together:
+        indexed.add(fields[0])
+    for constraint in model._meta.constraints:
+        if getattr(constraint, "fields", None):
+            indexed.add(constraint.fields[0])
+    return indexed
+
+
+def get_unindexed_lookup_fields(model, lookups: Iterable[str]) -> list[str]:
+    """
+    Field paths of lookups like "author__username" or "-created_at" whose column does not lead an index.
+
+    Relations are followed, so "author__username" is checked against the
+    author model's ``username`` field rather than the local foreign key.
+    Trailing lookups and transforms ("__icontains", "__year") are ignored.
+    Many-to-many and generic relations join through their own indexed keys
+    and are never reported.
+    """
+    indexed_by_model: dict[Any, set[str]] = {}
+    unindexed = []
+    for lookup in lookups:
+        owner, field, path = model, None, []
+        for part in lookup.lstrip("-").split(LOOKUP_SEP):
+            target = owner if field is None else field.related_model
+            if target is None:
+                break
+            try:
+                next_field = target._meta.get_field(
+                    target._meta.pk.name if part == "pk" else part
+                )
+            except FieldDoesNotExist:
+                break
+            owner, field = target, next_field
+            path.append(field.name)
+        if field is None:
+            continue
+
+        if field.many_to_many or (not field.concrete and not field.auto_created):
+            continue
+        if not field.concrete:
+            # Reverse relations join on the related model's foreign key
+            owner, name = field.related_model, field.field.name
+        else:
+            name = field.name
+
+        if owner not in indexed_by_model:
+            indexed_by_model[owner] = get_indexed_field_names(owner)
+        field_path = LOOKUP_SEP.join(path)
+        if name not in indexed_by_model[owner] and field_path not in unindexed:
+            unindexed.append(field_path)
+    return unindexed
+
+
+def _walk_postgresql_plan(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk_postgresql_plan(child)
+
+
+def find_plan_warnings(
+    vendor: str,
+    plan: Any,
+    table: str,
+    unindexed_filters: list,
+    unindexed_ordering: list,
+) -> list[dict[str, Any]]:
+    """
+    Flag sequential scans and sorts in a query plan.
+
+    PostgreSQL plans are read from their JSON form and SQLite plans from their
+    text form; other backends are not inspected. Scans and sorts on the queried
+    table list the filter and ordering fields that have no index.
+    """
+    warnings = []
+    if vendor == "postgresql":
+        for node in _walk_postgresql_plan(plan[0]["Plan"]):
+            if node["Node Type"] == "Seq Scan":
+                warnings.append(
+                    {
+                        "kind": "sequential_scan",
+                        "table": node.get("Relation Name"),
+                        "detail": node.get("Filter"),
+                    }
+                )
+            elif node["Node Type"] in ("Sort", "Incremental Sort"):
+                warnings.append(
+                    {
+                        "kind": "sort",
+                        "table": table,
+                        "detail": ", ".join(node.get("Sort Key", [])),
+                    }
+                )
+    elif vendor == "sqlite":
+        for line in plan.splitlines():
+            scan = re.search(r"\bSCAN (?:TABLE )?(\w+)(.*)", line)
+            if scan and "USING" not in scan.group(2):
+                warnings.append(
+                    {"kind": "sequential_scan", "table": scan.group(1), "detail": line}
+                )
+            elif "USE TEMP B-TREE FOR" in line:
+                warnings.append({"kind": "sort", "table": table, "detail": line})
+
+    for warning in warnings:
+        if warning["table"] == table:
+            warning["unindexed_fields"] = (
+                unindexed_filters
+                if warning["kind"] == "sequential_scan"
+                else unindexed_ordering
+            )
+    return warnings
+
+
+async def explain_query(
+    app_label: str,
+    model_name: str,
+    filters: dict[str, Any] | None = None,
+    order_by: list[str] | None = None,
+    limit: int = 100,
+    analyze: bool = False,
+    timeout: float | None = None,
+    database: str | None = None,
+    include_sql_stats: bool = False,
+) -> dict[str, Any]:
+    """
+    Show the SQL and the database query plan for a query_model query.
+
+    Use this to find out why a filter is slow: sequential scans and sorts in
+    the plan are flagged, together with the filter and ordering fields that are
+    not covered by the model's indexes (primary key, unique and db_index
+    fields, Meta.indexes and unique constraints).
+
+    Args:
+        app_label: The app label (e.g., "blog")
+        model_name: The model name (e.g., "Post")
+        filters: Optional dictionary of field lookups, as in query_model
+        order_by: Optional list of fields to order by, as in query_model
+        limit: Maximum number of rows, as in query_model (default: 100, max: 1000)
+        analyze: Whether to run the query and report actual timings (EXPLAIN ANALYZE; PostgreSQL, MySQL and MariaDB only) (default: False)
+        timeout: Seconds after which an analyzed query is aborted, 0 for no limit (default: DJANGO_MCP_TIMEOUT_EXPLAIN_QUERY or DJANGO_MCP_TIMEOUT, 30)
+        database: Optional database alias to read from (default: DJANGO_MCP_DATABASE or the DATABASE_ROUTERS choice)
+        include_sql_stats: Whether to add statistics on the SQL queries run by this call under sql_stats (default: False)
+
+    Returns:
+        Dictionary containing the SQL, its parameters, the plan and warnings, or an error message.
+    """
+
+    def get_plan():
+        started = time.perf_counter()
+        if timeout is not None and timeout < 0:
+            return {"error": "timeout must be 0 or greater"}
+        try:
+            try:
+                model = apps.get_model(app_label, model_name)
+            except LookupError:
+                return {"error": f"Model '{app_label}.{model_name}' not found"}
+
+            try:
+                alias = get_database_alias(database, model)
+            except ValueError as e:
+                return {"error": str(e)}
+
+            actual_limit = min(limit, 1000) if limit else 100
+            vendor = connections[alias].vendor
+
+            # Build the same query as query_model
+            queryset = model.objects.using(alias)
+            try:
+                if filters:
+                    queryset = queryset.filter(**filters)
+            except Exception as e:
+                return {"error": f"Invalid filter parameters: {str(e)}"}
+            try:
+                ordering = get_keyset_ordering(model, order_by)
+                if ordering is not None:
+                    queryset = queryset.order_by(
+                        *keyset_order_expressions(model, ordering)
+                    )
+                elif order_by:
+                    queryset = queryset.order_by(*order_by)
+            except Exception as e:
+                return {"error": f"Invalid order_by parameters: {str(e)}"}
+            queryset = queryset[: actual_limit + 1]
+
+            explain_options = {"analyze": True} if analyze else {}
+            if vendor == "postgresql":
+                explain_options["format"] = "json"
+
+            sql, params = queryset.query.sql_with_params()
+            try:
+                with (
+                    read_only_transaction(alias),
+                    statement_timeout(
+                        alias,
+                        timeout
+                        if timeout is not None
+                        else get_tool_timeout("explain_query"),
+                    ),
+                ):
+                    plan = queryset.explain(**explain_options)
+            except QueryTimeout as e:
+                return e.as_result()
+            except (ValueError, NotSupportedError) as e:
+                return {"error": f"Cannot explain this query on {vendor}: {str(e)}"}
+            if vendor == "postgresql":
+                plan = json.loads(plan)
+
+            unindexed_filters = get_unindexed_lookup_fields(model, filters or {})
+            unindexed_ordering = get_unindexed_lookup_fields(
+                model, ordering or order_by or []
+            )
+
+            return {
+                "app": app_label,
+                "model": model_name,
+                "database": alias,
+                "vendor": vendor,
+                "sql": sql,
+                "params": [str(param) for param in params],
+                "analyze": analyze,
+                "plan": plan,
+                "warnings": find_plan_warnings(
+                    vendor,
+                    plan,
+                    model._meta.db_table,
+                    unindexed_filters,
+                    unindexed_ordering,
+                ),
+                "unindexed_filter_fields": unindexed_filters,
+                "unindexed_order_by_fields": unindexed_ordering,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            }
+
+        except Exception as e:
+            return {"error": f"Error explaining query: {str(e)}"}
+
+    return await sync_to_async(run_with_sql_stats)(get_plan, include_sql_stats)
+
+
+async def run_check(
+    app_labels: list[str] | None = None,
+    tags: list[str] | None = None,
+    deploy: bool = False,
+    fail_level: str = "ERROR",
+    databases: list[str] | None = None,
+    include_sql_stats: bool = False,
+) -> dict[str, Any]:
+    """
+    Run Django system checks to identify potential problems in the project.
+
+    Args:
+        app_labels: Optional list of app labels to check (e.g., ["blog", "auth"])
+        tags: Optional list of check tags to run (e.g., ["models", "compatibility"])
+        deploy: Whether to include deployment checks (default: False)
+        fail_level: Minimum message level that causes the check to fail: "CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG" (default: "ERROR")
+        databases: Optional list of database aliases to check (e.g., ["default"])
+        include_sql_stats: Whether to add statistics on the SQL queries run by this call under sql_stats (default: False)
+
+    Returns:
+        Dictionary containing check results with errors, warnings, and info messages.
+    """
+
+    def execute_checks():
+        from django.core.checks import run_checks
+        from django.core.checks.messages import (
+            DEBUG,
+            INFO,
+            WARNING,
+            ERROR,
+            CRITICAL,
+        )
+
+        try:
+            # Map fail_level string to Django check level constant
+            level_map = {
+                "DEBUG": DEBUG,
+                "INFO": INFO,
+                "WARNING": WARNING,
+                "ERROR": ERROR,
+                "CRITICAL": CRITICAL,
+            }
+            check_level = level_map.get(fail_level.upper(), ERROR)
+
+            # Get app_configs if app_labels provided
+            app_configs = None
+            if app_labels:
+                app_configs = [apps.get_app_config(label) for label in app_labels]
+
+            # Run the checks
+            messages = run_checks(
+                app_configs=app_configs,
+                tags=tags,
+                include_deployment_checks=deploy,
+                databases=databases or [],
+            )
+
+            # Organize messages by level
+            result = {
+                "success": True,
+                "checked_apps": app_labels or "all",
+                "tags": tags or "all",
+                "deploy_checks": deploy,
+                "fail_level": fail_level,
+                "total_issues": len(messages),
+                "critical": [],
+                "errors": [],
+                "warnings": [],
+                "info": [],
+                "debug": [],
+            }
+
+            # Categorize messages by level
+            for msg in messages:
+                message_dict = {
+                    "id": msg.id,
+                    "level": msg.level,
+                    "message": msg.msg,
+                    "hint": msg.hint or "",
+                    "obj": str(msg.obj) if msg.obj else "",
+                }
+
+                if msg.level >= CRITICAL:
+                    result["critical"].append(message_dict)
+                    result["success"] = False
+                elif msg.level >= ERROR:
+                    result["errors"].append(message_dict)
+                    if check_level <= ERROR:
+                        result["success"] = False
+                elif msg.level >= WARNING:
+                    result["warnings"].append(message_dict)
+                    if check_level <= WARNING:
+                        result["success"] = False
+                elif msg.level >= INFO:
+                    result["info"].append(message_dict)
+                    if check_level <= INFO:
+                        result["success"] = False
+                else:
+                    result["debug"].append(message_dict)
+                    if check_level <= DEBUG:
+                        result["success"] = False
+
+            # Add summary
+            result["summary"] = {
+                "critical_count": len(result["critical"]),
+                "error_count": len(result["errors"]),
+                "warning_count": len(result["warnings"]),
+                "info_count": len(result["info"]),
+                "debug_count": len(result["debug"]),
+            }
+
+            return result
+
+        except LookupError as e:
+            return {"error": f"App not found: {str(e)}"}
+        except Exception as e:
+            return {"error": f"Error running checks: {str(e)}"}
+
+    return await sync_to_async(run_with_sql_stats)(execute_checks, include_sql_stats)
+
+
+def decode_log_line(raw_line: bytes) -> str:
+    """Decode a raw log line the same way a text-mode UTF-8 reader would."""
+    return raw_line.removesuffix(b"\r").decode("utf-8", errors="replace")
+
+
+def iter_log_lines_reversed(
+    log_file: BinaryIO,
+    end: int,
+    start: int = 0,
+    block_size: int = LOG_TAIL_BLOCK_SIZE,
+) -> Iterator[str]:
+    """
+    Yield the lines of a binary log file between two byte offsets, newest first.
+
+    Fixed-size blocks are read backwards from ``end`` down to ``start``, so the
+    cost scales with the number of lines consumed rather than the file size.
+    Lines are split on raw newline bytes before decoding, which keeps multi-byte
+    UTF-8 sequences intact across block boundaries.
+
+    Args:
+        log_file: File object opened in binary mode
+        end: Byte offset to stop reading at (usually the file size)
+        start: Byte offset of the first line to include (default: 0)
+        block_size: Number of bytes read per seek (default: LOG_TAIL_BLOCK_SIZE)
+    """
+    position = end
+    pending = b""
+    at_last_line = True
+
+    while position > start:
+        read_size = min(block_size, position - start)
+        position -= read_size
+        log_file.seek(position)
+        block = log_file.read(read_size) + pending
+
+        parts = block.split(b"\n")
+        pending = parts[0]
+        for raw_line in reversed(parts[1:]):
+            # A trailing newline terminates the last line instead of starting a new one
+            if at_last_line:
+                at_last_line = False
+                if not raw_line:
+                    continue
+            yield decode_log_line(raw_line)
+
+    if end > start:
+        yield decode_log_line(pending)
+
+
+def iter_log_lines_forward(
+    log_file: BinaryIO,
+    start: int,
+    end: int,
+    block_size: int = LOG_TAIL_BLOCK_SIZE,
+) -> Iterator[tuple[str, int]]:
+    """
+    Yield complete lines of a binary log file between two byte offsets, oldest first.
+
+    Each item is a ``(line, next_offset)`` tuple where ``next_offset`` is the byte
+    offset right after the line's newline. A trailing line without a newline is
+    still being written and is not yielded.
+    """
+    position = start
+    pending = b""
+    log_file.seek(start)
+
+    while position < end:
+        block = log_file.read(min(block_size, end - position))
+        if not block:
+            break
+        position += len(block)
+
+        buffer = pending + block
+        buffer_offset = position - len(buffer)
+        index = 0
+        while (newline := buffer.find(b"\n", index)) != -1:
+            yield decode_log_line(buffer[index:newline]), buffer_offset + newline + 1
+            index = newline + 1
+        pending = buffer[index:]
+
+
+def encode_log_cursor(file_stat: os.stat_result, offset: int) -> str:
+    """Encode a file identity and byte offset into an opaque cursor string."""
+    payload = json.dumps(
+        [file_stat.st_dev, file_stat.st_ino, offset], separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_log_cursor(cursor: str) -> tuple[int, int, int]:
+    """
+    Decode a cursor produced by encode_log_cursor().
+
+    Returns:
+        Tuple of (device, inode, offset).
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        device, inode, offset = json.loads(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+    if not all(isinstance(value, int) for value in (device, inode, offset)):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    if offset < 0:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+    return device, inode, offset
+
+
+def _literal_log_pattern(literal: str) -> str:
+    """Escape literal formatter text, letting whitespace runs absorb field padding."""
+    return r"\s+".join(re.escape(part) for part in re.split(r"\s+", literal))
+
+
+def _datefmt_pattern(datefmt: str) -> str:
+    """Translate a strftime format into a regular expression."""
+    parts = []
+    for match in re.finditer(r"%(.)|([^%]+)", datefmt):
+        if match.group(1):
+            parts.append(STRFTIME_DIRECTIVE_PATTERNS.get(match.group(1), r"\S+"))
+        else:
+            parts.append(_literal_log_pattern(match.group(2)))
+    return "".join(parts)
+
+
+def _compile_log_format(fmt: str, style: str, datefmt: str) -> re.Pattern[str]:
+    """Compile a logging format string into a regex with one group per field."""
+    placeholder_re = LOG_FORMAT_PLACEHOLDER_RES.get(
+        style, LOG_FORMAT_PLACEHOLDER_RES["%"]
+    )
+    parts = []
+    seen_fields: set[str] = set()
+    position = 0
+
+    for match in placeholder_re.finditer(fmt):
+        parts.append(_literal_log_pattern(fmt[position : match.start()]))
+        position = match.end()
+
+        groups = match.groupdict()
+        field = groups.get("field") or groups.get("bare")
+        if not field:
+            # Escaped "%%", "{{", "}}" or "$$"
+            parts.append(re.escape(match.group(0)[0]))
+            continue
+
+        if field == "asctime":
+            field_pattern = _datefmt_pattern(datefmt)
+        else:
+            field_pattern = LOG_RECORD_FIELD_PATTERNS.get(field, ".*?")
+        has_width = re.search(r"\d", groups.get("spec") or "")
+
+        if field in seen_fields:
+            field_pattern = f"(?:{field_pattern})"
+        else:
+            field_pattern = f"(?P<{field}>{field_pattern})"
+            seen_fields.add(field)
+        # Fields with a width ("%(levelname)-8s") are padded with spaces
+        parts.append(rf"\s*{field_pattern}\s*" if has_width else field_pattern)
+
+    parts.append(_literal_log_pattern(fmt[position:]))
+    return re.compile("".join(parts))
+
+
+def _to_local_naive(value: datetime) -> datetime:
+    """Convert an aware datetime to naive local time, which is what asctime records."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def _parse_json_log_line(line: str) -> dict[str, str] | None:
+    """Map a JSON log line onto formatter field names, or return None if it is not one."""
+    if not line.startswith("{"):
+        return None
+    try:
+        payload = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+
+    fields = {}
+    for field, keys in JSON_LOG_FIELD_KEYS.items():
+        for key in keys:
+            if payload.get(key) is not None:
+                fields[field] = str(payload[key])
+                break
+    return fields
+
+
+def logger_matches(name: str, logger_prefix: str) -> bool:
+    """Check whether a logger is ``logger_prefix`` itself or one of its children."""
+    return name == logger_prefix or name.startswith(logger_prefix + ".")
+
+
+@dataclass(frozen=True)
+class LogFormat:
+    """
+    Parses lines written by a ``logging.Formatter`` back into their fields.
+
+    Text formats are compiled from the formatter's format string. JSON-lines
+    formats (one JSON object per record) are mapped onto the same field names:
+    ``levelname``, ``name``, ``message`` and ``asctime``.
+    """
+
+    line_re: re.Pattern[str]
+    datefmt: str
+    json_lines: bool = False
+
+    @classmethod
+    def from_config(cls, formatter_config: dict[str, Any] | None) -> LogFormat:
+        """Build a parser from a ``LOGGING["formatters"]`` entry (None means the default formatter)."""
+        formatter_config = formatter_config or {}
+        # logging.Formatter defaults: "%(message)s" and "2024-01-31 13:00:00,123" timestamps
+        fmt = formatter_config.get("format") or "%(message)s"
+        style = formatter_config.get("style", "%")
+        datefmt = formatter_config.get("datefmt") or DEFAULT_LOG_DATEFMT
+        factory = formatter_config.get("()") or formatter_config.get("class") or ""
+        json_lines = "json" in str(getattr(factory, "__name__", factory)).lower()
+        return cls(_compile_log_format(fmt, style, datefmt), datefmt, json_lines)
+
+    def detect_json_lines(self, file_path: Path) -> LogFormat:
+        """Switch to JSON-lines parsing if the file's first line is a JSON object."""
+        if self.json_lines:
+            return self
+
+        with file_path.open("rb") as log_file:
+            first_line = next(
+                iter_log_lines_forward(log_file, 0, LOG_PROBE_BLOCK_SIZE), None
+            )
+        if first_line is None or _parse_json_log_line(first_line[0]) is None:
+            return self
+        return LogFormat(self.line_re, self.datefmt, json_lines=True)
+
+    @property
+    def fields(self) -> frozenset[str]:
+        if self.json_lines:
+            return frozenset(JSON_LOG_FIELD_KEYS)
+        return frozenset(self.line_re.groupindex)
+
+    @property
+    def marks_headers(self) -> bool:
+        """Whether record first lines carry a field (asctime or levelname) continuation lines lack."""
+        return self.json_lines or not self.fields.isdisjoint({"asctime", "levelname"})
+
+    def parse(self, line: str) -> dict[str, str] | None:
+        """Return the fields of a record's first line, or None for continuation lines."""
+        if self.json_lines:
+            return _parse_json_log_line(line)
+        match = self.line_re.fullmatch(line)
+        return match.groupdict() if match else None
+
+    def timestamp(self, fields: dict[str, str] | None) -> datetime | None:
+        """Parse the asctime field of a record, if present."""
+        asctime = (fields or {}).get("asctime")
+        if not asctime:
+            return None
+        try:
+            return _to_local_naive(datetime.strptime(asctime, self.datefmt))
+        except ValueError:
+            if not self.json_lines:
+                return None
+        # JSON formatters commonly emit ISO 8601 timestamps
+        try:
+            return _to_local_naive(datetime.fromisoformat(asctime))
+        except ValueError:
+            return None
+
+
+@dataclass(frozen=True)
+class LogFilter:
+    """Record-level filter evaluated while log files are being scanned."""
+
+    log_format: LogFormat
+    min_level: int | None = None
+    logger_prefix: str | None = None
+    pattern: re.Pattern[str] | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+
+    @property
+    def has_time_window(self) -> bool:
+        return self.since is not None or self.until is not None
+
+    def missing_fields(self) -> list[str]:
+        """Return formatter fields the filter needs but the log format does not have."""
+        required = []
+        if self.min_level is not None:
+            required.append("levelname")
+        if self.logger_prefix is not None:
+            required.append("name")
+        if self.has_time_window:
+            required.append("asctime")
+        return [field for field in required if field not in self.log_format.fields]
+
+    def matches(self, record_lines: list[str], fields: dict[str, str] | None) -> bool:
+        """Check whether a (possibly multi-line) record passes every filter."""
+        fields = fields or {}
+
+        if self.min_level is not None:
+            level = logging.getLevelNamesMapping().get(fields.get("levelname", ""))
+            if level is None or level < self.min_level:
+                return False
+
+        if self.logger_prefix is not None:
+            name = fields.get("name")
+            if name is None or not logger_matches(name, self.logger_prefix):
+                return False
+
+        if self.has_time_window:
+            timestamp = self.log_format.timestamp(fields)
+            if timestamp is None:
+                return False
+            if self.since is not None and timestamp < self.since:
+                return False
+            if self.until is not None and timestamp > self.until:
+                return False
+
+        if self.pattern is not None:
+            return any(self.pattern.search(line) for line in record_lines)
+
+        return True
+
+
+def continues_traceback(line: str, previous_line: str) -> bool:
+    """
+    Check whether a line belongs to a traceback logged by the record before it.
+
+    Used for formats without header fields (e.g. the default "%(message)s"),
+    where every line parses as a record: the Traceback header, indented frame
+    and source lines, chain separators and the exception line that follows an
+    indented line stay with the record that logged them.
+    """
+    if not line or line[:1].isspace() or line.startswith(TRACEBACK_HEADER):
+        return True
+    if line in TRACEBACK_CHAIN_LINES:
+        return True
+    return (
+        previous_line[:1].isspace()
+        and TRACEBACK_EXCEPTION_RE.fullmatch(line) is not None
+    )
+
+
+def iter_log_records_reversed(
+    lines: Iterable[str], log_format: LogFormat
+) -> Iterator[tuple[list[str], dict[str, str] | None]]:
+    """
+    Group newest-first lines into records, newest first.
+
+    Yields ``(record_lines, fields)`` with the lines in chronological order.
+    Continuation lines (tracebacks, multi-line messages) are attached to the
+    first line that parses as a record header; lines left over at the start of
+    the scanned range are yielded with ``fields=None``.
+    """
+    marks_headers = log_format.marks_headers
+    record_lines: list[str] = []
+    lines = iter(lines)
+    line = next(lines, None)
+    while line is not None:
+        # Without header fields, the older neighbour decides if this line continues
+        older_line = next(lines, None)
+        record_lines.append(line)
+        fields = log_format.parse(line)
+        if (
+            fields is not None
+            and not marks_headers
+            and older_line is not None
+            and continues_traceback(line, older_line)
+        ):
+            fields = None
+        line = older_line
+        if fields is not None:
+            record_lines.reverse()
+            yield record_lines, fields
+            record_lines = []
+
+    if record_lines:
+        record_lines.reverse()
+        yield record_lines, None
+
+
+def iter_log_records_forward(
+    lines: Iterable[tuple[str, int]], log_format: LogFormat
+) -> Iterator[tuple[list[str], dict[str, str] | None, int]]:
+    """
+    Group ``(line, next_offset)`` pairs into records, oldest first.
+
+    Yields ``(record_lines, fields, next_offset)`` where ``next_offset`` is the
+    byte offset right after the record's last line.
+    """
+    marks_headers = log_format.marks_headers
+    record_lines: list[str] = []
+    record_fields: dict[str, str] | None = None
+    record_end = 0
+
+    for line, next_offset in lines:
+        fields = log_format.parse(line)
+        if (
+            fields is not None
+            and not marks_headers
+            and record_lines
+            and continues_traceback(line, record_lines[-1])
+        ):
+            fields = None
+        if fields is not None and record_lines:
+            yield record_lines, record_fields, record_end
+            record_lines = []
+        if not record_lines:
+            record_fields = fields
+        record_lines.append(line)
+        record_end = next_offset
+
+    if record_lines:
+        yield record_lines, record_fields, record_end
+
+
+def collect_recent_log_lines(
+    lines: Iterable[str], count: int, log_filter: LogFilter | None = None
+) -> list[str]:
+    """
+    Take up to ``count`` lines from a newest-first stream, keeping only matching records.
+
+    Only lines of matching records are buffered, and the scan stops as soon as
+    enough lines are collected. The result is newest first.
+    """
+    if log_filter is None:
+        return list(islice(lines, count))
+
+    collected: list[str] = []
+    for record_lines, fields in iter_log_records_reversed(lines, log_filter.log_format):
+        if not log_filter.matches(record_lines, fields):
+            continue
+        collected.extend(reversed(record_lines))
+        if len(collected) >= count:
+            return collected[:count]
+    return collected
+
+
+def parse_log_time(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp for comparison with log record timestamps.
+
+    Raises:
+        ValueError: If the value is not a valid ISO 8601 timestamp
+    """
+    try:
+        return _to_local_naive(datetime.fromisoformat(value))
+    except ValueError:
+        raise ValueError(f"Invalid timestamp '{value}': expected ISO 8601") from None
+
+
+def _next_line_start(log_file: BinaryIO, offset: int, end: int) -> int:
+    """Return the offset of the first line starting at or after ``offset``."""
+    if offset == 0:
+        return 0
+
+    position = offset - 1
+    log_file.seek(position)
+    while position < end:
+        block = log_file.read(min(LOG_PROBE_BLOCK_SIZE, end - position))
+        if not block:
+            break
+        newline = block.find(b"\n")
+        if newline != -1:
+            return position + newline + 1
+        position += len(block)
+    return end
+
+
+def _last_line_end(log_file: BinaryIO, end: int) -> int:
+    """Return the offset right after the last newline before ``end`` (0 if none)."""
+    position = end
+    while position > 0:
+        read_size = min(LOG_PROBE_BLOCK_SIZE, position)
+        position -= read_size
+        log_file.seek(position)
+        newline = log_file.read(read_size).rfind(b"\n")
+        if newline != -1:
+            return position + newline + 1
+    return 0
+
+
+def _probe_log_timestamp(
+    log_file: BinaryIO, offset: int, end: int, log_format: LogFormat
+) -> tuple[int, datetime | None]:
+    """
+    Find the first timestamped record starting at or after ``offset``.
+
+    Returns:
+        Tuple of (offset of the record's first line, its timestamp), or
+        ``(end, None)`` when no timestamped record follows.
+    """
+    line_start = _next_line_start(log_file, offset, end)
+    for line, next_offset in iter_log_lines_forward(
+        log_file, line_start, end, block_size=LOG_PROBE_BLOCK_SIZE
+    ):
+        timestamp = log_format.timestamp(log_format.parse(line))
+        if timestamp is not None:
+            return line_start, timestamp
+        line_start = next_offset
+    return end, None
+
+
+def find_log_offset(
+    log_file: BinaryIO,
+    end: int,
+    log_format: LogFormat,
+    is_past: Callable[[datetime], bool],
+    start: int = 0,
+) -> int:
+    """
+    Binary-search a log file for the first record whose timestamp satisfies ``is_past``.
+
+    Log files are appended in time order, so ``is_past`` (e.g. "timestamp >= since")
+    flips from False to True exactly once. Each probe aligns to the next line start
+    and reads forward only until it finds a timestamped record, so the search reads
+    O(log(size)) small blocks instead of the whole file.
+
+    Returns:
+        Byte offset of the first line of that record within ``[start, end)``,
+        or ``end`` if there is none.
+    """
+    low, high = start, end
+    while low < high:
+        middle = (low + high) // 2
+        record_start, timestamp = _probe_log_timestamp(
+            log_file, middle, end, log_format
+        )
+
+        if timestamp is None or is_past(timestamp):
+            high = middle
+        else:
+            # Every offset up to the probed record is before the target
+            low = max(middle, record_start) + 1
+
+    return _probe_log_timestamp(log_file, low, end, log_format)[0]
+
+
+def log_time_window_offsets(
+    log_file: BinaryIO, size: int, log_filter: LogFilter | None
+) -> tuple[int, int]:
+    """Return the byte range of a log file that can hold records in the filter's time window."""
+    if log_filter is None or not log_filter.has_time_window:
+        return 0, size
+
+    since, until = log_filter.since, log_filter.until
+    start = (
+        find_log_offset(log_file, size, log_filter.log_format, lambda ts: ts >= since)
+        if since is not None
+        else 0
+    )
+    end = (
+        find_log_offset(log_file, size, log_filter.log_format, lambda ts: ts > until)
+        if until is not None
+        else size
+    )
+    return start, max(start, end)
+
+
+def get_log_index_dir() -> Path:
+    """Return the directory holding sparse log index sidecars (DJANGO_MCP_LOG_INDEX_DIR)."""
+    configured_dir = os.environ.get("DJANGO_MCP_LOG_INDEX_DIR")
+    if configured_dir:
+        return Path(configured_dir).expanduser()
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "django-ai-boost" / "log-index"
+
+
+def update_log_index(
+    log_file: BinaryIO,
+    file_path: Path,
+    file_stat: os.stat_result,
+    log_format: LogFormat,
+) -> tuple[list[tuple[int, datetime]], dict[str, Any]]:
+    """
+    Load the sparse timestamp index of a log file and extend it to the current size.
+
+    The index holds one ``(offset, timestamp)`` entry per LOG_INDEX_BLOCK_SIZE
+    block: the first timestamped record starting in that block. It is stored as
+    JSON in the index directory, extended incrementally as the file grows, and
+    discarded when the file is rotated (device/inode change), truncated, or
+    written with a different format.
+
+    Returns:
+        Tuple of (entries, info) where info reports the index status ("hit",
+        "extended", "built" or "rebuilt"), build_ms, entries, size_bytes and
+        the process-wide hit_rate.
+    """
+    started = time.perf_counter()
+    index_path = (
+        get_log_index_dir()
+        / f"{hashlib.sha256(str(file_path).encode()).hexdigest()[:32]}.json"
+    )
+    identity = {
+        "device": file_stat.st_dev,
+        "inode": file_stat.st_ino,
+        "block_size": LOG_INDEX_BLOCK_SIZE,
+        "format": log_format.line_re.pattern,
+        "datefmt": log_format.datefmt,
+    }
+
+    try:
+        index = json.loads(index_path.read_text())
+    except (OSError, ValueError):
+        index = None
+
+    if index is None:
+        status = "built"
+    elif (
+        any(index.get(key) != value for key, value in identity.items())
+        or index.get("indexed_size", 0) > file_stat.st_size
+    ):
+        status = "rebuilt"
+        index = None
+    else:
+        status = "hit"
+
+    if index is None:
+        index = {
+            **identity,
+            "path": str(file_path),
+            "indexed_size": 0,
+            "next_block": 0,
+            "entries": [],
+        }
+
+    entries = index["entries"]
+    block_start = index["next_block"]
+    while block_start < file_stat.st_size:
+        record_start, timestamp = _probe_log_timestamp(
+            log_file, block_start, file_stat.st_size, log_format
+        )
+        if timestamp is None:
+            # The rest of the file has no complete timestamped record yet
+            break
+        if not entries or record_start > entries[-1][0]:
+            entries.append([record_start, timestamp.isoformat()])
+        block_start += LOG_INDEX_BLOCK_SIZE
+
+    if block_start != index["next_block"] or status != "hit":
+        index["next_block"] = block_start
+        index["indexed_size"] = file_stat.st_size
+        if status == "hit":
+            status = "extended"
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+            temporary_path.write_text(json.dumps(index, separators=(",", ":")))
+            os.replace(temporary_path, index_path)
+        except OSError as e:
+            logger.warning("Could not write log index %s: %s", index_path, e)
+
+    with LOG_INDEX_STATS_LOCK:
+        LOG_INDEX_STATS["lookups"] += 1
+        if status in ("hit", "extended"):
+            LOG_INDEX_STATS["hits"] += 1
+        hit_rate = LOG_INDEX_STATS["hits"] / LOG_INDEX_STATS["lookups"]
+
+    try:
+        size_bytes = index_path.stat().st_size
+    except OSError:
+        size_bytes = 0
+
+    info = {
+        "status": status,
+        "build_ms": round((time.perf_counter() - started) * 1000, 3),
+        "entries": len(entries),
+        "size_bytes": size_bytes,
+        "hit_rate": round(hit_rate, 3),
+    }
+    return [
+        (offset, datetime.fromisoformat(timestamp)) for offset, timestamp in entries
+    ], info
+
+
+def indexed_time_window_offsets(
+    log_file: BinaryIO,
+    file_path: Path,
+    file_stat: os.stat_result,
+    log_filter: LogFilter,
+) -> tuple[int, int, dict[str, Any]]:
+    """
+    Return the byte range for the filter's time window using the sparse log index.
+
+    Each bound is an index lookup that narrows the range to one index block,
+    followed by a short binary search inside that block.
+
+    Returns:
+        Tuple of (start, end, index info from update_log_index()).
+    """
+    entries, info = update_log_index(
+        log_file, file_path, file_stat, log_filter.log_format
+    )
+    offsets = [offset for offset, _ in entries]
+    timestamps = [timestamp for _, timestamp in entries]
+    size = file_stat.st_size
+
+    def locate(position: int, is_past: Callable[[datetime], bool]) -> int:
+        # Entry ``position`` is the first indexed record past the bound
+        low = offsets[position - 1] if position > 0 else 0
+        high = offsets[position] if position < len(offsets) else size
+        return find_log_offset(
+            log_file, high, log_filter.log_format, is_past, start=low
+        )
+
+    since, until = log_filter.since, log_filter.until
+    start = (
+        locate(bisect_left(timestamps, since), lambda ts: ts >= since)
+        if since is not None
+        else 0
+    )
+    end = (
+        locate(bisect_right(timestamps, until), lambda ts: ts > until)
+        if until is not None
+        else size
+    )
+    return start, max(start, end), info
+
+
+def find_rotated_log_files(file_path: Path) -> list[Path]:
+    """
+    Return the rotated siblings of a log file, newest first.
+
+    Recognizes the names produced by RotatingFileHandler (``app.log.1``),
+    TimedRotatingFileHandler (``app.log.2024-01-31`` and its hourly/minute
+    variants) and logrotate, optionally gzip-compressed (``app.log.2.gz``).
+    """
+    rotated: list[tuple[float, int, Path]] = []
+
+    for path in sorted(
+        file_path.parent.glob(glob.escape(file_path.name) + ".*"), reverse=True
+    ):
+        suffix_match = ROTATED_LOG_SUFFIX_RE.match(path.name[len(file_path.name) :])
+        if not suffix_match or not path.is_file():
+            continue
+
+        index = suffix_match.group("index")
+        rotated.append((path.stat().st_mtime, int(index) if index else 0, path))
+
+    # Newest first by modification time; numbered backups break ties (.1 before .2)
+    rotated.sort(key=lambda item: (-item[0], item[1]))
+    return [path for _, _, path in rotated]
+
+
+def tail_rotated_log_file(
+    file_path: Path, count: int, log_filter: LogFilter | None = None
+) -> tuple[list[str], bool]:
+    """
+    Return up to ``count`` of the most recent lines of a rotated log file, newest first.
+
+    Gzip archives cannot be read backwards, so they are streamed forward while
+    keeping only the last ``count`` matching lines in memory.
+
+    Returns:
+        Tuple of (lines, reached_since) where ``reached_since`` tells whether the
+        file holds records older than the filter's ``since`` bound, in which case
+        older rotated files cannot contain matches.
+    """
+    since = log_filter.since if log_filter is not None else None
+
+    if file_path.suffix == ".gz":
+        with gzip.open(file_path, "rb") as log_file:
+            if log_filter is None:
+                recent_raw_lines = deque(log_file, maxlen=count)
+                return [
+                    decode_log_line(raw_line.removesuffix(b"\n"))
+                    for raw_line in reversed(recent_raw_lines)
+                ], False
+
+            recent_lines: deque[str] = deque(maxlen=count)
+            reached_since = False
+            decoded_lines = (
+                (decode_log_line(raw_line.removesuffix(b"\n")), 0)
+                for raw_line in log_file
+            )
+            for record_lines, fields, _ in iter_log_records_forward(
+                decoded_lines, log_filter.log_format
+            ):
+                if since is not None and not reached_since:
+                    timestamp = log_filter.log_format.timestamp(fields)
+                    reached_since = timestamp is not None and timestamp < since
+                if log_filter.matches(record_lines, fields):
+                    recent_lines.extend(record_lines)
+            return list(reversed(recent_lines)), reached_since
+
+    with file_path.open("rb") as log_file:
+        size = os.fstat(log_file.fileno()).st_size
+        start, end = log_time_window_offsets(log_file, size, log_filter)
+        lines = collect_recent_log_lines(
+            iter_log_lines_reversed(log_file, end, start), count, log_filter
+        )
+        return lines, since is not None and start > 0
+
+
+def find_log_file_by_identity(file_path: Path, device: int, inode: int) -> Path | None:
+    """Find the uncompressed rotated sibling that used to be the live log file."""
+    for rotated_path in find_rotated_log_files(file_path):
+        if rotated_path.suffix == ".gz":
+            continue
+        rotated_stat = rotated_path.stat()
+        if (rotated_stat.st_dev, rotated_stat.st_ino) == (device, inode):
+            return rotated_path
+    return None
+
+
+def follow_log_lines(
+    log_file: BinaryIO,
+    offset: int,
+    end: int,
+    count: int,
+    lines: list[str],
+    log_filter: LogFilter | None = None,
+) -> tuple[int, bool]:
+    """
+    Append the lines written after ``offset`` to ``lines`` until it holds ``count`` lines.
+
+    Returns:
+        Tuple of (offset to resume from, whether more matching lines are available).
+    """
+    line_pairs = iter_log_lines_forward(log_file, offset, end)
+
+    if log_filter is None:
+        for line, next_offset in line_pairs:
+            if len(lines) == count:
+                return offset, True
+            lines.append(line)
+            offset = next_offset
+        return offset, False
+
+    for record_lines, fields, next_offset in iter_log_records_forward(
+        line_pairs, log_filter.log_format
+    ):
+        if log_filter.matches(record_lines, fields):
+            # Records are not split across calls unless one alone exceeds the budget
+            if lines and len(lines) + len(record_lines) > count:
+                return offset, True
+            lines.extend(record_lines[:count])
+        offset = next_offset
+    return offset, False
+
+
+def read_log_file(
+    file_path: Path,
+    count: int,
+    cursor: str | None = None,
+    include_rotated: bool = True,
+    log_filter: LogFilter | None = None,
+) -> dict[str, Any]:
+    """
+    Read lines from a log file, either as a tail or incrementally from a cursor.
+
+    Without a cursor the last ``count`` lines are returned. With a cursor, only
+    complete lines appended after the cursor's offset are returned (at most
+    ``count`` of them). If the file was rotated (different device/inode) or
+    truncated (smaller than the offset), reading restarts from the beginning
+    and the reset is reported in ``cursor_status``.
+
+    With ``include_rotated``, a tail that the live file cannot fill continues into
+    the rotated siblings newest first, and a cursor whose file was rotated away
+    first drains the rest of that file before moving to the new one.
+
+    With ``log_filter``, only the lines of matching records are returned. A time
+    window narrows the scanned byte range by binary search before reading; for
+    files of at least one index block the sparse sidecar index is used instead
+    and its statistics are returned under ``index``.
+
+    Args:
+        file_path: Path to the log file
+        count: Maximum number of lines to return
+        cursor: Optional cursor returned by a previous call
+        include_rotated: Whether to read rotated and gzip-compressed siblings (default: True)
+        log_filter: Optional record filter applied while scanning
+
+    Returns:
+        Dictionary with lines, the cursor for the next call, cursor_status
+        ("tail", "continued", "rotated" or "truncated"), more_available and
+        the rotated_files that contributed lines.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    position = decode_log_cursor(cursor) if cursor else None
+    rotated_files: list[str] = []
+
+    with file_path.open("rb") as log_file:
+        file_stat = os.fstat(log_file.fileno())
+        size = file_stat.st_size
+
+        if position is None:
+            index_info = None
+            if (
+                log_filter is not None
+                and log_filter.has_time_window
+                and size >= LOG_INDEX_BLOCK_SIZE
+            ):
+                start, end, index_info = indexed_time_window_offsets(
+                    log_file, file_path, file_stat, log_filter
+                )
+            else:
+                start, end = log_time_window_offsets(log_file, size, log_filter)
+            lines = collect_recent_log_lines(
+                iter_log_lines_reversed(log_file, end, start), count, log_filter
+            )
+            reached_since = (
+                log_filter is not None and log_filter.since is not None and start > 0
+            )
+
+            if include_rotated and len(lines) < count and not reached_since:
+                for rotated_path in find_rotated_log_files(file_path):
+                    rotated_lines, reached_since = tail_rotated_log_file(
+                        rotated_path, count - len(lines), log_filter
+                    )
+                    lines.extend(rotated_lines)
+                    rotated_files.append(str(rotated_path))
+                    if len(lines) >= count or reached_since:
+                        break
+
+            lines.reverse()
+            tail_result = {
+                "lines": lines,
+                # A trailing line without a newline is returned but may still be
+                # written; the cursor points at its start so follow mode re-reads it
+                "cursor": encode_log_cursor(file_stat, _last_line_end(log_file, size)),
+                "cursor_status": "tail",
+                "more_available": False,
+                "rotated_files": rotated_files,
+            }
+            if index_info is not None:
+                tail_result["index"] = index_info
+            return tail_result
+
+        device, inode, offset = position
+        lines = []
+
+        if (device, inode) != (file_stat.st_dev, file_stat.st_ino):
+            cursor_status = "rotated"
+            previous_path = (
+                find_log_file_by_identity(file_path, device, inode)
+                if include_rotated
+                else None
+            )
+
+            if previous_path is not None:
+                with previous_path.open("rb") as previous_file:
+                    previous_stat = os.fstat(previous_file.fileno())
+                    offset, more_available = follow_log_lines(
+                        previous_file,
+                        offset,
+                        previous_stat.st_size,
+                        count,
+                        lines,
+                        log_filter,
+                    )
+                if more_available:
+                    # The previous file is not drained yet; keep following it
+                    return {
+                        "lines": lines,
+                        "cursor": encode_log_cursor(previous_stat, offset),
+                        "cursor_status": cursor_status,
+                        "more_available": True,
+                        "rotated_files": [str(previous_path)],
+                    }
+                rotated_files.append(str(previous_path))
+
+            offset = 0
+        elif size < offset:
+            cursor_status, offset = "truncated", 0
+        else:
+            cursor_status = "continued"
+
+        offset, more_available = follow_log_lines(
+            log_file, offset, size, count, lines, log_filter
+        )
+
+    return {
+        "lines": lines,
+        "cursor": encode_log_cursor(file_stat, offset),
+        "cursor_status": cursor_status,
+        "more_available": more_available,
+        "rotated_files": rotated_files,
+    }
+
+
+def fingerprint_log_exception(
+    record_lines: list[str],
+) -> tuple[str, str, str, list[str]] | None:
+    """
+    Fingerprint the Python traceback in a log record.
+
+    The fingerprint is a SHA-1 of the exception type and the normalized frame
+    list (file and function, without line numbers), updated line by line. For
+    chained exceptions every traceback in the chain contributes.
+
+    Returns:
+        Tuple of (fingerprint, exception type, exception message, frames) or
+        None if the record has no traceback.
+    """
+    hasher = None
+    in_traceback = False
+    exception_type = exception_message = ""
+    frames: list[str] = []
+
+    for line in record_lines:
+        if line.startswith(TRACEBACK_HEADER):
+            hasher = hasher or hashlib.sha1()
+            in_traceback = True
+            continue
+        if not in_traceback:
+            continue
+
+        frame = TRACEBACK_FRAME_RE.fullmatch(line)
+        if frame:
+            normalized_frame = f"{frame['filename']}:{frame['function']}"
+            frames.append(normalized_frame)
+            hasher.update(normalized_frame.encode())
+            hasher.update(b"\n")
+            continue
+
+        exception = (
+            None if line[:1].isspace() else TRACEBACK_EXCEPTION_RE.fullmatch(line)
+        )
+        if exception:
+            exception_type = exception["type"]
+            exception_message = exception["message"] or ""
+            hasher.update(exception_type.encode())
+            hasher.update(b"\n")
+            in_traceback = False
+
+    if hasher is None:
+        return None
+    return hasher.hexdigest()[:16], exception_type, exception_message, frames
+
+
+def group_log_exceptions(
+    file_path: Path,
+    count: int,
+    log_format: LogFormat,
+    log_filter: LogFilter | None = None,
+    cursor: str | None = None,
+    include_rotated: bool = True,
+) -> dict[str, Any]:
+    """
+    Read a log file in one forward pass, collapsing repeated exceptions.
+
+    Records carrying a traceback are grouped by fingerprint and returned once
+    each with a count, first/last timestamps and the most recent occurrence as
+    a sample. The last ``count`` lines of the remaining records are returned as
+    ``lines``. Memory is bounded by ``count`` plus the number of distinct
+    fingerprints.
+
+    Every scan reads to the end of the file, so ``more_available`` is always
+    false. Without a cursor only the live file is scanned; with
+    ``include_rotated``, a cursor whose file was rotated away first drains the
+    rest of that file, as read_log_file does.
+
+    Args:
+        file_path: Path to the log file
+        count: Maximum number of non-exception lines to return
+        log_format: Parser used to split the file into records
+        log_filter: Optional record filter applied while scanning
+        cursor: Optional cursor returned by a previous call; only records
+            appended since then are read
+        include_rotated: Whether to drain a rotated-away file before the new one (default: True)
+
+    Returns:
+        Dictionary with lines, exceptions (most frequent first), the cursor for
+        the next call, cursor_status ("tail", "continued", "rotated" or
+        "truncated") and the rotated_files that were read.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    position = decode_log_cursor(cursor) if cursor else None
+    groups: dict[str, dict[str, Any]] = {}
+    tail_records: deque[list[str]] = deque()
+    tail_line_count = 0
+    rotated_files: list[str] = []
+
+    def scan(log_file: BinaryIO, start: int, end: int) -> int:
+        """Group the records in ``[start, end)`` and return the offset reached."""
+        nonlocal tail_line_count
+
+        offset = start
+        for record_lines, fields, next_offset in iter_log_records_forward(
+            iter_log_lines_forward(log_file, start, end), log_format
+        ):
+            offset = next_offset
+            if log_filter is not None and not log_filter.matches(record_lines, fields):
+                continue
+
+            exception = fingerprint_log_exception(record_lines)
+            if exception is None:
+                tail_records.append(record_lines)
+                tail_line_count += len(record_lines)
+                while tail_line_count - len(tail_records[0]) >= count:
+                    tail_line_count -= len(tail_records.popleft())
+                continue
+
+            fingerprint, exception_type, message, frames = exception
+            timestamp = log_format.timestamp(fields) if fields else None
+            seen = timestamp.isoformat() if timestamp else None
+            group = groups.get(fingerprint)
+            if group is None:
+                group = groups[fingerprint] = {
+                    "fingerprint": fingerprint,
+                    "exception_type": exception_type,
+                    "frames": frames,
+                    "count": 0,
+                    "first_seen": seen,
+                }
+            group["count"] += 1
+            group["last_seen"] = seen
+            group["message"] = message
+            group["sample"] = record_lines
+        return offset
+
+    with file_path.open("rb") as log_file:
+        file_stat = os.fstat(log_file.fileno())
+        size = file_stat.st_size
+
+        if position is None:
+            cursor_status = "tail"
+            start, end = log_time_window_offsets(log_file, size, log_filter)
+        else:
+            device, inode, start = position
+            end = size
+            if (device, inode) != (file_stat.st_dev, file_stat.st_ino):
+                cursor_status = "rotated"
+                previous_path = (
+                    find_log_file_by_identity(file_path, device, inode)
+                    if include_rotated
+                    else None
+                )
+                if previous_path is not None:
+                    # Records appended to the old file before rotation come first
+                    with previous_path.open("rb") as previous_file:
+                        previous_size = os.fstat(previous_file.fileno()).st_size
+                        scan(previous_file, start, previous_size)
+                    rotated_files.append(str(previous_path))
+                start = 0
+            elif size < start:
+                cursor_status, start = "truncated", 0
+            else:
+                cursor_status = "continued"
+
+        offset = scan(log_file, start, end)
+
+    lines = [line for record_lines in tail_records for line in record_lines]
+    return {
+        "lines": lines[-count:],
+        "exceptions": sorted(groups.values(), key=lambda group: -group["count"]),
+        "cursor": encode_log_cursor(file_stat, offset),
+        "cursor_status": cursor_status,
+        "more_available": False,
+        "rotated_files": rotated_files,
+    }
+
+
+def get_file_log_handlers() -> tuple[
+    dict[str, Path], dict[str, LogFormat], dict[str, str]
+]:
+    """
+    Discover the file-based handlers configured in ``LOGGING["handlers"]``.
+
+    Returns:
+        Tuple of (handler name to resolved log path, handler name to the
+        LogFormat of its formatter, handler name to path resolution error).
+    """
+    logging_config = getattr(settings, "LOGGING", {}) or {}
+    handlers_config = logging_config.get("handlers", {})
+    formatters_config = logging_config.get("formatters", {})
+
+    file_handlers: dict[str, Path] = {}
+    handler_formats: dict[str, LogFormat] = {}
+    path_errors: dict[str, str] = {}
+
+    for name, config in handlers_config.items():
+        handler_class = str(config.get("class", ""))
+        filename = config.get("filename")
+
+        if not filename or not handler_class.endswith("FileHandler"):
+            continue
+
+        try:
+            handler_formats[name] = LogFormat.from_config(
+                formatters_config.get(config.get("formatter"))
+            )
+        except re.error:
+            # Unusual format strings fall back to one record per line
+            handler_formats[name] = LogFormat.from_config(None)
+
+        try:
+            file_handlers[name] = Path(str(filename)).expanduser().resolve()
+        except Exception as e:
+            path_errors[name] = str(e)
+
+    return file_handlers, handler_formats, path_errors
+
+
+async def read_recent_logs(
+    lines: int = 100,
+    handler_name: str | None = None,
+    cursors: dict[str, str] | None = None,
+    include_rotated: bool = True,
+    min_level: str | None = None,
+    logger_name: str | None = None,
+    pattern: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    group_exceptions: bool = False,
+) -> dict[str, Any]:
+    """
+    Read recent lines from file-based Django log handlers safely.
+
+    Every handler result carries an opaque ``cursor``. Pass it back in ``cursors``
+    on the next call to only receive the lines appended since then (follow mode).
+
+    Filters are matched against whole records (a record's first line plus its
+    traceback or continuation lines) while the file is scanned, using the
+    handler's LOGGING formatter to parse level, logger name and timestamp.
+
+    With ``group_exceptions``, the file is scanned once and records carrying a
+    traceback are collapsed into one entry per distinct exception (type plus
+    frame list) with its count, first and last occurrence; ``lines`` then only
+    holds the remaining records.
+
+    Args:
+        lines: Number of recent lines to read per handler (default: 100, cap set via DJANGO_MCP_MAX_LOG_LINES env var, default cap: 5000)
+        handler_name: Optional handler name to target one configured handler
+        cursors: Optional mapping of handler name to the cursor returned by a previous call
+        include_rotated: Whether to continue into rotated siblings (app.log.1, app.log.2.gz, ...) when the live file has fewer lines than requested, and to finish a followed file that was rotated away (default: True); with group_exceptions only the latter applies
+        min_level: Optional minimum level name (e.g., "WARNING")
+        logger_name: Optional logger name; matches that logger and its children (e.g., "django.request")
+        pattern: Optional regular expression searched in every line of a record
+        since: Optional ISO 8601 timestamp; only records at or after it are returned
+        until: Optional ISO 8601 timestamp; only records at or before it are returned
+        group_exceptions: Whether to collapse repeated tracebacks into exception groups (default: False)
+
+    Returns:
+        Dictionary containing discovered handlers and recent log lines, or an error message.
+    """
+
+    @sync_to_async
+    def read_logs():
+        max_lines = int(os.environ.get("DJANGO_MCP_MAX_LOG_LINES", 5000))
+
+        if lines < 1:
+            return {"error": "lines must be greater than 0"}
+
+        level_names = logging.getLevelNamesMapping()
+        if min_level is not None and min_level.upper() not in level_names:
+            return {"error": f"Invalid min_level '{min_level}'"}
+
+        try:
+            compiled_pattern = re.compile(pattern) if pattern else None
+        except re.error as e:
+            return {"error": f"Invalid pattern: {str(e)}"}
+
+        try:
+            since_time = parse_log_time(since) if since else None
+            until_time = parse_log_time(until) if until else None
+        except ValueError as e:
+            return {"error": str(e)}
+
+        filtering = any(
+            value is not None
+            for value in (
+                min_level,
+                logger_name,
+                compiled_pattern,
+                since_time,
+                until_time,
+            )
+        )
+
+        actual_lines = min(lines, max_lines)
+        file_handlers, handler_formats, path_errors = get_file_log_handlers()
+
+        if not file_handlers and not path_errors:
+            return {"error": "No file-based log handlers found in LOGGING settings"}
+
+        if handler_name:
+            if handler_name not in file_handlers:
+                return {
+                    "error": f"Handler '{handler_name}' not found or is not a file-based handler"
                 }
             target_handlers = {handler_name: file_handlers[handler_name]}
         else:
@@ -804,7 +4223,13 @@ async def read_recent_logs(
         for name, error_msg in sorted(path_errors.items()):
             logs.append({"handler": name, "error": f"Error resolving log file path: {error_msg}"})
 
-        for name, file_path in sorted(target_handlers.items()):
+        def read_handler(name: str, file_path: Path) -> dict[str, Any]:
+            started = time.perf_counter()
+            log_result = read_handler_file(name, file_path)
+            log_result["read_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            return log_result
+
+        def read_handler_file(name: str, file_path: Path) -> dict[str, Any]:
             log_result: dict[str, Any] = {
                 "handler": name,
                 "path": str(file_path),
@@ -814,33 +4239,89 @@ async def read_recent_logs(
             }
 
             if not file_path.exists():
-                logs.append(log_result)
-                continue
+                return log_result
 
             if not file_path.is_file():
                 log_result["error"] = "Configured log path is not a file"
-                logs.append(log_result)
-                continue
+                return log_result
 
             try:
-                recent_lines: deque[str] = deque(maxlen=actual_lines)
-                with file_path.open(
-                    "r", encoding="utf-8", errors="replace"
-                ) as log_file:
-                    for line in log_file:
-                        recent_lines.append(line.rstrip("\n"))
-
-                log_result["lines"] = list(recent_lines)
-                log_result["line_count"] = len(recent_lines)
+                log_filter = None
+                log_format = handler_formats[name]
+                if filtering or group_exceptions:
+                    log_format = log_format.detect_json_lines(file_path)
+                if filtering:
+                    log_filter = LogFilter(
+                        log_format,
+                        min_level=level_names[min_level.upper()] if min_level else None,
+                        logger_prefix=logger_name,
+                        pattern=compiled_pattern,
+                        since=since_time,
+                        until=until_time,
+                    )
+                    missing_fields = log_filter.missing_fields()
+                    if missing_fields:
+                        log_result["error"] = (
+                            "Cannot apply filters: the handler's log format has no "
+                            f"{', '.join(missing_fields)} field"
+                        )
+                        return log_result
+
+                if group_exceptions:
+                    read_result = group_log_exceptions(
+                        file_path,
+                        actual_lines,
+                        log_format,
+                        log_filter=log_filter,
+                        cursor=(cursors or {}).get(name),
+                        include_rotated=include_rotated,
+                    )
+                else:
+                    read_result = read_log_file(
+                        file_path,
+                        actual_lines,
+                        (cursors or {}).get(name),
+                        include_rotated=include_rotated,
+                        log_filter=log_filter,
+                    )
+
+                log_result.update(read_result)
+                log_result["line_count"] = len(read_result["lines"])
+            except ValueError as e:
+                log_result["error"] = str(e)
             except Exception as e:
                 log_result["error"] = f"Error reading log file: {str(e)}"
 
-            logs.append(log_result)
+            return log_result
+
+        handler_items = sorted(target_handlers.items())
+        max_workers = min(
+            get_env_number("DJANGO_MCP_LOG_READ_WORKERS", 4), len(handler_items)
+        )
+
+        if max_workers > 1:
+            # Handlers often live on different volumes; read them concurrently
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="django-mcp-logs"
+            ) as executor:
+                logs.extend(executor.map(read_handler, *zip(*handler_items)))
+        else:
+            logs.extend(
+                read_handler(name, file_path) for name, file_path in handler_items
+            )
 
         return {
             "requested_lines": lines,
             "returned_lines": actual_lines,
             "handler_filter": handler_name,
+            "group_exceptions": group_exceptions,
+            "filters": {
+                "min_level": min_level,
+                "logger_name": logger_name,
+                "pattern": pattern,
+                "since": since,
+                "until": until,
+            },
             "available_handlers": sorted(file_handlers.keys()),
             "logs": logs,
         }
@@ -848,6 +4329,674 @@ async def read_recent_logs(
     return await read_logs()
 
 
+def normalize_log_message(message: str) -> str:
+    """Replace variable parts of a log message (ids, numbers, hex) so similar messages group together."""
+    for variable_re, placeholder in LOG_MESSAGE_VARIABLE_RES:
+        message = variable_re.sub(placeholder, message)
+    return message
+
+
+def summarize_log_file(
+    file_path: Path,
+    log_format: LogFormat,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    top_messages: int = 10,
+    bucket_minutes: int = 1,
+) -> dict[str, Any]:
+    """
+    Aggregate a log file in a single streaming pass.
+
+    Counts records per level, per logger and per time bucket, and tracks the most
+    frequent normalized messages. Message counters are pruned to a fixed size
+    when they grow too large (counts are then marked approximate), and once
+    there are more than LOG_SUMMARY_MAX_BUCKETS buckets their width is doubled
+    and neighbours merged. Memory and result size are therefore bounded by
+    these caps and the number of distinct loggers, not by the file size.
+
+    Args:
+        file_path: Path to the log file
+        log_format: Parser for the handler's formatter
+        since: Optional lower bound on record timestamps
+        until: Optional upper bound on record timestamps
+        top_messages: Number of most frequent messages to return
+        bucket_minutes: Minimum width of the time buckets in minutes
+
+    Returns:
+        Dictionary of aggregates for the file, with the bucket width actually
+        used under ``bucket_minutes``.
+    """
+    log_filter = (
+        LogFilter(log_format, since=since, until=until)
+        if since is not None or until is not None
+        else None
+    )
+    bucket_width = timedelta(minutes=bucket_minutes)
+
+    def bucket_start(timestamp: datetime) -> datetime:
+        return datetime.min + (timestamp - datetime.min) // bucket_width * bucket_width
+
+    message_capacity = max(top_messages * 10, 100)
+
+    levels: Counter[str] = Counter()
+    loggers: Counter[str] = Counter()
+    buckets: dict[datetime, Counter[str]] = {}
+    messages: Counter[tuple[str, str]] = Counter()
+    records = continuation_lines = 0
+    approximate = False
+    first_seen = last_seen = None
+
+    with file_path.open("rb") as log_file:
+        size = os.fstat(log_file.fileno()).st_size
+        start, end = log_time_window_offsets(log_file, size, log_filter)
+
+        for line, _ in iter_log_lines_forward(log_file, start, end):
+            fields = log_format.parse(line)
+            if fields is None:
+                continuation_lines += 1
+                continue
+
+            timestamp = log_format.timestamp(fields)
+            if log_filter is not None and not log_filter.matches([line], fields):
+                continue
+
+            records += 1
+            level = fields.get("levelname", "UNKNOWN")
+            levels[level] += 1
+            if "name" in fields:
+                loggers[fields["name"]] += 1
+
+            if timestamp is not None:
+                first_seen = first_seen or timestamp
+                last_seen = timestamp
+                buckets.setdefault(bucket_start(timestamp), Counter())[level] += 1
+                while len(buckets) > LOG_SUMMARY_MAX_BUCKETS:
+                    # Buckets stay aligned, so each wider one merges whole neighbours
+                    bucket_width *= 2
+                    merged_buckets: dict[datetime, Counter[str]] = {}
+                    for bucket, bucket_levels in buckets.items():
+                        merged_buckets.setdefault(
+                            bucket_start(bucket), Counter()
+                        ).update(bucket_levels)
+                    buckets = merged_buckets
+
+            messages[(level, normalize_log_message(fields.get("message", line)))] += 1
+            if len(messages) > 2 * message_capacity:
+                messages = Counter(dict(messages.most_common(message_capacity)))
+                approximate = True
+
+    return {
+        "records": records,
+        "continuation_lines": continuation_lines,
+        "scanned_bytes": end - start,
+        "first_seen": first_seen.isoformat() if first_seen else None,
+        "last_seen": last_seen.isoformat() if last_seen else None,
+        "levels": dict(levels.most_common()),
+        "loggers": dict(loggers.most_common()),
+        "bucket_minutes": bucket_width // timedelta(minutes=1),
+        "buckets": [
+            {
+                "start": bucket.isoformat(),
+                "total": sum(bucket_levels.values()),
+                "levels": dict(bucket_levels),
+            }
+            for bucket, bucket_levels in sorted(buckets.items())
+        ],
+        "top_messages": [
+            {"level": level, "message": message, "count": count}
+            for (level, message), count in messages.most_common(top_messages)
+        ],
+        "approximate_counts": approximate,
+    }
+
+
+async def summarize_logs(
+    handler_name: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    top_messages: int = 10,
+    bucket_minutes: int = 1,
+) -> dict[str, Any]:
+    """
+    Summarize file-based Django logs into aggregates instead of raw lines.
+
+    Each log file is parsed in one streaming pass, either as JSON lines or with
+    the handler's LOGGING formatter. Use this to answer questions like "is the
+    error rate going up?" without transferring thousands of lines.
+
+    Args:
+        handler_name: Optional handler name to target one configured handler
+        since: Optional ISO 8601 timestamp; only records at or after it are counted
+        until: Optional ISO 8601 timestamp; only records at or before it are counted
+        top_messages: Number of most frequent messages to return per handler (default: 10, max: 100)
+        bucket_minutes: Minimum width of the time buckets in minutes (default: 1); widened so at most 100 buckets are returned
+
+    Returns:
+        Dictionary containing per-handler counts by level, logger and time bucket,
+        plus the most frequent messages (numbers and ids normalized), or an error message.
+    """
+
+    @sync_to_async
+    def summarize():
+        if top_messages < 0:
+            return {"error": "top_messages must be 0 or greater"}
+        if bucket_minutes < 1:
+            return {"error": "bucket_minutes must be greater than 0"}
+
+        try:
+            since_time = parse_log_time(since) if since else None
+            until_time = parse_log_time(until) if until else None
+        except ValueError as e:
+            return {"error": str(e)}
+
+        file_handlers, handler_formats, path_errors = get_file_log_handlers()
+
+        if not file_handlers and not path_errors:
+            return {"error": "No file-based log handlers found in LOGGING settings"}
+
+        if handler_name:
+            if handler_name not in file_handlers:
+                return {
+                    "error": f"Handler '{handler_name}' not found or is not a file-based handler"
+                }
+            target_handlers = {handler_name: file_handlers[handler_name]}
+        else:
+            target_handlers = file_handlers
+
+        summaries: list[dict[str, Any]] = []
+
+        for name, error_msg in sorted(path_errors.items()):
+            summaries.append(
+                {
+                    "handler": name,
+                    "error": f"Error resolving log file path: {error_msg}",
+                }
+            )
+
+        for name, file_path in sorted(target_handlers.items()):
+            summary: dict[str, Any] = {
+                "handler": name,
+                "path": str(file_path),
+                "exists": file_path.exists(),
+            }
+
+            if not file_path.is_file():
+                if summary["exists"]:
+                    summary["error"] = "Configured log path is not a file"
+                summaries.append(summary)
+                continue
+
+            try:
+                log_format = handler_formats[name].detect_json_lines(file_path)
+                if (since_time or until_time) and "asctime" not in log_format.fields:
+                    summary["error"] = (
+                        "Cannot apply filters: the handler's log format has no asctime field"
+                    )
+                    summaries.append(summary)
+                    continue
+
+                summary["format"] = "json" if log_format.json_lines else "formatter"
+                summary.update(
+                    summarize_log_file(
+                        file_path,
+                        log_format,
+                        since=since_time,
+                        until=until_time,
+                        top_messages=min(top_messages, 100),
+                        bucket_minutes=bucket_minutes,
+                    )
+                )
+            except Exception as e:
+                summary["error"] = f"Error reading log file: {str(e)}"
+
+            summaries.append(summary)
+
+        return {
+            "handler_filter": handler_name,
+            "since": since,
+            "until": until,
+            "bucket_minutes": bucket_minutes,
+            "available_handlers": sorted(file_handlers.keys()),
+            "summaries": summaries,
+        }
+
+    return await summarize()
+
+
+def split_log_file(
+    log_file: BinaryIO, size: int, chunk_size: int
+) -> list[tuple[int, int]]:
+    """Split a log file into byte ranges of about ``chunk_size`` that start at line boundaries."""
+    boundaries = [0]
+    for offset in range(chunk_size, size, chunk_size):
+        line_start = _next_line_start(log_file, offset, size)
+        if boundaries[-1] < line_start < size:
+            boundaries.append(line_start)
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def grep_log_chunk(
+    path: str, start: int, end: int, pattern: bytes, flags: int, limit: int
+) -> list[tuple[int, str]]:
+    """
+    Return up to ``limit`` lines matching ``pattern`` in ``[start, end)`` of a log file.
+
+    The file is memory-mapped, so the byte range is searched without copying it
+    into Python. Each matching line is reported once as ``(offset, line)``.
+    This runs in grep_logs' worker processes and must stay importable at module level.
+    """
+    line_re = re.compile(pattern, flags | re.MULTILINE)
+    matches: list[tuple[int, str]] = []
+
+    with open(path, "rb") as log_file:
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            position = start
+            while position < end and len(matches) < limit:
+                match = line_re.search(mapped, position, end)
+                if match is None:
+                    break
+                # A match starting on newlines (e.g. "\\s+ERROR") belongs to the next line
+                anchor = match.start()
+                while anchor < match.end() and mapped[anchor : anchor + 1] == b"\n":
+                    anchor += 1
+                if anchor == match.end():
+                    anchor = match.start()
+                line_start = max(mapped.rfind(b"\n", start, anchor) + 1, start)
+                line_end = mapped.find(b"\n", anchor, end)
+                if line_end == -1:
+                    line_end = end
+                matches.append(
+                    (line_start, decode_log_line(mapped[line_start:line_end]))
+                )
+                position = line_end + 1
+
+    return matches
+
+
+def get_log_grep_executor() -> ProcessPoolExecutor:
+    """Return the grep_logs process pool, sized by DJANGO_MCP_LOG_GREP_WORKERS (default: CPU count)."""
+    global LOG_GREP_EXECUTOR
+
+    with LOG_GREP_EXECUTOR_LOCK:
+        if LOG_GREP_EXECUTOR is None:
+            max_workers = get_env_number(
+                "DJANGO_MCP_LOG_GREP_WORKERS", os.cpu_count() or 1
+            )
+            # Spawned workers only import this module; they never touch Django or the server
+            LOG_GREP_EXECUTOR = ProcessPoolExecutor(
+                max_workers=max(max_workers, 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return LOG_GREP_EXECUTOR
+
+
+def grep_log_file(
+    file_path: Path, pattern: bytes, flags: int, max_results: int
+) -> dict[str, Any]:
+    """
+    Find the lines of a log file matching a bytes regular expression.
+
+    Files larger than LOG_GREP_CHUNK_SIZE are split into newline-aligned byte
+    ranges scanned in parallel on the process pool. Results are collected in
+    file order, and once ``max_results`` matches are found the chunks that have
+    not started yet are cancelled.
+
+    Args:
+        file_path: Path to the log file
+        pattern: Regular expression, as bytes
+        flags: Regular expression flags
+        max_results: Maximum number of matching lines to return
+
+    Returns:
+        Dictionary with the matching lines and their byte offsets, whether the
+        result was truncated, and how many chunks were scanned or cancelled.
+    """
+    with file_path.open("rb") as log_file:
+        size = os.fstat(log_file.fileno()).st_size
+        chunks = split_log_file(log_file, size, LOG_GREP_CHUNK_SIZE) if size else []
+
+    path = str(file_path)
+    matches: list[tuple[int, str]] = []
+    chunks_scanned = 0
+
+    if len(chunks) <= 1:
+        for start, end in chunks:
+            matches.extend(
+                grep_log_chunk(path, start, end, pattern, flags, max_results + 1)
+            )
+            chunks_scanned += 1
+    else:
+        try:
+            executor = get_log_grep_executor()
+            futures = [
+                executor.submit(
+                    grep_log_chunk, path, start, end, pattern, flags, max_results + 1
+                )
+                for start, end in chunks
+            ]
+            for future in futures:
+                if len(matches) > max_results:
+                    future.cancel()
+                    continue
+                matches.extend(future.result())
+                chunks_scanned += 1
+        except BrokenProcessPool:
+            global LOG_GREP_EXECUTOR
+            with LOG_GREP_EXECUTOR_LOCK:
+                LOG_GREP_EXECUTOR = None
+            raise
+
+    return {
+        "size_bytes": size,
+        "matches": [
+            {"offset": offset, "line": line} for offset, line in matches[:max_results]
+        ],
+        "match_count": min(len(matches), max_results),
+        "truncated": len(matches) > max_results,
+        "chunks": len(chunks),
+        "chunks_scanned": chunks_scanned,
+    }
+
+
+async def grep_logs(
+    pattern: str,
+    handler_name: str | None = None,
+    max_results: int = 200,
+    ignore_case: bool = False,
+) -> dict[str, Any]:
+    """
+    Search whole file-based Django logs for lines matching a regular expression.
+
+    Unlike read_recent_logs, which only looks at the end of each file, this scans
+    every byte. Large files are split into chunks searched in parallel on all
+    CPU cores using memory-mapped I/O.
+
+    Args:
+        pattern: Regular expression searched in each line (e.g., "order 84213")
+        handler_name: Optional handler name to search a single configured handler
+        max_results: Maximum number of matching lines per handler (default: 200, cap set via DJANGO_MCP_MAX_LOG_LINES env var, default cap: 5000)
+        ignore_case: Whether to match case-insensitively (ASCII letters only) (default: False)
+
+    Returns:
+        Dictionary containing the matching lines with their byte offsets per handler, or an error message.
+    """
+
+    @sync_to_async
+    def grep():
+        if max_results < 1:
+            return {"error": "max_results must be greater than 0"}
+
+        try:
+            byte_pattern = pattern.encode("utf-8")
+            flags = re.IGNORECASE if ignore_case else 0
+            re.compile(byte_pattern, flags)
+        except re.error as e:
+            return {"error": f"Invalid pattern: {str(e)}"}
+
+        actual_results = min(
+            max_results, int(os.environ.get("DJANGO_MCP_MAX_LOG_LINES", 5000))
+        )
+        file_handlers, _, path_errors = get_file_log_handlers()
+
+        if not file_handlers and not path_errors:
+            return {"error": "No file-based log handlers found in LOGGING settings"}
+
+        if handler_name:
+            if handler_name not in file_handlers:
+                return {
+                    "error": f"Handler '{handler_name}' not found or is not a file-based handler"
+                }
+            target_handlers = {handler_name: file_handlers[handler_name]}
+        else:
+            target_handlers = file_handlers
+
+        results: list[dict[str, Any]] = []
+
+        for name, error_msg in sorted(path_errors.items()):
+            results.append(
+                {
+                    "handler": name,
+                    "error": f"Error resolving log file path: {error_msg}",
+                }
+            )
+
+        for name, file_path in sorted(target_handlers.items()):
+            grep_result: dict[str, Any] = {
+                "handler": name,
+                "path": str(file_path),
+                "exists": file_path.exists(),
+                "matches": [],
+                "match_count": 0,
+            }
+
+            if not file_path.is_file():
+                if grep_result["exists"]:
+                    grep_result["error"] = "Configured log path is not a file"
+                results.append(grep_result)
+                continue
+
+            started = time.perf_counter()
+            try:
+                grep_result.update(
+                    grep_log_file(file_path, byte_pattern, flags, actual_results)
+                )
+            except Exception as e:
+                grep_result["error"] = f"Error reading log file: {str(e)}"
+            grep_result["scan_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+            results.append(grep_result)
+
+        return {
+            "pattern": pattern,
+            "ignore_case": ignore_case,
+            "requested_results": max_results,
+            "returned_results": actual_results,
+            "handler_filter": handler_name,
+            "available_handlers": sorted(file_handlers.keys()),
+            "results": results,
+        }
+
+    return await grep()
+
+
+def render_log_message(record: logging.LogRecord) -> str:
+    """
+    Render a record's message without letting a failing argument escape.
+
+    Arguments whose ``__str__`` raises (e.g. a model instance touching an unloaded
+    relation from an async context) fall back to a size-limited ``repr`` snapshot.
+    """
+    try:
+        return record.getMessage()
+    except Exception:
+        try:
+            return f"{record.msg} {reprlib.repr(record.args)}"
+        except Exception:
+            return f"<unrenderable log message: {type(record.msg).__name__}>"
+
+
+class CapturedLogRecord:
+    """
+    Compact copy of a LogRecord kept by LogCaptureHandler.
+
+    The message is rendered on capture and cut to LOG_CAPTURE_MAX_MESSAGE_LENGTH,
+    so the buffer never keeps the record's arguments (model instances, requests,
+    SQL params) alive and each entry stays small.
+    """
+
+    __slots__ = ("created", "levelno", "name", "message", "exc_text")
+
+    def __init__(self, record: logging.LogRecord) -> None:
+        self.created = record.created
+        self.levelno = record.levelno
+        self.name = record.name
+        self.message, _ = truncate_value(
+            render_log_message(record), LOG_CAPTURE_MAX_MESSAGE_LENGTH
+        )
+        # Tracebacks are rendered right away so frames are not kept alive
+        self.exc_text = record.exc_text or (
+            LOG_CAPTURE_FORMATTER.formatException(record.exc_info)
+            if record.exc_info
+            else None
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "time": datetime.fromtimestamp(self.created).isoformat(),
+            "level": logging.getLevelName(self.levelno),
+            "logger": self.name,
+            "message": self.message,
+            "exc_text": self.exc_text,
+        }
+
+
+class LogCaptureHandler(logging.Handler):
+    """Logging handler keeping the most recent records in a bounded in-memory ring buffer."""
+
+    def __init__(self, capacity: int, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.capacity = capacity
+        self.records: deque[CapturedLogRecord] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.records.append(CapturedLogRecord(record))
+        except Exception:
+            self.handleError(record)
+
+    def snapshot(self) -> list[CapturedLogRecord]:
+        """Return the buffered records, oldest first."""
+        with self.lock:
+            return list(self.records)
+
+
+def install_log_capture(capacity: int | None = None) -> LogCaptureHandler | None:
+    """
+    Attach the in-memory ring-buffer handler used by read_captured_logs.
+
+    The handler is added to the root logger and to every logger configured in
+    ``LOGGING["loggers"]`` with ``propagate`` disabled, since their records never
+    reach the root logger. Calling it again returns the installed handler.
+
+    Args:
+        capacity: Number of records to keep (default: DJANGO_MCP_LOG_BUFFER_SIZE env var, or 1000). 0 disables capture.
+
+    Returns:
+        The installed handler, or None if capture is disabled.
+    """
+    global LOG_CAPTURE_HANDLER
+
+    if LOG_CAPTURE_HANDLER is not None:
+        return LOG_CAPTURE_HANDLER
+
+    if capacity is None:
+        capacity = get_env_number("DJANGO_MCP_LOG_BUFFER_SIZE", 1000)
+    if capacity < 1:
+        return None
+
+    handler = LogCaptureHandler(capacity)
+    logging.getLogger().addHandler(handler)
+
+    logging_config = getattr(settings, "LOGGING", {}) or {}
+    for logger_name, logger_config in logging_config.get("loggers", {}).items():
+        if not logger_config.get("propagate", True):
+            logging.getLogger(logger_name).addHandler(handler)
+
+    LOG_CAPTURE_HANDLER = handler
+    return handler
+
+
+async def read_captured_logs(
+    lines: int = 100,
+    min_level: str | None = None,
+    logger_name: str | None = None,
+    pattern: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> dict[str, Any]:
+    """
+    Read recent log records captured in memory by the server, without touching the disk.
+
+    Works for projects that log only to the console or syslog. The server keeps
+    the most recent records in a ring buffer (size set via DJANGO_MCP_LOG_BUFFER_SIZE
+    env var, default: 1000).
+
+    Args:
+        lines: Maximum number of records to return, newest last (default: 100)
+        min_level: Optional minimum level name (e.g., "WARNING")
+        logger_name: Optional logger name; matches that logger and its children (e.g., "django.request")
+        pattern: Optional regular expression searched in the message and traceback
+        since: Optional ISO 8601 timestamp; only records at or after it are returned
+        until: Optional ISO 8601 timestamp; only records at or before it are returned
+
+    Returns:
+        Dictionary containing the buffer capacity, matching records, or an error message.
+    """
+    if LOG_CAPTURE_HANDLER is None:
+        return {
+            "error": "In-memory log capture is not enabled (DJANGO_MCP_LOG_BUFFER_SIZE is 0)"
+        }
+
+    if lines < 1:
+        return {"error": "lines must be greater than 0"}
+
+    level_names = logging.getLevelNamesMapping()
+    if min_level is not None and min_level.upper() not in level_names:
+        return {"error": f"Invalid min_level '{min_level}'"}
+    min_levelno = level_names[min_level.upper()] if min_level else None
+
+    try:
+        compiled_pattern = re.compile(pattern) if pattern else None
+    except re.error as e:
+        return {"error": f"Invalid pattern: {str(e)}"}
+
+    try:
+        since_created = parse_log_time(since).timestamp() if since else None
+        until_created = parse_log_time(until).timestamp() if until else None
+    except ValueError as e:
+        return {"error": str(e)}
+
+    buffered = LOG_CAPTURE_HANDLER.snapshot()
+    matched: list[dict[str, Any]] = []
+
+    for record in reversed(buffered):
+        if since_created is not None and record.created < since_created:
+            continue
+        if until_created is not None and record.created > until_created:
+            continue
+        if min_levelno is not None and record.levelno < min_levelno:
+            continue
+        if logger_name is not None and not logger_matches(record.name, logger_name):
+            continue
+
+        record_dict = record.as_dict()
+        if compiled_pattern is not None and not (
+            compiled_pattern.search(record_dict["message"])
+            or compiled_pattern.search(record_dict["exc_text"] or "")
+        ):
+            continue
+
+        matched.append(record_dict)
+        if len(matched) == lines:
+            break
+
+    matched.reverse()
+    return {
+        "capacity": LOG_CAPTURE_HANDLER.capacity,
+        "buffered_count": len(buffered),
+        "returned_count": len(matched),
+        "filters": {
+            "min_level": min_level,
+            "logger_name": logger_name,
+            "pattern": pattern,
+            "since": since,
+            "until": until,
+        },
+        "records": matched,
+    }
+
+
 async def search_django_docs(topic: str) -> str:
     """
     Generate a prompt to help search for specific topics in Django documentation.
@@ -895,8 +5044,14 @@ TOOLS = [
     get_absolute_url,
     reverse_url,
     query_model,
+    batch_query,
+    aggregate_model,
+    explain_query,
     run_check,
     read_recent_logs,
+    summarize_logs,
+    grep_logs,
+    read_captured_logs,
 ]
 
 PROMPTS = [
@@ -935,6 +5090,9 @@ def run_server(
     # Initialize Django before starting the server
     initialize_django(settings_module)
 
+    # Keep recent log records in memory for read_captured_logs
+    install_log_capture()
+
     # Determine auth requirements
     token = get_auth_token(auth_token)
     is_production = is_production_environment()
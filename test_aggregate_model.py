@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Tests for the aggregate_model MCP tool."""
+
+import pytest
+
+from django_ai_boost.server_fastmcp import aggregate_model, query_model
+
+
+@pytest.mark.asyncio
+async def test_aggregate_model_counts_per_group() -> None:
+    posts = await query_model(app_label="blog", model_name="Post")
+    result = await aggregate_model(
+        app_label="blog",
+        model_name="Post",
+        group_by=["status"],
+        aggregates={"posts": "count", "views": "sum:view_count"},
+    )
+
+    assert "error" not in result
+    assert result["group_by"] == ["status"]
+    assert result["truncated"] is False
+    expected = {}
+    for post in posts["results"]:
+        expected[post["status"]] = expected.get(post["status"], 0) + 1
+    assert {row["status"]: row["posts"] for row in result["results"]} == expected
+    assert [row["status"] for row in result["results"]] == sorted(expected)
+    assert all(isinstance(row["views"], int) for row in result["results"])
+
+
+@pytest.mark.asyncio
+async def test_aggregate_model_without_groups_aggregates_whole_table() -> None:
+    posts = await query_model(app_label="blog", model_name="Post")
+    result = await aggregate_model(
+        app_label="blog",
+        model_name="Post",
+        aggregates={"authors": "count_distinct:author", "latest": "max:created_at"},
+        filters={"status": "published"},
+    )
+
+    published = [post for post in posts["results"] if post["status"] == "published"]
+    assert result["returned_count"] == 1
+    row = result["results"][0]
+    assert row["authors"] == len({post["author"] for post in published})
+    assert row["latest"] == max(post["created_at"] for post in published)
+
+
+@pytest.mark.asyncio
+async def test_aggregate_model_truncates_dates() -> None:
+    result = await aggregate_model(
+        app_label="blog",
+        model_name="Post",
+        group_by=["status"],
+        date_trunc={"created_at": "month"},
+        order_by=["-count"],
+        limit=1,
+    )
+
+    assert "error" not in result
+    assert result["group_by"] == ["status", "created_at_month"]
+    assert result["order_by"] == ["-count"]
+    row = result["results"][0]
+    assert set(row) == {"status", "created_at_month", "count"}
+    assert row["created_at_month"][8:10] == "01"
+
+
+@pytest.mark.asyncio
+async def test_aggregate_model_invalid_inputs() -> None:
+    unknown_model = await aggregate_model(app_label="blog", model_name="Missing")
+    unknown_function = await aggregate_model(
+        app_label="blog", model_name="Post", aggregates={"x": "median:view_count"}
+    )
+    missing_field = await aggregate_model(
+        app_label="blog", model_name="Post", aggregates={"x": "sum"}
+    )
+    bad_kind = await aggregate_model(
+        app_label="blog", model_name="Post", date_trunc={"created_at": "decade"}
+    )
+    bad_group = await aggregate_model(
+        app_label="blog", model_name="Post", group_by=["missing"]
+    )
+
+    assert "not found" in unknown_model["error"]
+    assert unknown_function["error"].startswith("Invalid aggregate 'median:view_count'")
+    assert missing_field["error"] == "Invalid aggregate 'sum': expected 'sum:<field>'"
+    assert "Invalid date_trunc kind 'decade'" in bad_kind["error"]
+    assert "Invalid aggregation parameters" in bad_group["error"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Tests for the batch_query MCP tool."""
+
+import pytest
+
+from django_ai_boost.server_fastmcp import batch_query, query_model
+
+
+@pytest.mark.asyncio
+async def test_batch_query_returns_results_in_order() -> None:
+    posts = await query_model(app_label="blog", model_name="Post", limit=2)
+    categories = await query_model(
+        app_label="blog", model_name="Category", fields=["name"]
+    )
+
+    result = await batch_query(
+        queries=[
+            {"app_label": "blog", "model_name": "Post", "limit": 2},
+            {"app_label": "blog", "model_name": "Category", "fields": ["name"]},
+            {"app_label": "blog", "model_name": "Nope"},
+        ]
+    )
+
+    assert result["database"] == "default"
+    first, second, missing = result["results"]
+    assert first["results"] == posts["results"]
+    assert first["next_cursor"] == posts["next_cursor"]
+    assert second["results"] == categories["results"]
+    assert missing == {"error": "Model 'blog.Nope' not found"}
+    assert result["query_count"] == first["query_count"] + second["query_count"]
+
+
+@pytest.mark.asyncio
+async def test_batch_query_validates_queries() -> None:
+    empty = await batch_query(queries=[])
+    unexpected = await batch_query(
+        queries=[{"app_label": "blog", "model_name": "Post", "stream": True}]
+    )
+    incomplete = await batch_query(queries=[{"app_label": "blog"}])
+    too_many = await batch_query(
+        queries=[{"app_label": "blog", "model_name": "Post"}] * 51
+    )
+    unknown_database = await batch_query(
+        queries=[{"app_label": "blog", "model_name": "Post"}], database="replica"
+    )
+
+    assert empty == {"error": "No queries given"}
+    assert unexpected["error"] == "Invalid query #0: unexpected keys stream"
+    assert incomplete["error"] == (
+        "Invalid query #0: app_label and model_name are required"
+    )
+    assert too_many["error"] == "Too many queries: 51 (max: 50)"
+    assert unknown_database["error"].startswith("Unknown database alias 'replica'")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Tests for database alias routing and read-only transactions in the data tools."""
+
+import pytest
+from django.db import OperationalError, connections
+from django.test import override_settings
+
+from django_ai_boost.server_fastmcp import (
+    aggregate_model,
+    database_schema,
+    get_absolute_url,
+    query_model,
+    read_only_transaction,
+)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return "replica"
+
+
+@pytest.mark.asyncio
+async def test_data_tools_read_from_default_database() -> None:
+    posts = await query_model(app_label="blog", model_name="Post")
+    schema = await database_schema()
+    aggregate = await aggregate_model(app_label="blog", model_name="Post")
+    url = await get_absolute_url(
+        app_label="blog", model_name="Post", pk=posts["results"][0]["id"]
+    )
+
+    assert posts["database"] == "default"
+    assert schema["database"] == "default"
+    assert aggregate["database"] == "default"
+    assert url["database"] == "default"
+
+
+@pytest.mark.asyncio
+async def test_data_tools_reject_unknown_database_alias() -> None:
+    for result in (
+        await query_model(app_label="blog", model_name="Post", database="replica"),
+        await database_schema(database="replica"),
+        await aggregate_model(app_label="blog", model_name="Post", database="replica"),
+        await get_absolute_url(
+            app_label="blog", model_name="Post", pk=1, database="replica"
+        ),
+    ):
+        assert result["error"].startswith("Unknown database alias 'replica'")
+
+
+@pytest.mark.asyncio
+async def test_database_alias_from_environment(monkeypatch) -> None:
+    monkeypatch.setenv("DJANGO_MCP_DATABASE", "replica")
+
+    result = await query_model(app_label="blog", model_name="Post")
+    explicit = await query_model(
+        app_label="blog", model_name="Post", database="default"
+    )
+
+    assert result["error"].startswith("Unknown database alias 'replica'")
+    assert explicit["database"] == "default"
+
+
+@pytest.mark.asyncio
+async def test_database_alias_from_routers() -> None:
+    with override_settings(DATABASE_ROUTERS=[ReplicaRouter()]):
+        result = await query_model(app_label="blog", model_name="Post")
+
+    assert result["error"].startswith("Unknown database alias 'replica'")
+
+
+def test_read_only_transaction_blocks_writes() -> None:
+    from blog.models import Post
+
+    with read_only_transaction("default"):
+        with read_only_transaction("default"):
+            assert Post.objects.count() > 0
+        # Leaving the nested block keeps the outer one read-only
+        with pytest.raises(OperationalError):
+            Post.objects.update(view_count=1)
+
+    with connections["default"].cursor() as cursor:
+        cursor.execute("PRAGMA query_only")
+        assert cursor.fetchone()[0] == 0
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""Tests for the explain_query MCP tool."""
+
+import pytest
+
+from django_ai_boost.server_fastmcp import explain_query
+
+
+@pytest.mark.asyncio
+async def test_explain_query_returns_sql_and_plan() -> None:
+    result = await explain_query(
+        app_label="blog",
+        model_name="Post",
+        filters={"status": "published"},
+        limit=10,
+    )
+
+    assert "error" not in result
+    assert result["database"] == "default"
+    assert result["vendor"] == "sqlite"
+    assert '"blog_post"."status" = %s' in result["sql"]
+    assert "LIMIT 11" in result["sql"]
+    assert result["params"] == ["published"]
+    assert "blog_post_status" in result["plan"]
+    assert result["unindexed_filter_fields"] == []
+    assert not any(
+        warning["kind"] == "sequential_scan" for warning in result["warnings"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_explain_query_flags_unindexed_scan_and_sort() -> None:
+    result = await explain_query(
+        app_label="blog",
+        model_name="Post",
+        filters={"view_count__gt": 10},
+        order_by=["-view_count"],
+    )
+
+    warnings = {warning["kind"]: warning for warning in result["warnings"]}
+    assert warnings["sequential_scan"]["table"] == "blog_post"
+    assert warnings["sequential_scan"]["unindexed_fields"] == ["view_count"]
+    assert warnings["sort"]["unindexed_fields"] == ["view_count"]
+    assert result["unindexed_order_by_fields"] == ["view_count"]
+
+
+@pytest.mark.asyncio
+async def test_explain_query_treats_foreign_keys_and_meta_indexes_as_indexed() -> None:
+    result = await explain_query(
+        app_label="blog",
+        model_name="Post",
+        filters={"author__username": "admin", "status": "draft"},
+        order_by=["-published_at", "pk"],
+    )
+
+    assert result["unindexed_filter_fields"] == []
+    assert result["unindexed_order_by_fields"] == []
+
+
+@pytest.mark.asyncio
+async def test_explain_query_checks_indexes_across_relations() -> None:
+    result = await explain_query(
+        app_label="blog",
+        model_name="Post",
+        filters={
+            "category__description__icontains": "django",
+            "category__slug": "news",
+            "comments__post": 1,
+            "tags__name": "python",
+        },
+        order_by=["author__last_name"],
+    )
+
+    assert result["unindexed_filter_fields"] == ["category__description"]
+    assert result["unindexed_order_by_fields"] == ["author__last_name"]
+
+
+@pytest.mark.asyncio
+async def test_explain_query_errors() -> None:
+    analyze = await explain_query(app_label="blog", model_name="Post", analyze=True)
+    invalid_filter = await explain_query(
+        app_label="blog", model_name="Post", filters={"nope": 1}
+    )
+    missing = await explain_query(app_label="blog", model_name="Nope")
+
+    assert analyze["error"].startswith("Cannot explain this query on sqlite")
+    assert invalid_filter["error"].startswith("Invalid filter parameters")
+    assert missing["error"] == "Model 'blog.Nope' not found"
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""Tests for the grep_logs tool and its chunked parallel scan."""
+
+import logging
+import re
+from collections.abc import Callable
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from django_ai_boost import server_fastmcp
+from django_ai_boost.server_fastmcp import (
+    grep_log_chunk,
+    grep_log_file,
+    grep_logs,
+    split_log_file,
+)
+
+
+def write_order_log(log_path: Path, records: int) -> list[bytes]:
+    lines = [
+        f"2025-03-01 12:00:00,000 INFO order {i} {'paid' if i % 7 == 0 else 'open'}".encode()
+        for i in range(records)
+    ]
+    log_path.write_bytes(b"\n".join(lines) + b"\n")
+    return lines
+
+
+def test_split_log_file_aligns_chunks_to_lines(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    write_order_log(log_path, 100)
+    data = log_path.read_bytes()
+
+    with log_path.open("rb") as log_file:
+        chunks = split_log_file(log_file, len(data), 300)
+
+    assert chunks[0][0] == 0
+    assert chunks[-1][1] == len(data)
+    assert len(chunks) > 5
+    for (_, end), (start, _) in zip(chunks, chunks[1:]):
+        assert end == start
+        assert data[start - 1 : start] == b"\n"
+
+
+def test_grep_log_chunk_reports_each_line_once(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    lines = write_order_log(log_path, 30)
+    size = log_path.stat().st_size
+
+    matches = grep_log_chunk(str(log_path), 0, size, rb"order 1\d|o", 0, 100)
+
+    assert len(matches) == 30
+    offset, line = matches[12]
+    assert line == lines[12].decode()
+    assert log_path.read_bytes()[offset : offset + len(lines[12])] == lines[12]
+
+
+def test_grep_log_chunk_skips_leading_newlines_of_match(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_bytes(b"request ok\n  ERROR timeout\nrequest ok\n")
+
+    matches = grep_log_chunk(
+        str(log_path), 0, log_path.stat().st_size, rb"\s+ERROR", 0, 10
+    )
+
+    assert matches == [(11, "  ERROR timeout")]
+
+
+def test_grep_log_file_parallel_matches_in_process_scan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log_path = tmp_path / "app.log"
+    write_order_log(log_path, 2000)
+
+    in_process = grep_log_file(log_path, rb"paid$", 0, 1000)
+    monkeypatch.setattr(server_fastmcp, "LOG_GREP_CHUNK_SIZE", 4096)
+    parallel = grep_log_file(log_path, rb"paid$", 0, 1000)
+
+    assert in_process["chunks"] == 1
+    assert parallel["chunks"] > 1
+    assert parallel["chunks_scanned"] == parallel["chunks"]
+    assert parallel["matches"] == in_process["matches"]
+    assert parallel["match_count"] == 286
+    assert parallel["truncated"] is False
+
+
+def test_grep_log_file_stops_at_result_cap(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log_path = tmp_path / "app.log"
+    write_order_log(log_path, 2000)
+    monkeypatch.setattr(server_fastmcp, "LOG_GREP_CHUNK_SIZE", 4096)
+
+    result = grep_log_file(log_path, rb"ORDER \d+ OPEN", re.IGNORECASE, 5)
+
+    assert result["truncated"] is True
+    assert [match["line"].split()[4] for match in result["matches"]] == [
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+    ]
+    assert result["chunks_scanned"] < result["chunks"]
+
+
+async def test_grep_logs_success(
+    flush_root_handlers: Callable[[], None],
+) -> None:
+    marker = f"grep_logs_test_{uuid4().hex}"
+    logging.getLogger("django_ai_boost.tests").info(f"{marker} order 84213")
+    flush_root_handlers()
+
+    result = await grep_logs(pattern=f"{marker} order \\d+", handler_name="file")
+
+    assert "error" not in result
+    assert "file" in result["available_handlers"]
+    grep_result = result["results"][0]
+    assert grep_result["handler"] == "file"
+    assert grep_result["match_count"] == 1
+    assert grep_result["matches"][0]["line"].endswith(f"{marker} order 84213")
+    assert grep_result["scan_ms"] >= 0
+
+
+async def test_grep_logs_invalid_inputs() -> None:
+    assert (await grep_logs(pattern="("))["error"].startswith("Invalid pattern")
+    assert "max_results" in (await grep_logs(pattern="x", max_results=0))["error"]
+    assert (
+        "not found" in (await grep_logs(pattern="x", handler_name="missing"))["error"]
+    )
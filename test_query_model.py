@@ -1,9 +1,22 @@
 #!/usr/bin/env python
 """Tests for the query_model MCP tool."""
 
+import json
+from types import SimpleNamespace
+
 import pytest
+from django.apps import apps
+from django.test import override_settings
+from fastmcp import Client, FastMCP
 
-from django_ai_boost.server_fastmcp import query_model
+from django_ai_boost.server_fastmcp import (
+    TRUNCATION_MARKER,
+    compile_row_serializer,
+    encode_columns,
+    get_related_fetch_plan,
+    query_model,
+    register_tools,
+)
 
 
 @pytest.mark.asyncio
@@ -77,5 +90,337 @@ async def test_query_model_invalid_filter_returns_error() -> None:
     assert "Invalid filter parameters" in result["error"]
 
 
+def test_get_related_fetch_plan_joins_forward_relations() -> None:
+    post = apps.get_model("blog", "Post")
+
+    assert get_related_fetch_plan(post) == (["author", "category"], [])
+
+
+def test_compile_row_serializer_is_cached_per_projection() -> None:
+    post = apps.get_model("blog", "Post")
+
+    plan = compile_row_serializer(post, None, None)
+    assert compile_row_serializer(post, None, None) is plan
+    assert compile_row_serializer(post, ("title",), None) is not plan
+    assert [name for name, *_ in plan.columns][:4] == [
+        "id",
+        "title",
+        "slug",
+        "author",
+    ]
+
+    # Reloading the app registry drops compiled plans
+    with override_settings(INSTALLED_APPS=["django.contrib.contenttypes"]):
+        pass
+    assert compile_row_serializer(post, None, None) is not plan
+
+
+@pytest.mark.asyncio
+async def test_query_model_query_count_does_not_grow_with_rows() -> None:
+    result = await query_model(app_label="blog", model_name="Post", limit=1000)
+
+    assert "error" not in result
+    assert result["returned_count"] > 1
+    assert all("author_str" in post for post in result["results"])
+    # One COUNT plus one SELECT joining author and category
+    assert result["query_count"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "order_by",
+    [None, ["published_at"], ["-published_at"], ["-view_count", "title"], ["status"]],
+)
+async def test_query_model_cursor_pages_match_single_page(
+    order_by: list[str] | None,
+) -> None:
+    full = await query_model(
+        app_label="blog", model_name="Post", order_by=order_by, limit=1000
+    )
+    assert full["next_cursor"] is None
+
+    paged_ids = []
+    cursor = None
+    for _ in range(full["total_count"] + 1):
+        page = await query_model(
+            app_label="blog",
+            model_name="Post",
+            order_by=order_by,
+            limit=1,
+            cursor=cursor,
+        )
+        assert "error" not in page
+        assert page["total_count"] == full["total_count"]
+        paged_ids.extend(post["id"] for post in page["results"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert paged_ids == [post["id"] for post in full["results"]]
+
+
+@pytest.mark.asyncio
+async def test_query_model_rejects_foreign_cursor() -> None:
+    page = await query_model(app_label="blog", model_name="Post", limit=1)
+    assert page["next_cursor"] is not None
+
+    other_query = await query_model(
+        app_label="blog",
+        model_name="Post",
+        order_by=["title"],
+        cursor=page["next_cursor"],
+    )
+    malformed = await query_model(app_label="blog", model_name="Post", cursor="bogus")
+
+    assert "Cursor does not match this query" in other_query["error"]
+    assert malformed["error"] == "Invalid cursor: 'bogus'"
+
+
+@pytest.mark.asyncio
+async def test_query_model_projects_fields() -> None:
+    result = await query_model(
+        app_label="blog", model_name="Post", fields=["title", "author"]
+    )
+
+    assert "error" not in result
+    assert result["fields"] == ["id", "title", "author"]
+    for post in result["results"]:
+        assert set(post) == {"id", "title", "author", "author_str"}
+    # Deferred columns are never loaded afterwards, one row at a time
+    assert result["query_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_query_model_truncates_long_values() -> None:
+    full = await query_model(app_label="blog", model_name="Post", order_by=["title"])
+    truncated = await query_model(
+        app_label="blog",
+        model_name="Post",
+        order_by=["title"],
+        max_value_length=10,
+    )
+
+    assert "error" not in truncated
+    assert truncated["query_count"] == 2
+    for full_post, post in zip(full["results"], truncated["results"]):
+        assert post["title"] == full_post["title"][:10] + "…[truncated]"
+        assert post["title_length"] == len(full_post["title"])
+        assert post["content_length"] == len(full_post["content"])
+        assert post["status"] == full_post["status"]
+        assert "status_length" not in post
+
+
+@pytest.mark.asyncio
+async def test_query_model_invalid_projection_returns_error() -> None:
+    unknown_field = await query_model(
+        app_label="blog", model_name="Post", fields=["title", "missing"]
+    )
+    reverse_relation = await query_model(
+        app_label="blog", model_name="Post", fields=["comments"]
+    )
+    bad_length = await query_model(
+        app_label="blog", model_name="Post", max_value_length=0
+    )
+
+    assert unknown_field == {"error": "Invalid fields: missing"}
+    assert reverse_relation == {"error": "Invalid fields: comments"}
+    assert bad_length == {"error": "max_value_length must be greater than 0"}
+
+
+@pytest.mark.asyncio
+async def test_query_model_count_modes() -> None:
+    exact = await query_model(app_label="blog", model_name="Post")
+    skipped = await query_model(app_label="blog", model_name="Post", count_mode="none")
+    # SQLite has no planner estimate, so estimate falls back to an exact count
+    estimate = await query_model(
+        app_label="blog", model_name="Post", count_mode="estimate"
+    )
+
+    assert exact["count_source"] == "exact"
+    assert exact["total_count_capped"] is False
+    assert skipped["total_count"] is None
+    assert skipped["count_source"] == "none"
+    assert skipped["query_count"] == exact["query_count"] - 1
+    assert estimate["count_source"] == "exact"
+    assert estimate["total_count"] == exact["total_count"]
+
+
+@pytest.mark.asyncio
+async def test_query_model_caps_exact_count() -> None:
+    capped = await query_model(app_label="blog", model_name="Post", count_cap=1)
+    uncapped = await query_model(app_label="blog", model_name="Post", count_cap=1000)
+
+    assert capped["total_count"] == 1
+    assert capped["total_count_capped"] is True
+    assert uncapped["total_count_capped"] is False
+    assert uncapped["total_count"] == uncapped["returned_count"]
+
+
+@pytest.mark.asyncio
+async def test_query_model_invalid_count_options() -> None:
+    bad_mode = await query_model(app_label="blog", model_name="Post", count_mode="x")
+    bad_cap = await query_model(app_label="blog", model_name="Post", count_cap=0)
+
+    assert bad_mode == {
+        "error": "Invalid count_mode 'x': expected exact, estimate or none"
+    }
+    assert bad_cap == {"error": "count_cap must be greater than 0"}
+
+
+@pytest.mark.asyncio
+async def test_query_model_streams_rows_through_progress() -> None:
+    mcp_server = FastMCP("test-server")
+    register_tools(mcp_server)
+    progress_updates = []
+
+    async def on_progress(progress: float, total: float | None, message: str | None):
+        progress_updates.append((progress, total, json.loads(message)["rows"]))
+
+    async with Client(mcp_server) as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+        streamed = await client.call_tool(
+            "query_model",
+            {
+                "app_label": "blog",
+                "model_name": "Post",
+                "stream": True,
+                "chunk_size": 2,
+            },
+            progress_handler=on_progress,
+        )
+        regular = await client.call_tool(
+            "query_model", {"app_label": "blog", "model_name": "Post"}
+        )
+
+    assert "ctx" not in tools["query_model"].inputSchema["properties"]
+    assert streamed.data["streamed"] is True
+    assert streamed.data["results"] == []
+    assert streamed.data["returned_count"] == regular.data["returned_count"]
+    assert [rows for _, _, rows in progress_updates] == [
+        regular.data["results"][i : i + 2]
+        for i in range(0, regular.data["returned_count"], 2)
+    ]
+    assert progress_updates[-1][:2] == (
+        regular.data["returned_count"],
+        regular.data["total_count"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_model_stream_without_context_returns_rows() -> None:
+    result = await query_model(app_label="blog", model_name="Post", stream=True)
+
+    assert result["streamed"] is False
+    assert len(result["results"]) == result["returned_count"]
+
+
+def decode_columns(result):
+    """Turn a format="columns" result back into row dictionaries."""
+    rows = []
+    for values in result["results"]:
+        row = {}
+        for name, value in zip(result["columns"], values):
+            if name in result["dictionaries"] and value is not None:
+                value = result["dictionaries"][name][value]
+            row[name] = value
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_query_model_columns_format() -> None:
+    regular = await query_model(app_label="blog", model_name="Post")
+    columnar = await query_model(app_label="blog", model_name="Post", format="columns")
+
+    assert columnar["format"] == "columns"
+    assert columnar["columns"] == list(regular["results"][0])
+    assert all(len(row) == len(columnar["columns"]) for row in columnar["results"])
+    assert set(columnar["dictionaries"]) == {"author_str", "category_str"}
+    author_index = columnar["columns"].index("author_str")
+    assert {row[author_index] for row in columnar["results"]} <= set(
+        range(len(columnar["dictionaries"]["author_str"]))
+    )
+    assert decode_columns(columnar) == [
+        {name: row.get(name) for name in columnar["columns"]}
+        for row in regular["results"]
+    ]
+
+
+def test_encode_columns_uses_fixed_header() -> None:
+    post = apps.get_model("blog", "Post")
+    plan = compile_row_serializer(post, ("title", "author"), 5)
+
+    alice = apps.get_model("auth", "User")(pk=1, username="alice")
+
+    def row(pk, title, author):
+        # Titles are cut in SQL, read as a (Left, Length) annotation pair
+        obj = SimpleNamespace(id=pk, author=author)
+        obj.mcp_left_title, obj.mcp_length_title = title[:5], len(title)
+        return plan.serialize_values(obj)
+
+    encoded = encode_columns(
+        plan,
+        [
+            row(1, "Hello world", alice),
+            row(2, "Hi", None),
+            row(3, "Hey", alice),
+        ],
+    )
+
+    # Length and "_str" columns are present even where no row fills them
+    assert encoded == {
+        "columns": ["id", "title", "title_length", "author", "author_str"],
+        "dictionaries": {"author_str": ["alice"]},
+        "rows": [
+            [1, "Hello" + TRUNCATION_MARKER, 11, 1, 0],
+            [2, "Hi", None, None, None],
+            [3, "Hey", None, 1, 0],
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_query_model_invalid_format() -> None:
+    result = await query_model(app_label="blog", model_name="Post", format="xml")
+
+    assert result == {"error": "Invalid format 'xml': expected rows or columns"}
+
+
+@pytest.mark.asyncio
+async def test_query_model_streams_columns_through_progress() -> None:
+    mcp_server = FastMCP("test-server")
+    register_tools(mcp_server)
+    chunks = []
+
+    async def on_progress(progress: float, total: float | None, message: str | None):
+        chunks.append(json.loads(message))
+
+    async with Client(mcp_server) as client:
+        streamed = await client.call_tool(
+            "query_model",
+            {
+                "app_label": "blog",
+                "model_name": "Post",
+                "format": "columns",
+                "stream": True,
+                "chunk_size": 2,
+            },
+            progress_handler=on_progress,
+        )
+        regular = await client.call_tool(
+            "query_model",
+            {"app_label": "blog", "model_name": "Post", "format": "columns"},
+        )
+
+    assert streamed.data["format"] == "columns"
+    assert streamed.data["results"] == []
+    decoded = [
+        row
+        for chunk in chunks
+        for row in decode_columns({**chunk, "results": chunk["rows"]})
+    ]
+    assert decoded == decode_columns(regular.data)
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__]))
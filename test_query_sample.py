@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""Tests for the sample mode of the query_model MCP tool."""
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from django_ai_boost.server_fastmcp import query_model, sample_queryset_pks
+
+
+@pytest.mark.asyncio
+async def test_query_model_sample_is_repeatable_with_seed() -> None:
+    first = await query_model(
+        app_label="auth", model_name="Permission", sample=5, seed=42
+    )
+    second = await query_model(
+        app_label="auth", model_name="Permission", sample=5, seed=42
+    )
+    everything = await query_model(
+        app_label="auth", model_name="Permission", limit=1000
+    )
+
+    assert "error" not in first
+    assert first["sample_method"] == "pk_probe"
+    assert first["returned_count"] == 5
+    assert first["next_cursor"] is None
+    assert first["results"] == second["results"]
+    assert {row["id"] for row in first["results"]} < {
+        row["id"] for row in everything["results"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_query_model_sample_applies_filters_and_ordering() -> None:
+    result = await query_model(
+        app_label="blog",
+        model_name="Post",
+        filters={"status": "published"},
+        order_by=["pk"],
+        sample=10,
+        seed=1,
+    )
+    published = await query_model(
+        app_label="blog", model_name="Post", filters={"status": "published"}
+    )
+
+    # Smaller populations are returned whole
+    assert result["returned_count"] == published["returned_count"]
+    assert [row["id"] for row in result["results"]] == sorted(
+        row["id"] for row in published["results"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_model_sample_skips_count_by_default() -> None:
+    sampled = await query_model(app_label="blog", model_name="Post", sample=2)
+    counted = await query_model(
+        app_label="blog", model_name="Post", sample=2, count_mode="exact"
+    )
+    everything = await query_model(app_label="blog", model_name="Post")
+
+    assert sampled["total_count"] is None
+    assert sampled["count_source"] == "none"
+    assert counted["total_count"] == everything["total_count"]
+
+
+@pytest.mark.asyncio
+async def test_sample_queryset_pks_probes_random_pks() -> None:
+    from django.contrib.auth.models import Permission
+
+    pks = set(
+        await sync_to_async(list)(Permission.objects.values_list("pk", flat=True))
+    )
+
+    samples = [
+        await sync_to_async(sample_queryset_pks)(Permission.objects.all(), 3, seed)
+        for seed in (1, 1, 2)
+    ]
+
+    assert samples[0] == samples[1]
+    for sampled, method in samples:
+        assert method == "pk_probe"
+        assert len(set(sampled)) == 3
+        assert set(sampled) <= pks
+
+
+@pytest.mark.asyncio
+async def test_sample_queryset_pks_falls_back_for_non_integer_pks() -> None:
+    from django.contrib.sessions.models import Session
+
+    sampled, method = await sync_to_async(sample_queryset_pks)(Session.objects.all(), 3)
+
+    assert method == "random_order"
+    assert len(sampled) <= 3
+
+
+@pytest.mark.asyncio
+async def test_query_model_sample_errors() -> None:
+    invalid = await query_model(app_label="blog", model_name="Post", sample=0)
+    page = await query_model(app_label="blog", model_name="Post", limit=1)
+    with_cursor = await query_model(
+        app_label="blog", model_name="Post", sample=1, cursor=page["next_cursor"]
+    )
+
+    assert invalid == {"error": "sample must be greater than 0"}
+    assert with_cursor == {"error": "Cursors are not supported with sample"}
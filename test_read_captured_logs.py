@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""Tests for the in-memory log capture handler and read_captured_logs tool."""
+
+import logging
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from django_ai_boost.server_fastmcp import (
+    LOG_CAPTURE_MAX_MESSAGE_LENGTH,
+    TRUNCATION_MARKER,
+    LogCaptureHandler,
+    install_log_capture,
+    read_captured_logs,
+)
+
+
+@pytest.fixture
+def capture_handler() -> LogCaptureHandler:
+    handler = install_log_capture()
+    assert handler is not None
+    return handler
+
+
+def test_log_capture_handler_is_bounded() -> None:
+    handler = LogCaptureHandler(capacity=3)
+    test_logger = logging.getLogger(f"capture_test_{uuid4().hex}")
+    test_logger.addHandler(handler)
+    test_logger.propagate = False
+
+    for i in range(10):
+        test_logger.warning("message %d of %s", i, "ten")
+
+    records = handler.snapshot()
+    assert len(records) == 3
+    assert [record.message for record in records] == [
+        "message 7 of ten",
+        "message 8 of ten",
+        "message 9 of ten",
+    ]
+    assert not hasattr(records[0], "__dict__")
+
+
+def test_log_capture_handler_freezes_messages() -> None:
+    class Unrenderable:
+        def __str__(self) -> str:
+            raise RuntimeError("relation not loaded")
+
+    handler = LogCaptureHandler(capacity=3)
+    test_logger = logging.getLogger(f"capture_test_{uuid4().hex}")
+    test_logger.addHandler(handler)
+    test_logger.propagate = False
+
+    test_logger.warning("saved %s", Unrenderable())
+    test_logger.warning("%s", "x" * (LOG_CAPTURE_MAX_MESSAGE_LENGTH + 10))
+
+    unrenderable, long_message = handler.snapshot()
+    assert unrenderable.message.startswith("saved %s (<")
+    assert not hasattr(unrenderable, "args")
+    assert len(long_message.message) == LOG_CAPTURE_MAX_MESSAGE_LENGTH + len(
+        TRUNCATION_MARKER
+    )
+
+
+def test_install_log_capture_is_idempotent(capture_handler: LogCaptureHandler) -> None:
+    assert install_log_capture() is capture_handler
+    assert logging.getLogger().handlers.count(capture_handler) == 1
+    # The fixture project's "django" logger does not propagate to the root logger
+    assert capture_handler in logging.getLogger("django").handlers
+
+
+async def test_read_captured_logs_filters(capture_handler: LogCaptureHandler) -> None:
+    marker = f"captured_{uuid4().hex}"
+    test_logger = logging.getLogger("django_ai_boost.tests.capture")
+    test_logger.info(f"{marker} info")
+    test_logger.error(f"{marker} error")
+    try:
+        raise ValueError(marker)
+    except ValueError:
+        test_logger.exception("request failed")
+
+    result = await read_captured_logs(
+        min_level="ERROR",
+        logger_name="django_ai_boost.tests",
+        pattern=marker,
+    )
+
+    assert "error" not in result
+    assert result["capacity"] == capture_handler.capacity
+    messages = [record["message"] for record in result["records"]]
+    assert messages == [f"{marker} error", "request failed"]
+    assert "ValueError" in result["records"][1]["exc_text"]
+    assert result["records"][0]["level"] == "ERROR"
+
+
+async def test_read_captured_logs_time_window(
+    capture_handler: LogCaptureHandler,
+) -> None:
+    marker = f"captured_window_{uuid4().hex}"
+    logging.getLogger("django_ai_boost.tests").warning(marker)
+
+    future = (datetime.now() + timedelta(hours=1)).isoformat()
+    recent = await read_captured_logs(
+        since=(datetime.now() - timedelta(minutes=1)).isoformat()
+    )
+    none_yet = await read_captured_logs(since=future)
+
+    assert any(record["message"] == marker for record in recent["records"])
+    assert none_yet["records"] == []
+
+
+async def test_read_captured_logs_invalid_inputs(
+    capture_handler: LogCaptureHandler,
+) -> None:
+    assert await read_captured_logs(lines=0) == {
+        "error": "lines must be greater than 0"
+    }
+    assert await read_captured_logs(min_level="LOUD") == {
+        "error": "Invalid min_level 'LOUD'"
+    }
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -1,13 +1,31 @@
 #!/usr/bin/env python
 """Tests for the read_recent_logs tool."""
 
+import gzip
 import logging
+import os
+import re
+import threading
 from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
 from uuid import uuid4
 
 import pytest
+from django.test import override_settings
 
-from django_ai_boost.server_fastmcp import read_recent_logs
+from django_ai_boost import server_fastmcp
+from django_ai_boost.server_fastmcp import (
+    LogFilter,
+    LogFormat,
+    find_log_offset,
+    find_rotated_log_files,
+    fingerprint_log_exception,
+    group_log_exceptions,
+    iter_log_lines_reversed,
+    read_log_file,
+    read_recent_logs,
+)
 
 
 async def test_read_recent_logs_success(
@@ -48,5 +66,613 @@ async def test_read_recent_logs_invalid_inputs() -> None:
     }
 
 
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"\n",
+        b"single line",
+        b"first\nsecond\n",
+        b"first\nsecond",
+        b"\nleading blank\n\ntrailing blank\n\n",
+        b"windows\r\nline endings\r\n",
+        "caf\u00e9 \u65e5\u672c\u8a9e \U0001f600\n".encode() * 40,
+        b"broken \xff\xfe bytes\nok\n",
+    ],
+)
+@pytest.mark.parametrize("block_size", [1, 3, 7, 64 * 1024])
+def test_tail_log_file_matches_text_mode_reader(
+    tmp_path: Path, content: bytes, block_size: int
+) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_bytes(content)
+    with log_path.open("r", encoding="utf-8", errors="replace") as log_file:
+        expected = [line.rstrip("\n") for line in log_file]
+
+    with log_path.open("rb") as log_file:
+        reversed_lines = list(
+            iter_log_lines_reversed(log_file, len(content), block_size=block_size)
+        )
+
+    assert reversed_lines[::-1] == expected
+    assert read_log_file(log_path, 3)["lines"] == expected[-3:]
+
+
+def test_tail_log_file_reads_only_the_end(tmp_path: Path) -> None:
+    log_path = tmp_path / "big.log"
+    log_path.write_bytes(b"x" * 1_000_000 + b"\nlast line\n")
+
+    class CountingReader:
+        def __init__(self, raw_file) -> None:
+            self.raw_file = raw_file
+            self.bytes_read = 0
+
+        def seek(self, offset: int) -> None:
+            self.raw_file.seek(offset)
+
+        def read(self, size: int) -> bytes:
+            data = self.raw_file.read(size)
+            self.bytes_read += len(data)
+            return data
+
+    with log_path.open("rb") as raw_file:
+        reader = CountingReader(raw_file)
+        lines = iter_log_lines_reversed(reader, log_path.stat().st_size, block_size=16)
+
+        assert next(lines) == "last line"
+        assert reader.bytes_read <= 32
+
+
+def test_read_log_file_follows_appended_lines(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("one\ntwo\n")
+
+    first = read_log_file(log_path, 10)
+    assert first["lines"] == ["one", "two"]
+    assert first["cursor_status"] == "tail"
+
+    with log_path.open("a") as log_file:
+        log_file.write("three\nfour\nfive\npartial")
+
+    second = read_log_file(log_path, 2, first["cursor"])
+    assert second["lines"] == ["three", "four"]
+    assert second["cursor_status"] == "continued"
+    assert second["more_available"] is True
+
+    third = read_log_file(log_path, 10, second["cursor"])
+    assert third["lines"] == ["five"]
+    assert third["more_available"] is False
+
+    idle = read_log_file(log_path, 10, third["cursor"])
+    assert idle["lines"] == []
+    assert idle["cursor"] == third["cursor"]
+
+
+def test_read_log_file_follow_rereads_partial_tail_line(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("one\ntwo\npart")
+
+    tail = read_log_file(log_path, 10)
+    assert tail["lines"] == ["one", "two", "part"]
+
+    with log_path.open("a") as log_file:
+        log_file.write("ial\nthree\n")
+
+    follow = read_log_file(log_path, 10, tail["cursor"])
+    assert follow["lines"] == ["partial", "three"]
+
+
+def test_read_log_file_detects_truncation_and_rotation(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("old line one\nold line two\n")
+    cursor = read_log_file(log_path, 10)["cursor"]
+
+    log_path.write_text("new\n")
+    truncated = read_log_file(log_path, 10, cursor)
+    assert truncated["cursor_status"] == "truncated"
+    assert truncated["lines"] == ["new"]
+
+    log_path.rename(tmp_path / "app.log.1")
+    log_path.write_text("rotated one\nrotated two\nrotated three\n")
+    rotated = read_log_file(log_path, 10, truncated["cursor"])
+    assert rotated["cursor_status"] == "rotated"
+    assert rotated["lines"] == ["rotated one", "rotated two", "rotated three"]
+
+
+def test_read_log_file_walks_rotation_set(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("live 1\n")
+    (tmp_path / "app.log.1").write_text("one 1\none 2\n")
+    with gzip.open(tmp_path / "app.log.2.gz", "wt") as archive:
+        archive.writelines(f"two {i}\n" for i in range(1, 1001))
+    (tmp_path / "app.log.3.gz").write_bytes(b"not read")
+    (tmp_path / "app.log.lock").write_text("ignored")
+    for age, name in enumerate(
+        ["app.log", "app.log.1", "app.log.2.gz", "app.log.3.gz"]
+    ):
+        os.utime(tmp_path / name, (1_000_000 - age, 1_000_000 - age))
+
+    assert [path.name for path in find_rotated_log_files(log_path)] == [
+        "app.log.1",
+        "app.log.2.gz",
+        "app.log.3.gz",
+    ]
+
+    result = read_log_file(log_path, 5)
+    assert result["lines"] == ["two 999", "two 1000", "one 1", "one 2", "live 1"]
+    assert result["rotated_files"] == [
+        str(tmp_path / "app.log.1"),
+        str(tmp_path / "app.log.2.gz"),
+    ]
+
+    live_only = read_log_file(log_path, 5, include_rotated=False)
+    assert live_only["lines"] == ["live 1"]
+    assert live_only["rotated_files"] == []
+
+
+def test_read_log_file_cursor_drains_rotated_file(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("before\n")
+    cursor = read_log_file(log_path, 10)["cursor"]
+
+    with log_path.open("a") as log_file:
+        log_file.write("missed 1\nmissed 2\n")
+    log_path.rename(tmp_path / "app.log.1")
+    log_path.write_text("after\n")
+
+    partial = read_log_file(log_path, 1, cursor)
+    assert partial["lines"] == ["missed 1"]
+    assert partial["more_available"] is True
+
+    rest = read_log_file(log_path, 10, partial["cursor"])
+    assert rest["cursor_status"] == "rotated"
+    assert rest["lines"] == ["missed 2", "after"]
+    assert rest["rotated_files"] == [str(tmp_path / "app.log.1")]
+
+
+VERBOSE_FORMAT = LogFormat.from_config(
+    {"format": "{asctime} [{levelname:<8}] {name}: {message}", "style": "{"}
+)
+LOG_START = datetime(2025, 3, 1, 12, 0, 0)
+
+
+def write_sample_log(log_path: Path, records: int) -> None:
+    """Write one record per second, with a traceback on every tenth record."""
+    with log_path.open("w") as log_file:
+        for i in range(records):
+            timestamp = (LOG_START + timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S")
+            level = "ERROR" if i % 10 == 0 else "INFO"
+            logger_name = "django.request" if i % 2 == 0 else "myapp.views"
+            log_file.write(f"{timestamp},000 [{level:<8}] {logger_name}: record {i}\n")
+            if level == "ERROR":
+                log_file.write("Traceback (most recent call last):\n")
+                log_file.write(f'  File "views.py", line {i}, in handler\n')
+                log_file.write(f"ValueError: failure {i}\n")
+
+
+def test_log_format_parses_formatter_styles() -> None:
+    percent_format = LogFormat.from_config(
+        {
+            "format": "%(asctime)s [%(levelname)-8s] %(name)s:%(lineno)d %(message)s",
+            "datefmt": "%d/%b/%Y %H:%M:%S",
+        }
+    )
+    fields = percent_format.parse(
+        "02/Jan/2025 03:04:05 [INFO    ] django.db:12 ok: done"
+    )
+
+    assert fields == {
+        "asctime": "02/Jan/2025 03:04:05",
+        "levelname": "INFO",
+        "name": "django.db",
+        "lineno": "12",
+        "message": "ok: done",
+    }
+    assert percent_format.timestamp(fields) == datetime(2025, 1, 2, 3, 4, 5)
+    assert percent_format.parse("Traceback (most recent call last):") is None
+
+    brace_format = LogFormat.from_config(
+        {"format": "{levelname} {asctime} {module} {message}", "style": "{"}
+    )
+    fields = brace_format.parse("WARNING 2025-01-02 03:04:05,678 views Not Found: /x")
+    assert fields is not None
+    assert fields["levelname"] == "WARNING"
+    assert brace_format.timestamp(fields) == datetime(2025, 1, 2, 3, 4, 5, 678000)
+
+    assert LogFormat.from_config(None).parse("anything") == {"message": "anything"}
+
+
+def test_read_log_file_filters_whole_records(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    write_sample_log(log_path, 100)
+
+    errors = read_log_file(
+        log_path, 8, log_filter=LogFilter(VERBOSE_FORMAT, min_level=logging.ERROR)
+    )
+    assert errors["lines"] == [
+        "2025-03-01 12:01:20,000 [ERROR   ] django.request: record 80",
+        "Traceback (most recent call last):",
+        '  File "views.py", line 80, in handler',
+        "ValueError: failure 80",
+        "2025-03-01 12:01:30,000 [ERROR   ] django.request: record 90",
+        "Traceback (most recent call last):",
+        '  File "views.py", line 90, in handler',
+        "ValueError: failure 90",
+    ]
+
+    by_logger = read_log_file(
+        log_path,
+        3,
+        log_filter=LogFilter(VERBOSE_FORMAT, logger_prefix="myapp"),
+    )
+    assert [line.split(": ")[-1] for line in by_logger["lines"]] == [
+        "record 95",
+        "record 97",
+        "record 99",
+    ]
+
+    by_pattern = read_log_file(
+        log_path,
+        100,
+        log_filter=LogFilter(VERBOSE_FORMAT, pattern=re.compile(r"failure 5\d")),
+    )
+    assert by_pattern["lines"][0].endswith("record 50")
+    assert len(by_pattern["lines"]) == 4
+
+
+def test_read_log_file_follows_filtered_records(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("")
+    errors_only = LogFilter(VERBOSE_FORMAT, min_level=logging.ERROR)
+    cursor = read_log_file(log_path, 5, log_filter=errors_only)["cursor"]
+    write_sample_log(log_path, 30)
+
+    first = read_log_file(log_path, 6, cursor, log_filter=errors_only)
+    assert first["lines"][0].endswith("record 0")
+    assert len(first["lines"]) == 4
+    assert first["more_available"] is True
+
+    second = read_log_file(log_path, 10, first["cursor"], log_filter=errors_only)
+    assert second["lines"][0].endswith("record 10")
+    assert second["lines"][4].endswith("record 20")
+    assert len(second["lines"]) == 8
+    assert second["more_available"] is False
+
+
+def test_read_log_file_time_window(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    write_sample_log(log_path, 1000)
+
+    window = LogFilter(
+        VERBOSE_FORMAT,
+        since=LOG_START + timedelta(seconds=500),
+        until=LOG_START + timedelta(seconds=504),
+    )
+    result = read_log_file(log_path, 100, log_filter=window)
+
+    assert [line for line in result["lines"] if "record" in line] == [
+        f"{(LOG_START + timedelta(seconds=i)):%Y-%m-%d %H:%M:%S},000 "
+        f"[{'ERROR' if i == 500 else 'INFO':<8}] "
+        f"{'django.request' if i % 2 == 0 else 'myapp.views'}: record {i}"
+        for i in range(500, 505)
+    ]
+
+
+def test_read_log_file_time_window_uses_sparse_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(server_fastmcp, "LOG_INDEX_BLOCK_SIZE", 2048)
+    monkeypatch.setenv("DJANGO_MCP_LOG_INDEX_DIR", str(tmp_path / "index"))
+    log_path = tmp_path / "app.log"
+    write_sample_log(log_path, 1000)
+
+    window = LogFilter(
+        VERBOSE_FORMAT,
+        since=LOG_START + timedelta(seconds=700),
+        until=LOG_START + timedelta(seconds=702),
+    )
+    expected = [f"record {i}" for i in range(700, 703)]
+
+    built = read_log_file(log_path, 100, log_filter=window)
+    assert [
+        line.split(": ")[-1] for line in built["lines"] if "record" in line
+    ] == expected
+    assert built["index"]["status"] == "built"
+    assert built["index"]["entries"] > 10
+    assert built["index"]["size_bytes"] > 0
+    assert len(list((tmp_path / "index").glob("*.json"))) == 1
+
+    assert read_log_file(log_path, 100, log_filter=window)["index"]["status"] == "hit"
+
+    with log_path.open("a") as log_file:
+        log_file.write("2025-03-01 13:00:00,000 [INFO    ] myapp: appended\n" * 200)
+    extended = read_log_file(log_path, 100, log_filter=window)
+    assert extended["index"]["status"] == "extended"
+    assert extended["index"]["entries"] > built["index"]["entries"]
+    assert extended["lines"] == built["lines"]
+
+    log_path.rename(tmp_path / "app.log.1")
+    write_sample_log(log_path, 1000)
+    rebuilt = read_log_file(log_path, 100, log_filter=window)
+    assert rebuilt["index"]["status"] == "rebuilt"
+    assert rebuilt["lines"] == built["lines"]
+
+
+def test_find_log_offset_matches_linear_scan(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    write_sample_log(log_path, 300)
+    content = log_path.read_bytes()
+
+    record_offsets = []
+    offset = 0
+    for line in content.splitlines(keepends=True):
+        if VERBOSE_FORMAT.parse(line.decode().rstrip("\n")):
+            record_offsets.append(offset)
+        offset += len(line)
+
+    with log_path.open("rb") as log_file:
+        for seconds in (-5, 0, 1, 150, 299, 400):
+            target = LOG_START + timedelta(seconds=seconds)
+            expected_index = min(max(seconds, 0), len(record_offsets))
+            expected = (
+                record_offsets[expected_index]
+                if expected_index < len(record_offsets)
+                else len(content)
+            )
+            assert (
+                find_log_offset(
+                    log_file, len(content), VERBOSE_FORMAT, lambda ts: ts >= target
+                )
+                == expected
+            )
+
+
+async def test_read_recent_logs_cursor_round_trip(
+    flush_root_handlers: Callable[[], None],
+) -> None:
+    first = await read_recent_logs(lines=5, handler_name="file")
+    cursor = first["logs"][0]["cursor"]
+
+    marker = f"read_recent_logs_cursor_{uuid4().hex}"
+    logging.getLogger("django_ai_boost.tests").info(marker)
+    flush_root_handlers()
+
+    result = await read_recent_logs(
+        lines=50, handler_name="file", cursors={"file": cursor}
+    )
+
+    log_result = result["logs"][0]
+    assert log_result["cursor_status"] == "continued"
+    assert any(marker in line for line in log_result["lines"])
+    assert log_result["cursor"] != cursor
+
+
+async def test_read_recent_logs_invalid_cursor() -> None:
+    result = await read_recent_logs(handler_name="file", cursors={"file": "bogus"})
+
+    assert result["logs"][0]["error"] == "Invalid cursor: 'bogus'"
+
+
+async def test_read_recent_logs_level_filter(
+    flush_root_handlers: Callable[[], None],
+) -> None:
+    marker = f"read_recent_logs_filter_{uuid4().hex}"
+    logging.getLogger("django_ai_boost.tests").info(f"{marker} info")
+    logging.getLogger("django_ai_boost.tests").warning(f"{marker} warning")
+    flush_root_handlers()
+
+    result = await read_recent_logs(
+        lines=50, handler_name="file", min_level="warning", pattern=marker
+    )
+
+    assert result["filters"]["min_level"] == "warning"
+    assert result["logs"][0]["lines"] == [
+        line for line in result["logs"][0]["lines"] if line.startswith("WARNING")
+    ]
+    assert any(f"{marker} warning" in line for line in result["logs"][0]["lines"])
+    assert not any(f"{marker} info" in line for line in result["logs"][0]["lines"])
+
+
+async def test_read_recent_logs_invalid_filters() -> None:
+    invalid_level = await read_recent_logs(min_level="LOUD")
+    invalid_pattern = await read_recent_logs(pattern="(")
+    invalid_since = await read_recent_logs(since="yesterday")
+    missing_field = await read_recent_logs(handler_name="file", logger_name="django")
+
+    assert invalid_level == {"error": "Invalid min_level 'LOUD'"}
+    assert invalid_pattern["error"].startswith("Invalid pattern")
+    assert invalid_since == {
+        "error": "Invalid timestamp 'yesterday': expected ISO 8601"
+    }
+    assert missing_field["logs"][0]["error"] == (
+        "Cannot apply filters: the handler's log format has no name field"
+    )
+
+
+def test_fingerprint_log_exception_ignores_line_numbers() -> None:
+    def traceback_record(line_number: int, exception: str) -> list[str]:
+        return [
+            "2025-03-01 12:00:00,000 [ERROR   ] django.request: boom",
+            "Traceback (most recent call last):",
+            f'  File "app/views.py", line {line_number}, in detail',
+            "    return do_work()",
+            '  File "app/work.py", line 3, in do_work',
+            exception,
+        ]
+
+    first = fingerprint_log_exception(traceback_record(10, "KeyError: 'a'"))
+    moved = fingerprint_log_exception(traceback_record(42, "KeyError: 'b'"))
+    other_type = fingerprint_log_exception(traceback_record(10, "ValueError: 'a'"))
+
+    assert first is not None and moved is not None and other_type is not None
+    assert first[0] == moved[0]
+    assert first[0] != other_type[0]
+    assert first[1:] == (
+        "KeyError",
+        "'a'",
+        ["app/views.py:detail", "app/work.py:do_work"],
+    )
+    assert fingerprint_log_exception(["plain record"]) is None
+
+
+def test_group_log_exceptions(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    write_sample_log(log_path, 60)
+
+    result = group_log_exceptions(log_path, 5, VERBOSE_FORMAT)
+
+    assert len(result["exceptions"]) == 1
+    group = result["exceptions"][0]
+    assert group["exception_type"] == "ValueError"
+    assert group["message"] == "failure 50"
+    assert group["count"] == 6
+    assert group["first_seen"] == LOG_START.isoformat()
+    assert group["last_seen"] == (LOG_START + timedelta(seconds=50)).isoformat()
+    assert group["sample"][0].endswith("record 50")
+    assert [line.rsplit(" ", 1)[1] for line in result["lines"]] == [
+        "55",
+        "56",
+        "57",
+        "58",
+        "59",
+    ]
+
+    with log_path.open("a") as log_file:
+        log_file.write("2025-03-01 12:01:00,000 [ERROR   ] myapp.views: late\n")
+        log_file.write("Traceback (most recent call last):\n")
+        log_file.write('  File "tasks.py", line 1, in run\n')
+        log_file.write("KeyError: 'x'\n")
+
+    followed = group_log_exceptions(
+        log_path, 5, VERBOSE_FORMAT, cursor=result["cursor"]
+    )
+    assert followed["cursor_status"] == "continued"
+    assert followed["lines"] == []
+    assert [group["exception_type"] for group in followed["exceptions"]] == ["KeyError"]
+
+
+def test_group_log_exceptions_drains_rotated_file(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    write_sample_log(log_path, 10)
+    cursor = group_log_exceptions(log_path, 5, VERBOSE_FORMAT)["cursor"]
+
+    with log_path.open("a") as log_file:
+        log_file.write("2025-03-01 12:01:00,000 [ERROR   ] myapp.views: late\n")
+        log_file.write("Traceback (most recent call last):\n")
+        log_file.write('  File "tasks.py", line 1, in run\n')
+        log_file.write("KeyError: 'x'\n")
+    log_path.rename(tmp_path / "app.log.1")
+    log_path.write_text("2025-03-01 12:02:00,000 [INFO    ] myapp.views: fresh\n")
+
+    followed = group_log_exceptions(log_path, 5, VERBOSE_FORMAT, cursor=cursor)
+    assert followed["cursor_status"] == "rotated"
+    assert followed["rotated_files"] == [str(tmp_path / "app.log.1")]
+    assert [group["exception_type"] for group in followed["exceptions"]] == ["KeyError"]
+    assert followed["lines"] == [
+        "2025-03-01 12:02:00,000 [INFO    ] myapp.views: fresh"
+    ]
+
+    skipped = group_log_exceptions(
+        log_path, 5, VERBOSE_FORMAT, cursor=cursor, include_rotated=False
+    )
+    assert skipped["rotated_files"] == []
+    assert skipped["exceptions"] == []
+
+
+def test_group_log_exceptions_without_formatter(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    handler = logging.FileHandler(log_path)
+    test_logger = logging.getLogger(f"group_test_{uuid4().hex}")
+    test_logger.addHandler(handler)
+    test_logger.propagate = False
+    for exception in [KeyError("a"), ValueError("b"), KeyError("a")]:
+        try:
+            raise exception
+        except Exception:
+            test_logger.exception("task failed")
+    test_logger.warning("done")
+    handler.close()
+    log_format = LogFormat.from_config(None)
+
+    result = group_log_exceptions(log_path, 5, log_format)
+
+    assert [
+        (group["exception_type"], group["count"]) for group in result["exceptions"]
+    ] == [("KeyError", 2), ("ValueError", 1)]
+    assert result["exceptions"][0]["frames"][-1].endswith(
+        "test_group_log_exceptions_without_formatter"
+    )
+    assert result["lines"] == ["done"]
+
+    # Newest-first grouping keeps the traceback with its record too
+    filtered = read_log_file(
+        log_path, 50, log_filter=LogFilter(log_format, pattern=re.compile("ValueError"))
+    )
+    assert filtered["lines"][0] == "task failed"
+    assert filtered["lines"][-1] == "ValueError: b"
+    assert not any("KeyError" in line for line in filtered["lines"])
+
+
+async def test_read_recent_logs_group_exceptions(
+    flush_root_handlers: Callable[[], None],
+) -> None:
+    marker = f"read_recent_logs_group_{uuid4().hex}"
+    test_logger = logging.getLogger("django_ai_boost.tests")
+    for _ in range(3):
+        try:
+            raise LookupError(marker)
+        except LookupError:
+            test_logger.exception("lookup failed")
+    flush_root_handlers()
+
+    result = await read_recent_logs(
+        lines=50, handler_name="file", group_exceptions=True
+    )
+
+    assert result["group_exceptions"] is True
+    log_result = result["logs"][0]
+    groups = [group for group in log_result["exceptions"] if group["message"] == marker]
+    assert len(groups) == 1
+    assert groups[0]["exception_type"] == "LookupError"
+    assert groups[0]["count"] >= 3
+    assert not any(marker in line for line in log_result["lines"])
+
+
+async def test_read_recent_logs_reads_handlers_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    handler_names = ["zeta", "alpha", "mid"]
+    logging_config = {
+        "version": 1,
+        "handlers": {
+            name: {"class": "logging.FileHandler", "filename": str(tmp_path / name)}
+            for name in handler_names
+        },
+    }
+    for name in handler_names:
+        (tmp_path / name).write_text(f"{name} line\n")
+
+    # Every read waits until all handlers are being read at the same time
+    barrier = threading.Barrier(len(handler_names), timeout=5)
+    original_read_log_file = server_fastmcp.read_log_file
+
+    def blocking_read_log_file(*args, **kwargs):
+        barrier.wait()
+        return original_read_log_file(*args, **kwargs)
+
+    monkeypatch.setattr(server_fastmcp, "read_log_file", blocking_read_log_file)
+    # A malformed worker count falls back to the default instead of failing
+    monkeypatch.setenv("DJANGO_MCP_LOG_READ_WORKERS", "four")
+
+    with override_settings(LOGGING=logging_config):
+        result = await read_recent_logs(lines=5)
+
+    assert [log["handler"] for log in result["logs"]] == sorted(handler_names)
+    for log in result["logs"]:
+        assert "error" not in log
+        assert log["lines"] == [f"{log['handler']} line"]
+        assert log["read_ms"] >= 0
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__]))
@@ -21,8 +21,14 @@ EXPECTED_TOOLS = {
     "get_absolute_url",
     "reverse_url",
     "query_model",
+    "batch_query",
+    "aggregate_model",
+    "explain_query",
     "run_check",
     "read_recent_logs",
+    "summarize_logs",
+    "grep_logs",
+    "read_captured_logs",
 }
 
 
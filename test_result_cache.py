@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""Tests for the signal-invalidated result cache used by the read tools."""
+
+import time
+
+import pytest
+from django.apps import apps
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from django_ai_boost import server_fastmcp
+from django_ai_boost.server_fastmcp import (
+    ToolResultCache,
+    get_absolute_url,
+    query_model,
+)
+
+
+@pytest.fixture
+def result_cache(monkeypatch: pytest.MonkeyPatch) -> ToolResultCache:
+    cache = ToolResultCache(ttl=60, max_size=10)
+    monkeypatch.setattr(server_fastmcp, "RESULT_CACHE", cache)
+    return cache
+
+
+def test_result_cache_bounds_size_and_ttl() -> None:
+    cache = ToolResultCache(ttl=60, max_size=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, frozenset(), {"key": key})
+
+    assert cache.get("a") is None
+    assert cache.get("b") == {"key": "b"}
+
+    short_lived = ToolResultCache(ttl=0.01, max_size=2)
+    short_lived.set("a", frozenset(), {"key": "a"})
+    time.sleep(0.02)
+    assert short_lived.get("a") is None
+    assert (short_lived.hits, short_lived.misses) == (0, 1)
+
+
+def test_result_cache_from_env_ignores_invalid_values(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("DJANGO_MCP_CACHE_TTL", "30s")
+    monkeypatch.setenv("DJANGO_MCP_CACHE_SIZE", "-1")
+
+    cache = ToolResultCache.from_env()
+
+    assert (cache.ttl, cache.max_size) == (0, 256)
+    assert not cache.enabled
+
+
+def test_result_cache_key_normalizes_arguments() -> None:
+    assert ToolResultCache.make_key(
+        "query_model", filters={"a": 1, "b": 2}, limit=5
+    ) == ToolResultCache.make_key("query_model", limit=5, filters={"b": 2, "a": 1})
+
+
+async def test_query_model_uses_result_cache(result_cache: ToolResultCache) -> None:
+    first = await query_model(app_label="blog", model_name="Post", limit=2)
+    second = await query_model(app_label="blog", model_name="Post", limit=2)
+    other = await query_model(app_label="blog", model_name="Post", limit=3)
+
+    assert first["cache"] == {"hit": False, "hits": 0, "misses": 1, "size": 1}
+    assert second["cache"]["hit"] is True
+    assert second["results"] == first["results"]
+    assert (first["cached"], second["cached"]) == (False, True)
+    # A hit reports its own cost, not the original run's
+    assert first["query_count"] > 0
+    assert second["query_count"] == 0
+    assert second["elapsed_ms"] < 100
+    assert other["cache"]["hit"] is False
+    assert result_cache.hits == 1
+
+
+async def test_result_cache_evicted_on_writes(result_cache: ToolResultCache) -> None:
+    post = apps.get_model("blog", "Post")
+    user = apps.get_model("auth", "User")
+    tag = apps.get_model("blog", "Tag")
+
+    await query_model(app_label="blog", model_name="Post", limit=2)
+    await get_absolute_url(app_label="blog", model_name="Post", pk=1)
+    await query_model(app_label="blog", model_name="Tag")
+    assert len(result_cache._entries) == 3
+
+    # A write to a related model evicts the results that display it
+    post_save.send(sender=user, instance=user(), created=False)
+    assert len(result_cache._entries) == 1
+
+    m2m_changed.send(
+        sender=tag.posts.through,
+        instance=post(),
+        action="post_add",
+        reverse=True,
+        model=tag,
+        pk_set={1},
+    )
+    assert len(result_cache._entries) == 0
+
+    await query_model(app_label="blog", model_name="Category")
+    await query_model(app_label="blog", model_name="Post", limit=2)
+    post_delete.send(sender=post, instance=post())
+    assert len(result_cache._entries) == 1
+
+    refreshed = await query_model(app_label="blog", model_name="Post", limit=2)
+    assert refreshed["cache"]["hit"] is False
+
+
+async def test_errors_are_not_cached(result_cache: ToolResultCache) -> None:
+    await get_absolute_url(app_label="blog", model_name="Post", pk=999999)
+    result = await get_absolute_url(app_label="blog", model_name="Post", pk=999999)
+
+    assert "error" in result
+    assert len(result_cache._entries) == 0
+
+
+async def test_result_cache_disabled_by_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("DJANGO_MCP_CACHE_TTL", raising=False)
+    monkeypatch.setattr(server_fastmcp, "RESULT_CACHE", None)
+
+    result = await query_model(app_label="blog", model_name="Post", limit=1)
+
+    assert "cache" not in result
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
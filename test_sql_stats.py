@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""Tests for the opt-in SQL statistics of the database tools."""
+
+import pytest
+
+from django_ai_boost.server_fastmcp import (
+    SQL_STATS_SLOWEST,
+    database_schema,
+    fingerprint_sql,
+    list_migrations,
+    query_model,
+    run_check,
+    run_with_sql_stats,
+)
+
+
+def test_fingerprint_sql_replaces_literals() -> None:
+    assert (
+        fingerprint_sql(
+            "SELECT * FROM blog_post WHERE id IN (%s, %s, %s) AND title = 'it''s'\n LIMIT 21"
+        )
+        == "SELECT * FROM blog_post WHERE id IN (...) AND title = ? LIMIT ?"
+    )
+    assert fingerprint_sql("SELECT 1 FROM t1 WHERE x IN (%s)") == fingerprint_sql(
+        "SELECT 2 FROM t1 WHERE x IN (%s, %s)"
+    )
+
+
+def test_run_with_sql_stats_reports_duplicates_and_slowest() -> None:
+    from blog.models import Post
+
+    pks = list(Post.objects.values_list("pk", flat=True))
+
+    def n_plus_one():
+        for _ in range(SQL_STATS_SLOWEST + 1):
+            for pk in pks:
+                Post.objects.get(pk=pk)
+        return {"done": True}
+
+    result = run_with_sql_stats(n_plus_one, True)
+    sql_stats = result["sql_stats"]
+
+    assert result["done"] is True
+    assert sql_stats["query_count"] == (SQL_STATS_SLOWEST + 1) * len(pks)
+    assert len(sql_stats["slowest"]) == SQL_STATS_SLOWEST
+    timings = [statement["ms"] for statement in sql_stats["slowest"]]
+    assert timings == sorted(timings, reverse=True)
+    assert sql_stats["total_ms"] >= sum(timings) - 0.1
+    [duplicate] = sql_stats["duplicates"]
+    assert duplicate["count"] == sql_stats["query_count"]
+    assert "WHERE" in duplicate["fingerprint"] and "%s" not in duplicate["fingerprint"]
+
+
+def test_run_with_sql_stats_is_opt_in() -> None:
+    assert run_with_sql_stats(lambda: {"done": True}, False) == {"done": True}
+    assert run_with_sql_stats(lambda: [1], True)["results"] == [1]
+
+
+@pytest.mark.asyncio
+async def test_tools_include_sql_stats() -> None:
+    query = await query_model(
+        app_label="blog", model_name="Post", include_sql_stats=True
+    )
+    schema = await database_schema(include_sql_stats=True)
+    migrations = await list_migrations(include_sql_stats=True)
+    checks = await run_check(include_sql_stats=True)
+
+    # Includes the statements that set up the read-only transaction
+    assert query["sql_stats"]["query_count"] > query["query_count"]
+    assert query["sql_stats"]["duplicates"] == []
+    assert schema["sql_stats"]["query_count"] > 0
+    assert migrations["results"] == await list_migrations()
+    assert migrations["sql_stats"]["query_count"] > 0
+    assert checks["sql_stats"]["query_count"] >= 0
+    assert "sql_stats" not in await query_model(app_label="blog", model_name="Post")
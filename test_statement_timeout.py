@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+"""Tests for statement timeouts in the database tools."""
+
+import time
+from contextlib import contextmanager
+
+import pytest
+from django.db import connections
+
+from django_ai_boost import server_fastmcp
+from django_ai_boost.server_fastmcp import (
+    QueryTimeout,
+    aggregate_model,
+    database_schema,
+    explain_query,
+    get_absolute_url,
+    get_tool_timeout,
+    query_model,
+    read_only_transaction,
+    run_query_model,
+    statement_timeout,
+)
+
+SLOW_QUERY = (
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) "
+    "SELECT count(*) FROM (SELECT i FROM n LIMIT 100000000)"
+)
+
+
+def test_get_tool_timeout(monkeypatch) -> None:
+    monkeypatch.delenv("DJANGO_MCP_TIMEOUT", raising=False)
+    monkeypatch.delenv("DJANGO_MCP_TIMEOUT_QUERY_MODEL", raising=False)
+    assert get_tool_timeout("query_model") == 30
+
+    monkeypatch.setenv("DJANGO_MCP_TIMEOUT", "5")
+    assert get_tool_timeout("query_model") == 5
+
+    monkeypatch.setenv("DJANGO_MCP_TIMEOUT_QUERY_MODEL", "0.5")
+    assert get_tool_timeout("query_model") == 0.5
+    assert get_tool_timeout("database_schema") == 5
+
+    monkeypatch.setenv("DJANGO_MCP_TIMEOUT_QUERY_MODEL", "0")
+    assert get_tool_timeout("query_model") is None
+
+
+def test_get_tool_timeout_ignores_invalid_values(monkeypatch, caplog) -> None:
+    monkeypatch.setenv("DJANGO_MCP_TIMEOUT", "5")
+    monkeypatch.setenv("DJANGO_MCP_TIMEOUT_QUERY_MODEL", "soon")
+    assert get_tool_timeout("query_model") == 5
+    assert "Ignoring invalid DJANGO_MCP_TIMEOUT_QUERY_MODEL='soon'" in caplog.text
+
+    monkeypatch.setenv("DJANGO_MCP_TIMEOUT", "-1")
+    assert get_tool_timeout("query_model") == 30
+    monkeypatch.setenv("DJANGO_MCP_TIMEOUT", "nan")
+    assert get_tool_timeout("query_model") == 30
+
+
+def test_statement_timeout_aborts_slow_sqlite_query() -> None:
+    with pytest.raises(QueryTimeout) as exc_info:
+        with read_only_transaction("default"), statement_timeout("default", 0.05):
+            with connections["default"].cursor() as cursor:
+                cursor.execute(SLOW_QUERY)
+
+    result = exc_info.value.as_result()
+    assert result["error"] == "Query timed out after 0.05s"
+    assert result["timed_out"] is True
+    assert result["elapsed_ms"] >= 50
+
+    # The progress handler is removed and the connection is still usable
+    with connections["default"].cursor() as cursor:
+        cursor.execute("SELECT 1")
+        assert cursor.fetchone() == (1,)
+
+
+def test_statement_timeout_applies_to_each_sqlite_statement() -> None:
+    quick_query = SLOW_QUERY.replace("100000000", "20000")
+
+    with read_only_transaction("default"), statement_timeout("default", 0.05):
+        with connections["default"].cursor() as cursor:
+            for _ in range(3):
+                cursor.execute(quick_query)
+                assert cursor.fetchone() == (20000,)
+                time.sleep(0.05)
+
+
+def test_streamed_query_excludes_client_time_from_timeout() -> None:
+    chunks = []
+
+    def slow_client(chunk, rows_sent, total_count):
+        chunks.append(chunk)
+        time.sleep(0.05)
+
+    result = run_query_model(
+        "blog", "Post", emit_rows=slow_client, chunk_size=1, timeout=0.05
+    )
+
+    assert "error" not in result
+    assert len(chunks) == result["returned_count"] > 1
+
+
+def test_statement_timeout_passes_other_errors_through() -> None:
+    with pytest.raises(Exception, match="no such table"):
+        with read_only_transaction("default"), statement_timeout("default", 5):
+            with connections["default"].cursor() as cursor:
+                cursor.execute("SELECT * FROM missing_table")
+
+
+@pytest.mark.asyncio
+async def test_tools_report_timeouts(monkeypatch) -> None:
+    timeouts = []
+
+    @contextmanager
+    def timing_out(using, timeout):
+        timeouts.append(timeout)
+        yield
+        raise QueryTimeout(timeout, 12.5)
+
+    monkeypatch.delenv("DJANGO_MCP_TIMEOUT", raising=False)
+    monkeypatch.setenv("DJANGO_MCP_TIMEOUT_QUERY_MODEL", "2")
+    monkeypatch.setattr(server_fastmcp, "statement_timeout", timing_out)
+
+    query = await query_model(app_label="blog", model_name="Post")
+    aggregate = await aggregate_model(app_label="blog", model_name="Post")
+    schema = await database_schema()
+
+    assert timeouts == [2, 30, 30]
+    assert query == {
+        "error": "Query timed out after 2s",
+        "timed_out": True,
+        "timeout": 2,
+        "elapsed_ms": 12.5,
+    }
+    assert aggregate["timed_out"] is True
+    assert schema["timed_out"] is True
+
+
+@pytest.mark.asyncio
+async def test_explain_query_timeout_zero_disables_timeout(monkeypatch) -> None:
+    timeouts = []
+
+    @contextmanager
+    def recording(using, timeout):
+        timeouts.append(timeout)
+        yield
+
+    monkeypatch.setattr(server_fastmcp, "statement_timeout", recording)
+
+    result = await explain_query(app_label="blog", model_name="Post", timeout=0)
+
+    assert "error" not in result
+    assert timeouts == [0]
+
+    negative = await explain_query(app_label="blog", model_name="Post", timeout=-1)
+    assert negative == {"error": "timeout must be 0 or greater"}
+
+
+@pytest.mark.asyncio
+async def test_tools_report_elapsed_time() -> None:
+    query = await query_model(app_label="blog", model_name="Post")
+    schema = await database_schema()
+    url = await get_absolute_url(app_label="blog", model_name="Post", pk=1)
+
+    assert query["elapsed_ms"] >= 0
+    assert schema["elapsed_ms"] >= 0
+    assert url["elapsed_ms"] >= 0
+    assert "timed_out" not in query
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+"""Tests for the summarize_logs tool and its streaming aggregation."""
+
+import json
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from django_ai_boost.server_fastmcp import (
+    LOG_SUMMARY_MAX_BUCKETS,
+    LogFormat,
+    normalize_log_message,
+    summarize_log_file,
+    summarize_logs,
+)
+
+VERBOSE_FORMAT = LogFormat.from_config(
+    {"format": "{asctime} [{levelname:<8}] {name}: {message}", "style": "{"}
+)
+LOG_START = datetime(2025, 3, 1, 12, 0, 0)
+
+
+def write_sample_log(log_path: Path, records: int) -> None:
+    """Write one record every 10 seconds, with a traceback on every fifth record."""
+    with log_path.open("w") as log_file:
+        for i in range(records):
+            timestamp = (LOG_START + timedelta(seconds=10 * i)).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+            level = "ERROR" if i % 5 == 0 else "INFO"
+            logger_name = "django.request" if i % 2 == 0 else "myapp.views"
+            log_file.write(
+                f"{timestamp},000 [{level:<8}] {logger_name}: request {i} took {i * 3}ms\n"
+            )
+            if level == "ERROR":
+                log_file.write("Traceback (most recent call last):\n")
+                log_file.write(f"ValueError: failure {i}\n")
+
+
+def test_normalize_log_message() -> None:
+    assert (
+        normalize_log_message(
+            "user 42 loaded 3f2504e0-4f89-11d3-9a0c-0305e82c3301 at 0x7f3a in 1.5s"
+        )
+        == "user <n> loaded <uuid> at <hex> in <n>s"
+    )
+
+
+def test_summarize_log_file_counts(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    write_sample_log(log_path, 30)
+
+    summary = summarize_log_file(log_path, VERBOSE_FORMAT, top_messages=1)
+
+    assert summary["records"] == 30
+    assert summary["continuation_lines"] == 12
+    assert summary["levels"] == {"INFO": 24, "ERROR": 6}
+    assert summary["loggers"] == {"django.request": 15, "myapp.views": 15}
+    assert summary["first_seen"] == LOG_START.isoformat()
+    assert summary["last_seen"] == (LOG_START + timedelta(seconds=290)).isoformat()
+    assert [bucket["total"] for bucket in summary["buckets"]] == [6, 6, 6, 6, 6]
+    assert summary["buckets"][0]["levels"] == {"ERROR": 2, "INFO": 4}
+    assert summary["top_messages"] == [
+        {"level": "INFO", "message": "request <n> took <n>ms", "count": 24}
+    ]
+    assert summary["approximate_counts"] is False
+
+
+def test_summarize_log_file_caps_buckets(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    with log_path.open("w") as log_file:
+        for minute in range(7 * 24 * 60):
+            timestamp = (LOG_START + timedelta(minutes=minute)).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+            log_file.write(f"{timestamp},000 [INFO    ] myapp: tick\n")
+
+    summary = summarize_log_file(log_path, VERBOSE_FORMAT)
+
+    assert len(summary["buckets"]) <= LOG_SUMMARY_MAX_BUCKETS
+    assert summary["bucket_minutes"] == 128
+    assert sum(bucket["total"] for bucket in summary["buckets"]) == 7 * 24 * 60
+    assert len(json.dumps(summary)) < 10_000
+
+
+def test_summarize_log_file_time_window_and_buckets(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    write_sample_log(log_path, 30)
+
+    summary = summarize_log_file(
+        log_path,
+        VERBOSE_FORMAT,
+        since=LOG_START + timedelta(minutes=1),
+        until=LOG_START + timedelta(minutes=3),
+        bucket_minutes=5,
+    )
+
+    assert summary["records"] == 13
+    assert summary["first_seen"] == (LOG_START + timedelta(minutes=1)).isoformat()
+    assert summary["last_seen"] == (LOG_START + timedelta(minutes=3)).isoformat()
+    assert len(summary["buckets"]) == 1
+    assert summary["buckets"][0]["start"] == LOG_START.isoformat()
+
+
+def test_summarize_log_file_json_lines(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.jsonl"
+    with log_path.open("w") as log_file:
+        for i in range(4):
+            record = {
+                "timestamp": (LOG_START + timedelta(seconds=i)).isoformat(),
+                "level": "WARNING" if i % 2 else "INFO",
+                "logger": "myapp.tasks",
+                "message": f"task {i} retried",
+            }
+            log_file.write(json.dumps(record) + "\n")
+
+    log_format = VERBOSE_FORMAT.detect_json_lines(log_path)
+    summary = summarize_log_file(log_path, log_format)
+
+    assert log_format.json_lines is True
+    assert summary["records"] == 4
+    assert summary["levels"] == {"INFO": 2, "WARNING": 2}
+    assert summary["loggers"] == {"myapp.tasks": 4}
+    assert summary["top_messages"][0]["message"] == "task <n> retried"
+
+
+def test_summarize_log_file_bounds_message_counters(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    with log_path.open("w") as log_file:
+        for _ in range(500):
+            log_file.write(
+                f"2025-03-01 12:00:00,000 [INFO    ] myapp: unique message {uuid4().hex[:8]}z\n"
+            )
+        for _ in range(50):
+            log_file.write("2025-03-01 12:00:01,000 [ERROR   ] myapp: disk full\n")
+
+    summary = summarize_log_file(log_path, VERBOSE_FORMAT, top_messages=1)
+
+    assert summary["records"] == 550
+    assert summary["approximate_counts"] is True
+    assert summary["top_messages"] == [
+        {"level": "ERROR", "message": "disk full", "count": 50}
+    ]
+
+
+async def test_summarize_logs_success(
+    flush_root_handlers: Callable[[], None],
+) -> None:
+    logging.getLogger("django_ai_boost.tests").warning(
+        f"summarize_logs_test_{uuid4().hex}"
+    )
+    flush_root_handlers()
+
+    result = await summarize_logs(handler_name="file", top_messages=5)
+
+    assert "error" not in result
+    assert result["handler_filter"] == "file"
+    assert "file" in result["available_handlers"]
+    summary = result["summaries"][0]
+    assert summary["handler"] == "file"
+    assert "error" not in summary
+    assert summary["format"] == "formatter"
+    assert summary["records"] >= 1
+    assert summary["levels"].get("WARNING", 0) >= 1
+    assert len(summary["top_messages"]) <= 5
+
+
+async def test_summarize_logs_invalid_inputs() -> None:
+    result = await summarize_logs(handler_name="missing")
+    assert "not found" in result["error"]
+
+    result = await summarize_logs(bucket_minutes=0)
+    assert "bucket_minutes" in result["error"]
+
+    result = await summarize_logs(top_messages=-1)
+    assert "top_messages" in result["error"]
+
+    result = await summarize_logs(since="yesterday")
+    assert "Invalid timestamp" in result["error"]